@@ -0,0 +1,57 @@
+"""
+Measure garbage collection pauses and teardown latency with long
+`Succ` chains alive.
+
+    python benchmarks/gc_pauses.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+
+from inductive import memory
+from inductive import nat
+
+
+def collection_pause() -> float:  # noqa: D103
+    start = time.perf_counter()
+    gc.collect()
+
+    return time.perf_counter() - start
+
+
+def main() -> None:  # noqa: D103
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--length", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+
+    chain = nat.from_builtin_int_exn(arguments.length)
+
+    pauses = [collection_pause() for _ in range(arguments.repeat)]
+    print(f"gc.collect(), tracked chain: {min(pauses) * 1e3:>8.1f}ms")  # noqa: T201
+
+    memory.freeze()
+    pauses = [collection_pause() for _ in range(arguments.repeat)]
+    memory.unfreeze()
+    print(f"gc.collect(), frozen chain:  {min(pauses) * 1e3:>8.1f}ms")  # noqa: T201
+
+    start = time.perf_counter()
+    del chain
+    teardown = time.perf_counter() - start
+    print(f"teardown, del:               {teardown * 1e3:>8.1f}ms")  # noqa: T201
+
+    chain = nat.from_builtin_int_exn(arguments.length)
+
+    start = time.perf_counter()
+    memory.reclaim(chain)
+    del chain
+    teardown = time.perf_counter() - start
+    memory.wait_reclaimed()
+    print(f"teardown, reclaim:           {teardown * 1e3:>8.1f}ms")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+Measure the cold import time of `inductive` and its submodules.
+
+Each module is imported in a fresh interpreter started with
+`-X importtime`, and the cumulative time reported for it is
+parsed from the output. The best of several runs is kept.
+
+    python benchmarks/import_time.py inductive inductive.nat --budget-ms 50
+
+The exit status is 1 if any module exceeds the budget.
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import subprocess
+import sys
+
+_IMPORTTIME_LINE = re.compile(
+    r"^import time:\s+(?P<self>\d+)\s+\|\s+(?P<cumulative>\d+)\s+\|(?P<name>.*)$",
+)
+
+
+def measure(module: str) -> int:
+    """
+    Return the cumulative import time of `module`, in
+    microseconds, in a fresh interpreter.
+    """
+
+    process = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    for line in process.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+
+        if match is not None and match["name"].strip() == module:
+            return int(match["cumulative"])
+
+    message = f"{module} does not appear in the -X importtime output"
+    raise RuntimeError(message)
+
+
+def main() -> int:  # noqa: D103
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("modules", nargs="*", default=["inductive"])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=None)
+    arguments = parser.parse_args()
+
+    over_budget = False
+
+    for module in arguments.modules:
+        best = min(measure(module) for _ in range(arguments.runs)) / 1000
+        status = ""
+
+        if arguments.budget_ms is not None and best > arguments.budget_ms:
+            over_budget = True
+            status = f"  (over budget of {arguments.budget_ms} ms)"
+
+        print(f"{module:<24} {best:8.2f} ms{status}")  # noqa: T201
+
+    return 1 if over_budget else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,102 @@
+"""
+Measure how `Nat` workloads scale from 1 to N threads.
+
+The same total amount of work is split between the threads, and
+the throughput of each configuration is reported along with the
+speedup over a single thread. On a free-threaded build, with the
+GIL disabled, the speedup should grow with the number of threads.
+
+    python benchmarks/threads.py --threads 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import sys
+import sysconfig
+import time
+
+from inductive import nat
+from inductive.nat import primes
+
+# shared by every thread, so that they hit the same cache entries
+OPERANDS = [nat.by_ramp(k) for k in range(1, 33)]
+
+
+def unary(count: int) -> None:  # noqa: D103
+    for k in range(count):
+        n = nat.by_ramp(k % 32)
+        _ = (n + nat.ten) * nat.three // nat.two
+
+
+def packed(count: int) -> None:  # noqa: D103
+    for k in range(count):
+        primes.is_prime(nat.from_builtin_int_packed_exn(k))
+
+
+def cached(count: int) -> None:  # noqa: D103
+    for k in range(count):
+        _ = OPERANDS[k % 32] * nat.ten
+
+
+def throughput(workload: str, threads: int, total: int) -> float:
+    """
+    Run `total` iterations of `workload` split between `threads`
+    threads, and return the number of iterations per second.
+    """
+
+    function = globals()[workload]
+    start = time.perf_counter()
+
+    with concurrent.futures.ThreadPoolExecutor(threads) as executor:
+        for future in [
+            executor.submit(function, total // threads) for _ in range(threads)
+        ]:
+            future.result()
+
+    return total / (time.perf_counter() - start)
+
+
+def interpreter() -> str:
+    """
+    Describe whether the interpreter runs with a GIL.
+    """
+
+    if not sysconfig.get_config_var("Py_GIL_DISABLED"):
+        return "standard"
+
+    # `sys._is_gil_enabled` only exists on 3.13 and later
+    if sys._is_gil_enabled():  # noqa: SLF001  # pyright: ignore[reportAttributeAccessIssue]
+        return "free-threaded, GIL enabled"
+
+    return "free-threaded"
+
+
+def main() -> None:  # noqa: D103
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--total", type=int, default=40_000)
+    arguments = parser.parse_args()
+
+    print(f"{sys.version.split()[0]} ({interpreter()})")  # noqa: T201
+    print(f"{'workload':<10} {'threads':>7} {'ops/s':>12} {'speedup':>8}")  # noqa: T201
+
+    for workload in ("unary", "packed", "cached"):
+        with nat.operator_cache(None if workload != "cached" else 1024):
+            # the first run warms the caches up
+            throughput(workload, 1, arguments.total)
+            baseline = throughput(workload, 1, arguments.total)
+            threads = 1
+
+            while threads <= arguments.threads:
+                result = throughput(workload, threads, arguments.total)
+                print(  # noqa: T201
+                    f"{workload:<10} {threads:>7} {result:>12,.0f}"
+                    f" {result / baseline:>7.2f}x",
+                )
+                threads *= 2
+
+
+if __name__ == "__main__":
+    main()
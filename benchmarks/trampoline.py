@@ -0,0 +1,84 @@
+"""
+Compare trampolined recursion with native recursion on unary
+numbers.
+
+    python benchmarks/trampoline.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+import typing
+
+from inductive import config
+from inductive import nat
+from inductive import recursion
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import collections.abc
+
+
+def native_length(n: nat.Nat) -> int:  # noqa: D103
+    match n:
+        case nat.Zero():
+            return 0
+        case nat.Succ(m):
+            return 1 + native_length(m)
+
+
+@recursion.trampoline
+def trampolined_length(  # noqa: D103
+    n: nat.Nat,
+) -> collections.abc.Generator[object, int, int]:
+    match n:
+        case nat.Zero():
+            return 0
+        case nat.Succ(m):
+            return 1 + (yield trampolined_length(m))
+
+
+def main() -> None:  # noqa: D103
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+
+    print(f"{'depth':>8} {'native':>10} {'trampoline':>12} {'overhead':>9}")  # noqa: T201
+
+    with config.context():
+        for depth in (10, 100, 1_000, 10_000, 100_000):
+            n = nat.from_builtin_int_exn(depth)
+            timings: list[float | None] = []
+
+            for function in (native_length, trampolined_length):
+                try:
+                    seconds = min(
+                        timeit.repeat(
+                            lambda function=function, n=n: function(n),
+                            number=arguments.number,
+                            repeat=arguments.repeat,
+                        ),
+                    )
+                except RecursionError:
+                    timings.append(None)
+                else:
+                    timings.append(seconds / arguments.number * 1e6)
+
+            match timings:
+                case [float() as native, float() as trampolined]:
+                    overhead = f"{trampolined / native:>8.1f}x"
+                    native_column = f"{native:>8.0f}us"
+                case [_, float() as trampolined]:
+                    overhead = f"{'-':>9}"
+                    native_column = f"{'overflow':>10}"
+                case _:  # pragma: no cover
+                    raise AssertionError
+
+            print(  # noqa: T201
+                f"{depth:>8} {native_column} {trampolined:>10.0f}us {overhead}",
+            )
+
+
+if __name__ == "__main__":
+    main()
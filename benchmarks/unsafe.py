@@ -0,0 +1,94 @@
+"""
+Compare the `Option`-returning functions of `nat` with their
+unchecked counterparts in `nat.unsafe`.
+
+    python benchmarks/unsafe.py
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+import option
+
+from inductive import nat
+from inductive.nat import unsafe
+
+
+def checked_from_int(value: int) -> nat.Nat:  # noqa: D103
+    match nat.from_builtin_int(value):
+        case option.Nothing():
+            raise AssertionError
+        case option.Some(result):
+            return result
+
+
+def checked_divmod(n: nat.Nat, m: nat.Nat) -> tuple[nat.Nat, nat.Nat]:  # noqa: D103
+    match divmod(n, m):
+        case option.Nothing():
+            raise AssertionError
+        case option.Some(result):
+            return result
+
+
+def checked_div(n: nat.Nat, m: nat.Nat) -> nat.Nat:  # noqa: D103
+    match n / m:
+        case option.Nothing():
+            raise AssertionError
+        case option.Some(result):
+            return result
+
+
+def main() -> None:  # noqa: D103
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--number", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+
+    n, m = nat.from_builtin_int_exn(23), nat.from_builtin_int_exn(5)
+    packed_n, packed_m = nat.pack(n), nat.pack(m)
+
+    cases = {
+        "from_builtin_int(3)": (
+            lambda: checked_from_int(3),
+            lambda: unsafe.from_int_unchecked(3),
+        ),
+        "divmod(23, 5)": (
+            lambda: checked_divmod(n, m),
+            lambda: unsafe.divmod_nonzero(n, m),
+        ),
+        "23 / 5": (
+            lambda: checked_div(n, m),
+            lambda: unsafe.div_nonzero(n, m),
+        ),
+        "divmod(23, 5), packed": (
+            lambda: checked_divmod(packed_n, packed_m),
+            lambda: unsafe.divmod_nonzero(packed_n, packed_m),
+        ),
+    }
+
+    print(f"{'operation':<24} {'checked':>10} {'unsafe':>10} {'saving':>8}")  # noqa: T201
+
+    for name, (checked, unchecked) in cases.items():
+        timings = [
+            min(
+                timeit.repeat(
+                    function,
+                    number=arguments.number,
+                    repeat=arguments.repeat,
+                ),
+            )
+            / arguments.number
+            * 1e9
+            for function in (checked, unchecked)
+        ]
+        saving = 1 - timings[1] / timings[0]
+
+        print(  # noqa: T201
+            f"{name:<24} {timings[0]:>8.0f}ns {timings[1]:>8.0f}ns {saving:>8.1%}",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -6,12 +6,63 @@
 such as Peano numbers and linked lists.
 
 It is recommended to call the `setup()` function before usage.
+
+Submodules are only imported when they are first accessed, so
+that importing `inductive` stays cheap.
 """
 
-from . import builtins
-from . import nat
-from .config import context
-from .config import setup
-from .config import teardown
+import importlib
+
+# `typing` itself is costly to import, and it is not needed at runtime
+TYPE_CHECKING = False
+
+if TYPE_CHECKING:  # pragma: no cover
+    from . import builtins
+    from . import nat
+    from .config import context
+    from .config import setup
+    from .config import teardown
 
 __all__ = ["builtins", "context", "nat", "setup", "teardown"]
+
+_SUBMODULES = frozenset(
+    {
+        "builtins",
+        "compare",
+        "config",
+        "fin",
+        "io",
+        "memory",
+        "nat",
+        "ordered",
+        "parallel",
+        "recursion",
+        "testing",
+        "vector",
+    }
+)
+
+_REEXPORTS = {
+    "context": "config",
+    "setup": "config",
+    "teardown": "config",
+}
+
+
+def __getattr__(name: str) -> object:
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+
+    if name in _REEXPORTS:
+        module = importlib.import_module(f".{_REEXPORTS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+
+        return value
+
+    message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(message)
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_SUBMODULES, *_REEXPORTS})
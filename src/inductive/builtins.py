@@ -5,9 +5,20 @@ parts of `inductive` that are meant to replace some built-ins.
 
 For example, `length` replaces `len` for containers that aren't
 defined in this library - otherwise, simply use the `.length`
-method.
+method. Likewise, `count` and `index` replace the methods of the
+same name of sequences, strings and bytes, `sum` sums `Nat`s and
+`abs` takes the absolute value of an `int`.
+
+They all return compact numbers, so they cost about the same as
+the built-ins they replace.
 """
 
+from .nat import abs_of as abs  # noqa: A004
+from .nat import count_of as count
+from .nat import enumerate  # noqa: A004
+from .nat import index_of as index
 from .nat import length_of as length
+from .nat import range  # noqa: A004
+from .nat import sum_of as sum  # noqa: A004
 
-__all__ = ["length"]
+__all__ = ["abs", "count", "enumerate", "index", "length", "range", "sum"]
@@ -5,31 +5,53 @@ Utilitaries to configure the `inductive` library.
 from __future__ import annotations
 
 import sys
+import threading
 
 __ORIGINAL_RECURSION_LIMIT = sys.getrecursionlimit()
 
+# the configuration is process-wide, so concurrent `setup` calls
+# are counted and only the last `teardown` restores it
+__lock = threading.Lock()
+__depth = 0
+
 
 def setup() -> None:
     """
     Modify the Python configuration to fit best the needs of
     this library.
 
+    It is safe to call from several threads: the configuration
+    stays modified until every call is matched by `teardown`.
+
     ⚠️ This alters values like the recursion limit. Use with
     extreme caution!
     """
 
-    sys.setrecursionlimit(0x8000)
+    global __depth  # noqa: PLW0603
+
+    with __lock:
+        if __depth == 0:
+            sys.setrecursionlimit(0x8000)
+
+        __depth += 1
 
 
 def teardown() -> None:
     """
     Restore the Python configuration to the state it was before
-    `setup` was called.
+    the first `setup` was called, once every `setup` call is
+    matched.
 
     ⚠️ This OVERRIDES every change that happened in between!
     """
 
-    sys.setrecursionlimit(__ORIGINAL_RECURSION_LIMIT)
+    global __depth  # noqa: PLW0603
+
+    with __lock:
+        __depth = max(__depth - 1, 0)
+
+        if __depth == 0:
+            sys.setrecursionlimit(__ORIGINAL_RECURSION_LIMIT)
 
 
 class _InductiveContext:
@@ -0,0 +1,135 @@
+"""
+# fin
+
+Bounded natural numbers.
+
+`Fin[N]` is the type of the natural numbers strictly less than
+`N`, as in Rocq. It is meant for indices into fixed-size tables
+and for modular counters: its arithmetic wraps around `N`.
+
+Values are stored as built-in `int`s, so every operation is O(1)
+whatever the bound. They convert from and to `Nat`.
+"""
+
+from __future__ import annotations
+
+import typing
+
+import attrs
+import option
+
+from inductive import compare
+from inductive import nat
+
+
+@attrs.frozen
+class Fin[N: nat.Nat]:
+    """
+    A natural number strictly less than its bound `N`.
+
+    `+`, `-` and `*` are computed modulo the bound, and both
+    operands must have the same bound.
+
+    Use `Fin.of` or `Fin.wrap` to construct one.
+    """
+
+    _value: int
+    _bound: int
+
+    def __attrs_post_init__(self) -> None:
+        if not 0 <= self._value < self._bound:
+            message = "value must be less than the bound"
+            raise ValueError(message)
+
+    @classmethod
+    def of(cls, value: nat.Nat, bound: N) -> option.Option[Fin[N]]:
+        """
+        Return `value` as a `Fin[N]`, or `Nothing` if it is not
+        less than `bound`.
+        """
+
+        value_int, bound_int = nat.to_builtin_int(value), nat.to_builtin_int(bound)
+
+        if value_int >= bound_int:
+            return option.Nothing()
+
+        return option.Some(cls(value_int, bound_int))
+
+    @classmethod
+    def wrap(cls, value: nat.Nat, bound: N) -> option.Option[Fin[N]]:
+        """
+        Return `value` modulo `bound` as a `Fin[N]`, or `Nothing`
+        if `bound` is zero.
+        """
+
+        bound_int = nat.to_builtin_int(bound)
+
+        if bound_int == 0:
+            return option.Nothing()
+
+        return option.Some(cls(nat.to_builtin_int(value) % bound_int, bound_int))
+
+    # *- Arithmetic -* #
+
+    def __add__(self, other: Fin[N], /) -> Fin[N]:
+        return Fin((self._value + self._check(other)) % self._bound, self._bound)
+
+    def __sub__(self, other: Fin[N], /) -> Fin[N]:
+        return Fin((self._value - self._check(other)) % self._bound, self._bound)
+
+    def __mul__(self, other: Fin[N], /) -> Fin[N]:
+        return Fin((self._value * self._check(other)) % self._bound, self._bound)
+
+    def __neg__(self) -> Fin[N]:
+        return Fin(-self._value % self._bound, self._bound)
+
+    # *- Type conversion -* #
+
+    def __int__(self) -> int:
+        return self._value
+
+    def __index__(self) -> int:
+        return self._value
+
+    def __str__(self) -> str:
+        return str(self._value)
+
+    # *- Protocols -* #
+
+    def compare(self, other: Fin[N], /) -> compare.Compare:
+        """
+        Compare with another number of the same bound.
+        """
+
+        value = self._check(other)
+
+        if self._value < value:
+            return compare.LESS
+
+        if self._value > value:
+            return compare.GREATER
+
+        return compare.EQUAL
+
+    # *- Methods -* #
+
+    def to_nat(self) -> nat.Nat:
+        """
+        Return the number as a `Nat`.
+        """
+
+        return nat.from_builtin_int_packed_exn(self._value)
+
+    def bound(self) -> N:
+        """
+        Return the bound of the number as a `Nat`.
+        """
+
+        return typing.cast("N", nat.from_builtin_int_packed_exn(self._bound))
+
+    def _check(self, other: Fin[N]) -> int:
+        if other._bound != self._bound:  # noqa: SLF001
+            message = "both numbers must have the same bound"
+            raise ValueError(message)
+
+        return other._value  # noqa: SLF001
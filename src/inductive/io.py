@@ -0,0 +1,187 @@
+# noqa: A005
+"""
+# io
+
+On-disk columns of natural numbers.
+
+`write_column` stores numbers in a compact fixed-width binary
+format, and `open_column` maps such a file in memory as a
+read-only sequence that only builds a `Nat` when an element is
+accessed. Opening a column is O(1) whatever its length.
+
+The format is a 16-byte header - the magic `INAT`, a version
+byte, the width in bytes of each value, two reserved bytes and
+the number of values as a little-endian 64-bit integer - followed
+by the values as little-endian unsigned integers.
+"""
+
+from __future__ import annotations
+
+import collections.abc
+import mmap
+import struct
+import sys
+import typing
+
+from inductive import nat
+from inductive.nat import unsafe
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import os
+
+_MAGIC: typing.Final = b"INAT"
+_VERSION: typing.Final = 1
+_HEADER: typing.Final = struct.Struct("<4sBBxxQ")
+
+# `memoryview.cast` formats of the widths it supports natively
+_FORMATS: typing.Final[dict[int, typing.Literal["B", "H", "I", "Q"]]] = {
+    1: "B",
+    2: "H",
+    4: "I",
+    8: "Q",
+}
+
+_CHUNK_SIZE: typing.Final = 1 << 16
+
+
+def write_column(
+    path: str | os.PathLike[str],
+    numbers: collections.abc.Iterable[nat.Nat],
+) -> None:
+    """
+    Write `numbers` to the file at `path`, replacing it if it
+    exists.
+
+    Every value takes as many bytes as the greatest one needs.
+    """
+
+    values = [nat.to_builtin_int(number) for number in numbers]
+    width = max(1, (max(values, default=0).bit_length() + 7) // 8)
+
+    if width > 0xFF:  # noqa: PLR2004
+        message = "numbers must fit in 255 bytes"
+        raise ValueError(message)
+
+    with open(path, "wb") as file:  # noqa: PTH123
+        file.write(_HEADER.pack(_MAGIC, _VERSION, width, len(values)))
+
+        for start in range(0, len(values), _CHUNK_SIZE):
+            file.write(
+                b"".join(
+                    value.to_bytes(width, "little")
+                    for value in values[start : start + _CHUNK_SIZE]
+                ),
+            )
+
+
+class Column(collections.abc.Sequence[nat.Nat]):
+    """
+    A read-only, memory-mapped column of natural numbers.
+
+    Elements are decoded when they are accessed, as `Packed`
+    numbers. It must be closed after use, for example by using
+    it as a context manager.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        with open(path, "rb") as file:  # noqa: PTH123
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, width, count = _HEADER.unpack_from(self._map)
+        except struct.error:
+            self._map.close()
+            message = f"{path} is not a column file"
+            raise ValueError(message) from None
+
+        if magic != _MAGIC or version != _VERSION:
+            self._map.close()
+            message = f"{path} is not a column file of version {_VERSION}"
+            raise ValueError(message)
+
+        if len(self._map) < _HEADER.size + count * width:
+            self._map.close()
+            message = f"{path} is truncated"
+            raise ValueError(message)
+
+        self._width: int = width
+        self._count: int = count
+
+    def __enter__(self) -> typing.Self:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    @typing.overload
+    def __getitem__(self, index: int) -> nat.Nat: ...
+    @typing.overload
+    def __getitem__(self, index: slice) -> list[nat.Nat]: ...
+
+    def __getitem__(self, index: int | slice) -> nat.Nat | list[nat.Nat]:
+        if isinstance(index, slice):
+            positions = range(*index.indices(self._count))
+
+            return [self[position] for position in positions]
+
+        if index < 0:
+            index += self._count
+
+        if not 0 <= index < self._count:
+            message = "column index out of range"
+            raise IndexError(message)
+
+        return unsafe.from_int_packed_unchecked(self._int_at(index))
+
+    def length(self) -> nat.Nat:
+        """
+        Return the number of elements of the column.
+        """
+
+        return nat.from_builtin_int_packed_exn(self._count)
+
+    def ints(self) -> collections.abc.Sequence[int]:
+        """
+        Return the values of the column as built-in `int`s.
+
+        When the width of the values allows it, this is a
+        zero-copy view of the file, which must be released before
+        the column is closed.
+        """
+
+        if self._width in _FORMATS and sys.byteorder == "little":
+            view = memoryview(self._map)[
+                _HEADER.size : _HEADER.size + self._count * self._width
+            ]
+
+            return view.cast(_FORMATS[self._width])
+
+        return [self._int_at(position) for position in range(self._count)]
+
+    def close(self) -> None:
+        """
+        Unmap the file.
+        """
+
+        self._map.close()
+
+    def _int_at(self, index: int) -> int:
+        offset = _HEADER.size + index * self._width
+
+        return int.from_bytes(self._map[offset : offset + self._width], "little")
+
+
+def open_column(path: str | os.PathLike[str]) -> Column:
+    """
+    Map the column file at `path` in memory.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a valid column file.
+    """
+
+    return Column(path)
@@ -0,0 +1,264 @@
+"""
+# memory
+
+Memory accounting for natural numbers and other structures.
+
+`sys.getsizeof` only reports the size of a single object, which
+for a `Succ` is one node out of the whole chain. `footprint`
+walks a structure instead, and `census` summarizes every number
+alive in the process.
+
+Long chains are also costly for the garbage collector, which
+scans every node, and to free, which is done all at once. `freeze`
+hides the objects alive from the collector, and `reclaim` frees a
+number in the background, a batch of nodes at a time.
+"""
+
+from __future__ import annotations
+
+import collections
+import gc
+import queue
+import sys
+import threading
+import time
+import types
+import typing
+
+import attrs
+
+from inductive import nat
+
+# These are reachable from almost anything but are not part of a
+# data structure.
+_OPAQUE: tuple[type, ...] = (
+    type,
+    types.ModuleType,
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    types.CodeType,
+)
+
+
+@attrs.frozen
+class Footprint:
+    """
+    The memory used by a structure.
+    """
+
+    nodes: int
+    """Number of distinct objects reachable from the structure."""
+
+    shared: int
+    """Number of those objects that are reachable more than once."""
+
+    size: int
+    """Total size in bytes of the distinct objects."""
+
+
+@attrs.frozen
+class Census:
+    """
+    The natural numbers alive in the process.
+    """
+
+    zeros: int
+    """Number of `Zero` objects."""
+
+    succs: int
+    """Number of plain `Succ` nodes."""
+
+    packed: int
+    """Number of `Packed` numbers."""
+
+    runs: int
+    """Number of `Run` numbers, whatever their number of layers."""
+
+    size: int
+    """Total size in bytes of those objects, including the ints
+    backing `Packed` numbers and counting the layers of `Run`s."""
+
+
+def footprint(obj: object) -> Footprint:
+    """
+    Walk everything reachable from `obj` and report its memory
+    usage.
+
+    The walk is iterative, so it works with numbers of any size,
+    and each object is only counted once: objects reachable
+    through several paths are reported as shared. Classes,
+    modules and functions are not counted.
+
+    `Packed` numbers are not unfolded: only the `int` backing them
+    is counted.
+    """
+
+    seen: set[int] = set()
+    shared: set[int] = set()
+    size = 0
+    stack = [obj]
+
+    while stack:
+        current = stack.pop()
+        identity = id(current)
+
+        if identity in seen:
+            shared.add(identity)
+            continue
+
+        seen.add(identity)
+        size += sys.getsizeof(current)
+
+        stack.extend(
+            referent
+            for referent in gc.get_referents(current)
+            if not isinstance(referent, _OPAQUE)
+        )
+
+    return Footprint(len(seen), len(shared), size)
+
+
+def census() -> Census:
+    """
+    Count the natural numbers that are alive in the process, and
+    the memory they use.
+
+    This looks at every object tracked by the garbage collector,
+    so it is meant for diagnostics rather than hot paths.
+    """
+
+    zeros = succs = packed = runs = size = 0
+
+    for obj in gc.get_objects():
+        match obj:
+            case nat.Packed():
+                packed += 1
+                size += sys.getsizeof(obj) + sys.getsizeof(int(obj))
+            case nat.Run():
+                runs += 1
+                size += sys.getsizeof(obj) + sys.getsizeof(obj._layers)  # noqa: SLF001
+            case nat.Succ():
+                succs += 1
+                size += sys.getsizeof(obj)
+            case nat.Zero():
+                zeros += 1
+                size += sys.getsizeof(obj)
+            case _:
+                pass
+
+    return Census(zeros, succs, packed, runs, size)
+
+
+# *- Garbage collection -* #
+
+
+def freeze() -> None:
+    """
+    Move every object tracked by the garbage collector, including
+    the `Succ` nodes alive, to a permanent generation that is not
+    scanned by collections.
+
+    `Succ` nodes cannot form cycles, but pure Python objects cannot
+    be untracked one by one, so this is meant to be called once the
+    long-lived numbers of a program are built.
+    """
+
+    gc.freeze()
+
+
+def unfreeze() -> None:
+    """
+    Move the objects frozen by `freeze` back to the oldest
+    generation.
+    """
+
+    gc.unfreeze()
+
+
+_DEFAULT_BATCH_SIZE: typing.Final = 10_000
+
+_reclaimed: queue.Queue[tuple[nat.Nat, int]] = queue.Queue()
+_reclaimer_lock = threading.Lock()
+_reclaimer: threading.Thread | None = None
+
+
+def _anchors(n: nat.Nat, batch_size: int) -> collections.deque[nat.Nat]:
+    # a reference every `batch_size` nodes, from the top: dropping
+    # them in order frees exactly one batch at a time; `Packed` and
+    # `Run` numbers are not unfolded, as their predecessors are built
+    # on demand
+    anchors: collections.deque[nat.Nat] = collections.deque()
+    current, index = n, 0
+
+    while type(current) is nat.Succ:
+        if index % batch_size == 0:
+            anchors.append(current)
+
+        current, index = current.predecessor, index + 1
+
+    return anchors
+
+
+def _reclaim_all() -> None:
+    global _reclaimer  # noqa: PLW0603
+
+    while True:
+        # the thread stops when there is nothing left to free, so
+        # that it does not outlive its work (and e.g. a `fork`)
+        with _reclaimer_lock:
+            if _reclaimed.empty():
+                _reclaimer = None
+                return
+
+            n, batch_size = _reclaimed.get()
+
+        anchors = _anchors(n, batch_size)
+        del n
+
+        while anchors:
+            anchors.popleft()
+            # let other threads run between batches
+            time.sleep(0)
+
+        _reclaimed.task_done()
+
+
+def reclaim(n: nat.Nat, *, batch_size: int = _DEFAULT_BATCH_SIZE) -> None:
+    """
+    Free `n` in a background thread, `batch_size` nodes at a time,
+    instead of all at once when its last reference is dropped.
+
+    The caller must drop its own references to `n` after the call:
+    nodes that are still referenced elsewhere are not freed.
+
+    Raises
+    ------
+    ValueError
+        If `batch_size` is not positive.
+    """
+
+    global _reclaimer  # noqa: PLW0603
+
+    if batch_size <= 0:
+        message = "batch size must be positive"
+        raise ValueError(message)
+
+    with _reclaimer_lock:
+        _reclaimed.put((n, batch_size))
+
+        if _reclaimer is None:
+            _reclaimer = threading.Thread(
+                target=_reclaim_all,
+                name="inductive-reclaimer",
+                daemon=True,
+            )
+            _reclaimer.start()
+
+
+def wait_reclaimed() -> None:
+    """
+    Block until every number passed to `reclaim` is freed.
+    """
+
+    _reclaimed.join()
@@ -0,0 +1,2559 @@
+"""
+# nat
+
+WARNING: It is advised NOT to use this module for computing large numbers.
+Also, raising the maximum recursion limit is recommended.
+
+Inductive definition of natural numbers, following Peano axioms.
+
+Basic arithmetic operators are defined using the built-in
+operators, with the following nuance: `/` is considered as the
+"strict" division (returns an `Option`) whereas `//` is similar
+to Rocq, that is, n // 0 = 0. The modulo operator (`%`) is based
+on the latter.
+"""
+# ruff: noqa: PLR0904
+
+from __future__ import annotations
+
+import builtins
+import collections
+import collections.abc
+import functools
+import importlib
+import numbers
+import operator
+import threading
+import typing
+
+import attrs
+import option
+
+from inductive import compare
+
+# *- Operator cache -* #
+
+
+@attrs.frozen
+class CacheInfo:
+    """
+    Statistics of the operator cache.
+    """
+
+    hits: int
+    misses: int
+    size: int
+    capacity: int
+
+
+# the cache is split in stripes of at least this many entries, up
+# to `_MAX_STRIPES`, so that threads rarely wait for each other
+_STRIPE_CAPACITY: typing.Final = 64
+_MAX_STRIPES: typing.Final = 16
+
+
+class _Stripe:
+    def __init__(self, capacity: int) -> None:
+        # operands are stored along with the result, so that their
+        # identities are not reused while the entry is alive
+        self.entries: collections.OrderedDict[
+            tuple[str, int, int],
+            tuple[object, object, object],
+        ] = collections.OrderedDict()
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+
+class _OperatorCache:
+    def __init__(self, capacity: int) -> None:
+        count = min(max(capacity // _STRIPE_CAPACITY, 1), _MAX_STRIPES)
+        self.stripes = [
+            _Stripe(capacity // count + (index < capacity % count))
+            for index in builtins.range(count)
+        ]
+        self.capacity = capacity
+        # `busy` is set while a thread computes an entry, so that its
+        # recursive calls do not fill the cache with intermediate
+        # results
+        self.local = threading.local()
+
+
+_operator_cache: _OperatorCache | None = None
+
+
+def _memoize[A, B, R](
+    name: str,
+    function: collections.abc.Callable[[A, B], R],
+    first: A,
+    second: B,
+) -> R:
+    cache = _operator_cache
+
+    if cache is None or getattr(cache.local, "busy", False):
+        return function(first, second)
+
+    key = (name, id(first), id(second))
+    stripe = cache.stripes[hash(key) % len(cache.stripes)]
+
+    with stripe.lock:
+        entry = stripe.entries.get(key)
+
+        if entry is not None:
+            stripe.entries.move_to_end(key)
+            stripe.hits += 1
+            return typing.cast("R", entry[2])
+
+        stripe.misses += 1
+
+    cache.local.busy = True
+
+    try:
+        result = function(first, second)
+    finally:
+        cache.local.busy = False
+
+    with stripe.lock:
+        stripe.entries[key] = (first, second, result)
+
+        if len(stripe.entries) > stripe.capacity:
+            stripe.entries.popitem(last=False)
+
+    return result
+
+
+def _cached[S, T, R](
+    method: collections.abc.Callable[[S, T], R],
+) -> collections.abc.Callable[[S, T], R]:
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self: S, other: T, /) -> R:
+        return _memoize(name, method, self, other)
+
+    return wrapper
+
+
+def enable_operator_cache(capacity: int = 1024) -> None:
+    """
+    Memoize the results of `+`, `*`, `divmod` (and thus `/`, `//`
+    and `%`) and `compare` on unary numbers, keeping the last
+    `capacity` ones. The previous cache is discarded.
+
+    Operands are compared by identity, so a hit is only possible
+    when the very same objects are used again. Packed numbers are
+    not cached, as their operations are already O(1).
+
+    The cache is safe to use from several threads. Large caches
+    are split in independently locked stripes, and the least
+    recently used entry of a stripe is evicted first.
+
+    Raises
+    ------
+    ValueError
+        If `capacity` is not positive.
+    """
+
+    global _operator_cache  # noqa: PLW0603
+
+    if capacity <= 0:
+        message = "capacity must be positive"
+        raise ValueError(message)
+
+    _operator_cache = _OperatorCache(capacity)
+
+
+def disable_operator_cache() -> None:
+    """
+    Stop memoizing operators and discard the cache.
+    """
+
+    global _operator_cache  # noqa: PLW0603
+
+    _operator_cache = None
+
+
+def operator_cache_info() -> option.Option[CacheInfo]:
+    """
+    Return the statistics of the operator cache, or `Nothing` if
+    it is disabled.
+    """
+
+    cache = _operator_cache
+
+    if cache is None:
+        return option.Nothing()
+
+    hits = misses = size = 0
+
+    for stripe in cache.stripes:
+        with stripe.lock:
+            hits += stripe.hits
+            misses += stripe.misses
+            size += len(stripe.entries)
+
+    return option.Some(CacheInfo(hits, misses, size, cache.capacity))
+
+
+class _OperatorCacheContext:
+    def __init__(self, capacity: int | None) -> None:
+        self._capacity = capacity
+        self._previous: _OperatorCache | None = None
+
+    def __enter__(self) -> None:
+        self._previous = _operator_cache
+
+        if self._capacity is None:
+            disable_operator_cache()
+        else:
+            enable_operator_cache(self._capacity)
+
+    def __exit__(self, *_: object) -> None:
+        global _operator_cache  # noqa: PLW0603
+
+        _operator_cache = self._previous
+
+
+def operator_cache(capacity: int | None = 1024) -> _OperatorCacheContext:
+    """
+    Context manager that enables a fresh operator cache, or
+    disables it if `capacity` is `None`, and restores the previous
+    one on exit.
+    """
+
+    return _OperatorCacheContext(capacity)
+
+
+@attrs.frozen
+@typing.final
+class Zero:
+    """
+    `Zero` represents the number 0.
+
+    It is a singleton: `Zero()` always returns the same object.
+    """
+
+    # the number of `Succ` nodes above it, see `Succ`
+    _size: typing.ClassVar[int] = 0
+
+    def __new__(cls) -> typing.Self:
+        # `_zero` is only missing while it is being created
+        try:
+            return _zero  # pyright: ignore[reportReturnType]
+        except NameError:
+            return super().__new__(cls)
+
+    # *- Comparison -* #
+    # equality is handled by attrs
+
+    def __hash__(self) -> int:
+        return hash(0)
+
+    def __gt__(self, other: Nat, /) -> typing.Literal[False]:
+        return False
+
+    def __ge__(self, other: Nat, /) -> bool:
+        match other:
+            case Zero():
+                return True
+            case Succ():
+                return False
+
+    def __lt__(self, other: Nat, /) -> bool:
+        match other:
+            case Zero():
+                return False
+            case Succ():
+                return True
+
+    def __le__(self, other: Nat, /) -> typing.Literal[True]:
+        return True
+
+    # *- Arithmetic -* #
+
+    def __add__[N: Nat](self, other: N, /) -> N:
+        return other
+
+    def __radd__[N: Nat](self, other: N, /) -> N:  # pragma: no cover
+        return other
+
+    def __sub__(self, other: Nat, /) -> Zero:
+        return self
+
+    def __rsub__[N: Nat](self, other: N, /) -> N:  # pragma: no cover
+        return other
+
+    def __mul__(self, other: Nat, /) -> Zero:
+        return self
+
+    def __rmul__(self, other: Nat, /) -> Zero:  # pragma: no cover
+        return self
+
+    # We implement divmod for completeness
+    def __divmod__(self, other: Nat, /) -> option.Option[tuple[Zero, Zero]]:
+        match other:
+            case Zero():
+                return option.Nothing()
+            case Succ():
+                return option.Some((Zero(), Zero()))
+
+    def __truediv__(self, other: Nat, /) -> option.Option[Zero]:
+        match other:
+            case Zero():
+                return option.Nothing()
+            case Succ():
+                return option.Some(self)
+
+    def __rtruediv__(self, other: Nat, /) -> option.Nothing:  # pragma: no cover
+        return option.Nothing()
+
+    def __floordiv__(self, other: Nat, /) -> Zero:
+        return self
+
+    def __rfloordiv__(self, other: Nat, /) -> Zero:  # pragma: no cover
+        return self
+
+    def __mod__(self, other: Nat, /) -> Zero:
+        return self
+
+    def __rmod__(self, other: Nat, /) -> Zero:  # pragma: no cover
+        return self
+
+    # *- Type conversion -* #
+
+    def __abs__(self) -> typing.Self:
+        return self
+
+    def __bool__(self) -> typing.Literal[False]:
+        return False
+
+    def __complex__(self) -> complex:
+        return 0j
+
+    def __float__(self) -> float:
+        return 0.0
+
+    def __int__(self) -> int:
+        return 0
+
+    def __index__(self) -> int:
+        return 0
+
+    def __round__(self, ndigits: int | None = None) -> typing.Self:
+        return self
+
+    def __trunc__(self) -> typing.Self:
+        return self
+
+    def __floor__(self) -> typing.Self:
+        return self
+
+    def __ceil__(self) -> typing.Self:
+        return self
+
+    # the attributes of `numbers.Integral`, as built-in `int`s like
+    # those of `int`, so that `fractions.Fraction` can use them
+
+    @property
+    def numerator(self) -> int:
+        """
+        The number itself, as a built-in `int`.
+        """
+
+        return 0
+
+    @property
+    def denominator(self) -> typing.Literal[1]:
+        """
+        Always 1.
+        """
+
+        return 1
+
+    @property
+    def real(self) -> int:
+        """
+        The number itself, as a built-in `int`.
+        """
+
+        return 0
+
+    @property
+    def imag(self) -> typing.Literal[0]:
+        """
+        Always 0.
+        """
+
+        return 0
+
+    def conjugate(self) -> typing.Self:
+        """
+        Return the number itself, as it is real.
+        """
+
+        return self
+
+    def __str__(self) -> str:
+        return "0"
+
+    def __repr__(self) -> str:
+        return "Zero"
+
+    def __bytes__(self) -> bytes:
+        return b""
+
+    # *- Protocols -* #
+
+    def compare(self, other: Nat, /) -> compare.Compare:  # noqa: PLR6301
+        """
+        Compare with another natural number.
+        """
+
+        match other:
+            case Zero():
+                return compare.EQUAL
+            case Succ():
+                return compare.LESS
+
+    # *- Methods -* #
+
+    def clamp(self, left: Nat, right: Nat) -> Nat:  # noqa: PLR6301
+        """
+        Constraint the value between `left` and `right`.
+
+        If the number is already between them, this method does
+        nothing. If it is less than the minimum of the two
+        arguments, it returns that minimum. If it is greater
+        than their maximum, it returns that maximum.
+        """
+
+        return min(left, right)
+
+    def double(self) -> Zero:
+        """
+        Return the double of the number.
+        """
+
+        return self
+
+    def square(self) -> Zero:
+        """
+        Return the number multiplied by itself.
+        """
+
+        return self
+
+    def is_odd(self) -> typing.Literal[False]:  # noqa: PLR6301
+        """
+        Return whether the number is odd or not.
+        """
+
+        return False
+
+    def is_even(self) -> typing.Literal[True]:  # noqa: PLR6301
+        """
+        Return whether the number is even or not.
+        """
+
+        return True
+
+    def as_integer_ratio(  # noqa: PLR6301
+        self: Nat,
+    ) -> tuple[typing.Literal[0], typing.Literal[1]]:
+        """
+        Return a pair of integers, whose ratio is equal to the original int.
+
+        The ratio is in lowest terms and has a positive denominator.
+        """
+
+        return (0, 1)
+
+
+_zero: typing.Final = Zero()
+
+
+@attrs.frozen
+@typing.final
+class Succ[N: Nat]:
+    """
+    `Succ[N]` represents the next number after `N`.
+
+    Each node stores the value of the number it represents, so
+    converting it to an `int`, hashing it and testing equality
+    are O(1). This costs memory: a node takes 96 bytes instead
+    of 56.
+    """
+
+    predecessor: N
+    _size: int = attrs.field(init=False, eq=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        object.__setattr__(self, "_size", self.predecessor._size + 1)  # noqa: SLF001
+
+    # *- Comparison -* #
+
+    def __eq__(self, other: object, /) -> bool:
+        if not isinstance(other, Zero | Succ):
+            return NotImplemented
+
+        return self._size == other._size  # noqa: SLF001
+
+    def __hash__(self) -> int:
+        # consistent with `Packed`, which hashes like an `int`
+        return hash(self._size)
+
+    def __gt__(self, other: Nat, /) -> bool:
+        match other:
+            case Zero():
+                return True
+            case Succ():
+                return self.predecessor > other.predecessor
+
+    def __ge__(self, other: Nat, /) -> bool:
+        match other:
+            case Zero():
+                return True
+            case Succ():
+                return self.predecessor >= other.predecessor
+
+    def __lt__(self, other: Nat, /) -> bool:
+        match other:
+            case Zero():
+                return False
+            case Succ():
+                return self.predecessor < other.predecessor
+
+    def __le__(self, other: Nat, /) -> bool:
+        match other:
+            case Zero():
+                return False
+            case Succ():
+                return self.predecessor <= other.predecessor
+
+    # *- Arithmetic -* #
+
+    @typing.overload
+    def __add__(self, other: Zero, /) -> typing.Self: ...
+    @typing.overload
+    def __add__(self, other: Succ[Nat], /) -> Nat: ...
+
+    @_cached
+    def __add__(self, other: Nat, /) -> typing.Self | Nat:
+        return self._add(other)
+
+    def _add(self, other: Nat, /) -> typing.Self | Nat:
+        # the recursion stays out of the operator cache
+        match other:
+            case Zero():
+                return self
+            # XXX: Pyright fails to infer the type of that
+            case Succ(predecessor) if type(predecessor) is Succ:
+                return Succ(self)._add(predecessor)  # pyright: ignore[reportArgumentType]
+            case Succ(predecessor):
+                return Succ(self) + predecessor  # pyright: ignore[reportArgumentType, reportUnknownVariableType]
+
+    @typing.overload
+    def __sub__(self, other: Zero, /) -> typing.Self: ...
+    @typing.overload
+    def __sub__(self, other: typing.Self, /) -> Zero: ...
+    @typing.overload
+    def __sub__(self, other: Succ[Nat], /) -> Nat: ...
+
+    def __sub__(self, other: Nat, /) -> typing.Self | Nat:
+        match other:
+            case Zero():
+                return self
+            case Succ():
+                return self.predecessor - other.predecessor
+
+    @typing.overload
+    def __mul__(self, other: Zero, /) -> Zero: ...
+    @typing.overload
+    def __mul__[N0: Nat](self: N0, other: Succ[Zero], /) -> N0: ...
+    @typing.overload
+    def __mul__(self, other: Succ[Nat], /) -> Nat: ...
+
+    @_cached
+    def __mul__(self, other: Nat, /) -> typing.Self | Nat:
+        return self._mul(other)
+
+    def _mul(self, other: Nat, /) -> typing.Self | Nat:
+        match other:
+            case Zero():
+                return Zero()
+            case Succ(predecessor) if type(predecessor) is Succ:
+                return self + self._mul(predecessor)
+            case Succ(predecessor):
+                return self + (self * predecessor)
+
+    def __divmod__(self, other: Nat, /) -> option.Option[tuple[Nat, Nat]]:
+        match other:
+            case Zero():
+                return option.Nothing()
+            case Succ():
+                # XXX: Pyright incorrectly thinks that self is not a Nat
+                return option.Some(_memoize("divmod", _divmod_nonzero, self, other))  # pyright: ignore[reportArgumentType]
+
+    def __truediv__(self, other: Nat, /) -> option.Option[Nat]:
+        match other:
+            case Zero():
+                return option.Nothing()
+            case Succ():
+                quotient, _ = _memoize("divmod", _divmod_nonzero, self, other)  # pyright: ignore[reportArgumentType]
+                return option.Some(quotient)
+
+    def __floordiv__(self, other: Nat, /) -> Nat:
+        match other:
+            case Zero():
+                return Zero()
+            case Succ():
+                quotient, _ = _memoize("divmod", _divmod_nonzero, self, other)  # pyright: ignore[reportArgumentType]
+                return quotient
+
+    def __mod__(self, other: Nat, /) -> Nat:
+        match other:
+            case Zero():
+                return Zero()
+            case Succ():
+                _, remainder = _memoize("divmod", _divmod_nonzero, self, other)  # pyright: ignore[reportArgumentType]
+                return remainder
+
+    # *- Type conversion -* #
+
+    def __abs__(self) -> typing.Self:
+        return self
+
+    def __bool__(self) -> typing.Literal[True]:
+        return True
+
+    def __complex__(self) -> complex:
+        return complex(self._size)
+
+    def __float__(self) -> float:
+        return float(self._size)
+
+    def __int__(self) -> int:
+        return self._size
+
+    def __index__(self) -> int:
+        return self._size
+
+    def __round__(self, ndigits: int | None = None) -> typing.Self | Nat:
+        if ndigits is None or ndigits >= 0:
+            return self
+
+        return _packed(round(self._size, ndigits))
+
+    def __trunc__(self) -> typing.Self:
+        return self
+
+    def __floor__(self) -> typing.Self:
+        return self
+
+    def __ceil__(self) -> typing.Self:
+        return self
+
+    # the attributes of `numbers.Integral`, as built-in `int`s like
+    # those of `int`, so that `fractions.Fraction` can use them
+
+    @property
+    def numerator(self) -> int:
+        """
+        The number itself, as a built-in `int`.
+        """
+
+        return self._size
+
+    @property
+    def denominator(self) -> typing.Literal[1]:
+        """
+        Always 1.
+        """
+
+        return 1
+
+    @property
+    def real(self) -> int:
+        """
+        The number itself, as a built-in `int`.
+        """
+
+        return self._size
+
+    @property
+    def imag(self) -> typing.Literal[0]:
+        """
+        Always 0.
+        """
+
+        return 0
+
+    def conjugate(self) -> typing.Self:
+        """
+        Return the number itself, as it is real.
+        """
+
+        return self
+
+    def __str__(self) -> str:  # noqa: PLR0911
+        if self == one:
+            return "1"
+        if self == two:
+            return "2"
+        if self == three:
+            return "3"
+        if self == four:
+            return "4"
+        if self == five:
+            return "5"
+        if self == six:
+            return "6"
+        if self == seven:
+            return "7"
+        if self == eight:
+            return "8"
+        if self == nine:
+            return "9"
+
+        tens, units = self // ten, self % ten
+
+        return str(tens) + str(units)
+
+    def __repr__(self) -> str:
+        return f"Succ({self.predecessor!r})"
+
+    def __bytes__(self) -> bytes:
+        return b"\x00" + bytes(self.predecessor)  # pyright: ignore[reportArgumentType]
+
+    # *- Protocols -* #
+
+    @_cached
+    def compare(self, other: Nat, /) -> compare.Compare:
+        """
+        Compare with another natural number.
+        """
+
+        return self._compare(other)
+
+    def _compare(self, other: Nat, /) -> compare.Compare:
+        match other:
+            case Zero():
+                return compare.GREATER
+            case Succ(n) if type(self.predecessor) is Succ:
+                return self.predecessor._compare(n)
+            case Succ(n):
+                return self.predecessor.compare(n)
+
+    # *- Methods -* #
+
+    def clamp(self, left: Nat, right: Nat) -> Nat | typing.Self:
+        """
+        Constraint the value between `left` and `right`.
+
+        If the number is already between them, this method does
+        nothing. If it is less than the minimum of the two
+        arguments, it returns that minimum. If it is greater
+        than their maximum, it returns that maximum.
+        """
+
+        minimum, maximum = ascending_pair(left, right)
+
+        if self <= minimum:
+            return minimum
+
+        if self >= maximum:
+            return maximum
+
+        return self
+
+    def double(self) -> Nat:
+        """
+        Return the number added to itself.
+        """
+
+        return self + self
+
+    def square(self) -> Nat:
+        """
+        Return the number multiplied by itself.
+        """
+
+        return self * self
+
+    def is_odd(self) -> bool:
+        """
+        Return whether the number is odd or not.
+        """
+
+        return fold(self, False, operator.not_)  # pyright: ignore[reportArgumentType]
+
+    def is_even(self) -> bool:
+        """
+        Return whether the number is even or not.
+        """
+
+        return fold(self, True, operator.not_)  # pyright: ignore[reportArgumentType]
+
+    def as_integer_ratio(self: Nat) -> tuple[int, typing.Literal[1]]:
+        """
+        Return a pair of integers, whose ratio is equal to the original int.
+
+        The ratio is in lowest terms and has a positive denominator.
+        """
+
+        return (int(self), 1)
+
+
+type Nat = Zero | Succ[Nat]
+
+numbers.Integral.register(Zero)
+numbers.Integral.register(Succ)
+
+
+# Euclidean division of unary numbers, without the `Option` wrapping
+def _divmod_nonzero(n: Nat, m: Succ[Nat]) -> tuple[Nat, Nat]:
+    quotient: Nat = Zero()
+
+    while n >= m:
+        n -= m
+        quotient = Succ(quotient)
+
+    return quotient, n
+
+
+# *- Compact representation -* #
+
+
+@typing.final
+class Packed(Succ[Nat]):  # pyright: ignore[reportGeneralTypeIssues]
+    """
+    `Packed` is a positive number backed by a built-in `int`.
+
+    It is a `Succ` whose predecessor is only built when it is
+    accessed - for example, when it is matched against `Succ(m)` -
+    so arithmetic, comparisons, hashing and conversions run at
+    native `int` speed, and results are packed as well.
+
+    Use `from_builtin_int_packed` or `pack` to construct one.
+    """
+
+    # the value is stored in the `_size` slot of `Succ`
+    __slots__ = ()
+
+    def __init__(self, value: int) -> None:
+        object.__setattr__(self, "_size", value)
+
+    @property
+    def predecessor(self) -> Nat:  # pyright: ignore[reportIncompatibleVariableOverride]
+        """
+        The predecessor of the number, built on demand.
+        """
+
+        return _packed(self._size - 1)
+
+    # *- Comparison -* #
+
+    def __gt__(self, other: Nat, /) -> bool:
+        return self._size > to_builtin_int(other)
+
+    def __ge__(self, other: Nat, /) -> bool:
+        return self._size >= to_builtin_int(other)
+
+    def __lt__(self, other: Nat, /) -> bool:
+        return self._size < to_builtin_int(other)
+
+    def __le__(self, other: Nat, /) -> bool:
+        return self._size <= to_builtin_int(other)
+
+    # *- Arithmetic -* #
+
+    def __add__(self, other: Nat, /) -> Nat:  # pyright: ignore[reportIncompatibleMethodOverride]
+        return _packed(self._size + to_builtin_int(other))
+
+    def __radd__(self, other: Nat, /) -> Nat:
+        return _packed(to_builtin_int(other) + self._size)
+
+    def __sub__(self, other: Nat, /) -> Nat:  # pyright: ignore[reportIncompatibleMethodOverride]
+        return _packed(max(0, self._size - to_builtin_int(other)))
+
+    def __rsub__(self, other: Nat, /) -> Nat:
+        return _packed(max(0, to_builtin_int(other) - self._size))
+
+    def __mul__(self, other: Nat, /) -> Nat:  # pyright: ignore[reportIncompatibleMethodOverride]
+        return _packed(self._size * to_builtin_int(other))
+
+    def __rmul__(self, other: Nat, /) -> Nat:
+        return _packed(to_builtin_int(other) * self._size)
+
+    def __divmod__(self, other: Nat, /) -> option.Option[tuple[Nat, Nat]]:
+        divisor = to_builtin_int(other)
+
+        if divisor == 0:
+            return option.Nothing()
+
+        quotient, remainder = divmod(self._size, divisor)
+
+        return option.Some((_packed(quotient), _packed(remainder)))
+
+    def __rdivmod__(self, other: Nat, /) -> option.Option[tuple[Nat, Nat]]:
+        quotient, remainder = divmod(to_builtin_int(other), self._size)
+
+        return option.Some((_packed(quotient), _packed(remainder)))
+
+    def __truediv__(self, other: Nat, /) -> option.Option[Nat]:
+        divisor = to_builtin_int(other)
+
+        if divisor == 0:
+            return option.Nothing()
+
+        return option.Some(_packed(self._size // divisor))
+
+    def __rtruediv__(self, other: Nat, /) -> option.Option[Nat]:
+        return option.Some(_packed(to_builtin_int(other) // self._size))
+
+    def __floordiv__(self, other: Nat, /) -> Nat:
+        divisor = to_builtin_int(other)
+
+        if divisor == 0:
+            return Zero()
+
+        return _packed(self._size // divisor)
+
+    def __rfloordiv__(self, other: Nat, /) -> Nat:
+        return _packed(to_builtin_int(other) // self._size)
+
+    def __mod__(self, other: Nat, /) -> Nat:
+        divisor = to_builtin_int(other)
+
+        if divisor == 0:
+            return Zero()
+
+        return _packed(self._size % divisor)
+
+    def __rmod__(self, other: Nat, /) -> Nat:
+        return _packed(to_builtin_int(other) % self._size)
+
+    # *- Type conversion -* #
+
+    def __complex__(self) -> complex:
+        return complex(self._size)
+
+    def __float__(self) -> float:
+        return float(self._size)
+
+    def __str__(self) -> str:
+        return str(self._size)
+
+    def __repr__(self) -> str:
+        return f"Packed({self._size})"
+
+    def __bytes__(self) -> bytes:
+        return b"\x00" * self._size
+
+    def __reduce__(self) -> tuple[type[Packed], tuple[int]]:
+        return (Packed, (self._size,))
+
+    # *- Protocols -* #
+
+    def compare(self, other: Nat, /) -> compare.Compare:
+        """
+        Compare with another natural number.
+        """
+
+        value = to_builtin_int(other)
+
+        if self._size < value:
+            return compare.LESS
+
+        if self._size > value:
+            return compare.GREATER
+
+        return compare.EQUAL
+
+    # *- Methods -* #
+
+    def double(self) -> Nat:
+        """
+        Return the number added to itself.
+        """
+
+        return _packed(self._size * 2)
+
+    def square(self) -> Nat:
+        """
+        Return the number multiplied by itself.
+        """
+
+        return _packed(self._size * self._size)
+
+    def is_odd(self) -> bool:
+        """
+        Return whether the number is odd or not.
+        """
+
+        return self._size % 2 == 1
+
+    def is_even(self) -> bool:
+        """
+        Return whether the number is even or not.
+        """
+
+        return self._size % 2 == 0
+
+
+def _packed(value: int) -> Nat:
+    if value == 0:
+        return Zero()
+
+    return Packed(value)
+
+
+# *- Run-length representation -* #
+
+
+@typing.final
+class Run(Succ[Nat]):  # pyright: ignore[reportGeneralTypeIssues]
+    """
+    `Run` stands for `layers` stacked `Succ` over `base`.
+
+    It is a `Succ` whose predecessor is built when it is accessed,
+    as a `Run` of one layer less. Arithmetic combines runs instead
+    of unfolding them, so memory and time depend on the number of
+    runs rather than on the value.
+
+    Use `lift` or `compress` to construct one.
+    """
+
+    __slots__ = ("_base", "_layers")
+
+    _base: Nat
+    _layers: int
+
+    def __init__(self, layers: int, base: Nat) -> None:
+        object.__setattr__(self, "_layers", layers)
+        object.__setattr__(self, "_base", base)
+        object.__setattr__(self, "_size", base._size + layers)  # noqa: SLF001
+
+    @property
+    def predecessor(self) -> Nat:  # pyright: ignore[reportIncompatibleVariableOverride]
+        """
+        The predecessor of the number, built on demand.
+        """
+
+        return _run(self._layers - 1, self._base)
+
+    # *- Comparison -* #
+
+    def __gt__(self, other: Nat, /) -> bool:
+        return self._size > to_builtin_int(other)
+
+    def __ge__(self, other: Nat, /) -> bool:
+        return self._size >= to_builtin_int(other)
+
+    def __lt__(self, other: Nat, /) -> bool:
+        return self._size < to_builtin_int(other)
+
+    def __le__(self, other: Nat, /) -> bool:
+        return self._size <= to_builtin_int(other)
+
+    # *- Arithmetic -* #
+
+    def __add__(self, other: Nat, /) -> Nat:  # pyright: ignore[reportIncompatibleMethodOverride]
+        # n + m = Succ^m(n)
+        return _run(to_builtin_int(other), self)
+
+    def __radd__(self, other: Nat, /) -> Nat:
+        return _run(self._size, other)
+
+    def __sub__(self, other: Nat, /) -> Nat:  # pyright: ignore[reportIncompatibleMethodOverride]
+        return _drop(self, to_builtin_int(other))
+
+    def __rsub__(self, other: Nat, /) -> Nat:
+        return _drop(other, self._size)
+
+    def __mul__(self, other: Nat, /) -> Nat:  # pyright: ignore[reportIncompatibleMethodOverride]
+        return _run(self._size * to_builtin_int(other), Zero())
+
+    def __rmul__(self, other: Nat, /) -> Nat:
+        return _run(to_builtin_int(other) * self._size, Zero())
+
+    def __divmod__(self, other: Nat, /) -> option.Option[tuple[Nat, Nat]]:
+        divisor = to_builtin_int(other)
+
+        if divisor == 0:
+            return option.Nothing()
+
+        quotient, remainder = divmod(self._size, divisor)
+
+        return option.Some((_run(quotient, Zero()), _run(remainder, Zero())))
+
+    def __rdivmod__(self, other: Nat, /) -> option.Option[tuple[Nat, Nat]]:
+        quotient, remainder = divmod(to_builtin_int(other), self._size)
+
+        return option.Some((_run(quotient, Zero()), _run(remainder, Zero())))
+
+    def __truediv__(self, other: Nat, /) -> option.Option[Nat]:
+        return divmod(self, other).map(operator.itemgetter(0))
+
+    def __rtruediv__(self, other: Nat, /) -> option.Option[Nat]:
+        return option.Some(_run(to_builtin_int(other) // self._size, Zero()))
+
+    def __floordiv__(self, other: Nat, /) -> Nat:
+        return divmod(self, other).map_or(Zero(), operator.itemgetter(0))
+
+    def __rfloordiv__(self, other: Nat, /) -> Nat:
+        return _run(to_builtin_int(other) // self._size, Zero())
+
+    def __mod__(self, other: Nat, /) -> Nat:
+        return divmod(self, other).map_or(Zero(), operator.itemgetter(1))
+
+    def __rmod__(self, other: Nat, /) -> Nat:
+        return _run(to_builtin_int(other) % self._size, Zero())
+
+    # *- Type conversion -* #
+
+    def __str__(self) -> str:
+        return str(self._size)
+
+    def __repr__(self) -> str:
+        return f"Run({self._layers}, {self._base!r})"
+
+    def __bytes__(self) -> bytes:
+        return b"\x00" * self._size
+
+    def __reduce__(self) -> tuple[type[Run], tuple[int, Nat]]:
+        return (Run, (self._layers, self._base))
+
+    # *- Protocols -* #
+
+    def compare(self, other: Nat, /) -> compare.Compare:
+        """
+        Compare with another natural number.
+        """
+
+        value = to_builtin_int(other)
+
+        if self._size < value:
+            return compare.LESS
+
+        if self._size > value:
+            return compare.GREATER
+
+        return compare.EQUAL
+
+    # *- Methods -* #
+
+    def is_odd(self) -> bool:
+        """
+        Return whether the number is odd or not.
+        """
+
+        return self._size % 2 == 1
+
+    def is_even(self) -> bool:
+        """
+        Return whether the number is even or not.
+        """
+
+        return self._size % 2 == 0
+
+
+def _run(layers: int, base: Nat) -> Nat:
+    # `layers` Succ over `base`, merged with `base` if it is a run
+    if layers == 0:
+        return base
+
+    if type(base) is Run:
+        return Run(layers + base._layers, base._base)  # noqa: SLF001
+
+    return Run(layers, base)
+
+
+def _drop(n: Nat, count: int) -> Nat:
+    # the `count`-th predecessor of `n`, or `Zero` if there is none,
+    # skipping whole runs
+    while count > 0:
+        match n:
+            case Zero():
+                return n
+            case Run():
+                if count < n._layers:  # noqa: SLF001
+                    return Run(n._layers - count, n._base)  # noqa: SLF001
+
+                count -= n._layers  # noqa: SLF001
+                n = n._base  # noqa: SLF001
+            case Packed():
+                return _packed(max(0, n._size - count))  # noqa: SLF001
+            case Succ(predecessor):
+                n, count = predecessor, count - 1
+
+    return n
+
+
+# *- Digits -* #
+
+zero: typing.Final = Zero()
+one: typing.Final = Succ(Zero())
+two: typing.Final = Succ(one)
+three: typing.Final = Succ(two)
+four: typing.Final = Succ(three)
+five: typing.Final = Succ(four)
+six: typing.Final = Succ(five)
+seven: typing.Final = Succ(six)
+eight: typing.Final = Succ(seven)
+nine: typing.Final = Succ(eight)
+ten: typing.Final = Succ(nine)
+
+
+# *- Methods -* #
+
+
+def succ[N: Nat](n: N) -> Succ[N]:
+    """
+    Return the successor of `n`.
+    """
+
+    return Succ(n)
+
+
+@typing.overload
+def pred(n: Zero) -> Zero: ...
+@typing.overload
+def pred[N: Nat](n: Succ[N]) -> N: ...
+
+
+def pred[N: Nat](n: Zero | Succ[N]) -> Zero | N:
+    """
+    Return the predecessor of `n` or `Zero`.
+    """
+
+    match n:
+        case Zero():
+            return n
+        case Succ(m):
+            return m
+
+
+def ascending_pair(first: Nat, second: Nat) -> tuple[Nat, Nat]:
+    """
+    Return a pair of the two arguments in ascending order.
+    """
+
+    if first <= second:
+        return first, second
+
+    return second, first
+
+
+def decreasing_pair(first: Nat, second: Nat) -> tuple[Nat, Nat]:
+    """
+    Return a pair of the two arguments in decreasing order.
+    """
+
+    if first >= second:
+        return first, second
+
+    return second, first
+
+
+# *- Constructors from built-in types -* #
+
+
+@typing.overload
+def from_builtin_int(value: typing.Literal[0]) -> option.Some[Zero]: ...
+@typing.overload
+def from_builtin_int(value: typing.Literal[1]) -> option.Some[Succ[Zero]]: ...
+@typing.overload
+def from_builtin_int(value: typing.Literal[-1]) -> option.Nothing: ...
+@typing.overload
+def from_builtin_int(value: int) -> option.Option[Nat]: ...
+
+
+def from_builtin_int(value: int) -> option.Option[Nat]:
+    """
+    Construct a `Nat` from a built-in `int`.
+    If `value` is negative, return `Nothing`.
+    """
+
+    if value < 0:
+        return option.Nothing()
+
+    result = Zero()
+
+    while value > 0:
+        result = Succ(result)
+        value -= 1
+
+    return option.Some(result)
+
+
+def from_builtin_int_exn(value: int) -> Nat:
+    """
+    Construct a `Nat` from a built-in `int`.
+
+    Raises
+    ------
+    ValueError
+        If `value` is negative.
+    """
+
+    match from_builtin_int(value):
+        case option.Nothing():
+            message = "argument must not be negative"
+            raise ValueError(message)
+        case option.Some(result):
+            return result
+
+
+@typing.overload
+def by_ramp(value: typing.Literal[0]) -> Zero: ...
+@typing.overload
+def by_ramp(value: typing.Literal[1]) -> Succ[Zero]: ...
+@typing.overload
+def by_ramp(value: typing.Literal[2]) -> Succ[Succ[Zero]]: ...
+@typing.overload
+def by_ramp(value: typing.Literal[-1]) -> Zero: ...
+@typing.overload
+def by_ramp(value: int) -> Nat: ...
+
+
+def by_ramp(value: int) -> Nat:
+    """
+    Construct a `Nat` value from a built-in `int` using the ramp
+    function.
+
+    If value is 0 or negative, the value returned will be `Zero`.
+    If it is positive, it will be some `Succ`.
+    """
+
+    if value <= 0:
+        return Zero()
+
+    result = Zero()
+
+    while value > 0:
+        result = Succ(result)
+        value -= 1
+
+    return result
+
+
+@typing.overload
+def from_builtin_int_packed(value: typing.Literal[0]) -> option.Some[Zero]: ...
+@typing.overload
+def from_builtin_int_packed(value: typing.Literal[-1]) -> option.Nothing: ...
+@typing.overload
+def from_builtin_int_packed(value: int) -> option.Option[Nat]: ...
+
+
+def from_builtin_int_packed(value: int) -> option.Option[Nat]:
+    """
+    Construct a `Nat` from a built-in `int`, in constant time.
+    If `value` is negative, return `Nothing`.
+
+    The number is `Zero` or a `Packed`, which behaves exactly
+    like a chain of `Succ` but only unfolds when destructured.
+    """
+
+    if value < 0:
+        return option.Nothing()
+
+    return option.Some(_packed(value))
+
+
+def from_builtin_int_packed_exn(value: int) -> Nat:
+    """
+    Construct a `Nat` from a built-in `int`, in constant time.
+
+    Raises
+    ------
+    ValueError
+        If `value` is negative.
+    """
+
+    match from_builtin_int_packed(value):
+        case option.Nothing():
+            message = "argument must not be negative"
+            raise ValueError(message)
+        case option.Some(result):
+            return result
+
+
+def pack(n: Nat) -> Nat:
+    """
+    Return `n` as a `Zero` or a `Packed`.
+    """
+
+    return _packed(to_builtin_int(n))
+
+
+def unpack(n: Nat) -> Nat:
+    """
+    Return `n` as a plain chain of `Succ`s.
+    """
+
+    return by_ramp(to_builtin_int(n))
+
+
+def lift(n: Nat, layers: Nat) -> Nat:
+    """
+    Return `n` with `layers` `Succ` stacked on top of it, as a
+    single `Run` node.
+    """
+
+    return _run(to_builtin_int(layers), n)
+
+
+def compress(n: Nat) -> Nat:
+    """
+    Return `n` with its topmost chain of plain `Succ`s replaced by
+    a single `Run` node.
+    """
+
+    layers = 0
+
+    while type(n) is Succ:
+        n, layers = n.predecessor, layers + 1
+
+    return _run(layers, n)
+
+
+def length_of(container: collections.abc.Sized) -> Nat:
+    """
+    Return the length of `container`. It is exactly like the
+    built-in function `len`, except that it returns a `Nat`.
+    """
+
+    return _packed(len(container))
+
+
+def count_of(container: collections.abc.Sequence[object], value: object) -> Nat:
+    """
+    Return the number of occurrences of `value` in `container`,
+    like its `count` method - for strings and bytes, of
+    non-overlapping occurrences of a substring - as a `Nat`.
+    """
+
+    return _packed(container.count(value))
+
+
+def index_of(
+    container: collections.abc.Sequence[object],
+    value: object,
+) -> option.Option[Nat]:
+    """
+    Return the index of the first occurrence of `value` in
+    `container`, like its `index` method, or `Nothing` if there is
+    none.
+    """
+
+    try:
+        return option.Some(_packed(container.index(value)))
+    except ValueError:
+        return option.Nothing()
+
+
+def abs_of(value: int) -> Nat:
+    """
+    Return the absolute value of `value`, as a `Nat`.
+    """
+
+    return _packed(abs(value))
+
+
+# *- Conversion to built-in types -* #
+
+
+def to_builtin_int(n: Nat) -> int:
+    """
+    Convert `n` to a built-in `int`, in O(1).
+    """
+
+    return n._size  # noqa: SLF001
+
+
+# *- Bulk operations -* #
+
+
+# the largest ratio of the greatest depth to the number of elements
+# for which `sort` uses a counting sort
+_COUNTING_SORT_FACTOR: typing.Final = 16
+
+
+@typing.overload
+def sort(
+    iterable: collections.abc.Iterable[Nat],
+    /,
+    *,
+    key: None = None,
+    reverse: bool = False,
+) -> list[Nat]: ...
+@typing.overload
+def sort[T](
+    iterable: collections.abc.Iterable[T],
+    /,
+    *,
+    key: collections.abc.Callable[[T], Nat],
+    reverse: bool = False,
+) -> list[T]: ...
+
+
+def sort[T](
+    iterable: collections.abc.Iterable[T],
+    /,
+    *,
+    key: collections.abc.Callable[[T], Nat] | None = None,
+    reverse: bool = False,
+) -> list[T]:
+    """
+    Return a new list containing the elements of `iterable` in
+    ascending order - or descending if `reverse` is true.
+
+    If `key` is given, elements are ordered by the `Nat` it
+    returns for them. The sort is stable.
+
+    Unlike `sorted`, this is a counting sort: it runs in linear
+    time in the number of elements plus their depths, instead of
+    doing O(n log n) deep comparisons. When the depths are much
+    larger than the number of elements, it sorts their values as
+    built-in `int`s instead, in O(n log n).
+    """
+
+    elements = list(iterable)
+
+    if not elements:
+        return []
+
+    depths = [
+        to_builtin_int(element if key is None else key(element))  # pyright: ignore[reportArgumentType]
+        for element in elements
+    ]
+
+    # the buckets would cost more than sorting the values
+    if max(depths) > _COUNTING_SORT_FACTOR * len(elements):
+        order = sorted(
+            builtins.range(len(elements)),
+            key=depths.__getitem__,
+            reverse=reverse,
+        )
+
+        return [elements[index] for index in order]
+
+    offsets = [0] * (max(depths) + 1)
+
+    for depth in depths:
+        offsets[depth] += 1
+
+    total = 0
+    buckets: collections.abc.Iterable[int] = builtins.range(len(offsets))
+
+    if reverse:
+        buckets = reversed(buckets)
+
+    for depth in buckets:
+        offsets[depth], total = total, total + offsets[depth]
+
+    result: list[T] = elements.copy()
+
+    for element, depth in zip(elements, depths, strict=True):
+        result[offsets[depth]] = element
+        offsets[depth] += 1
+
+    return result
+
+
+def _extremum(
+    iterable: collections.abc.Iterable[Nat],
+    *,
+    is_better: collections.abc.Callable[[int, int], bool],
+) -> option.Option[tuple[int, Nat]]:
+    best: tuple[int, int, Nat] | None = None
+
+    for index, element in builtins.enumerate(iterable):
+        depth = to_builtin_int(element)
+
+        if best is None or is_better(depth, best[1]):
+            best = (index, depth, element)
+
+    if best is None:
+        return option.Nothing()
+
+    index, _, element = best
+
+    return option.Some((index, element))
+
+
+def sum_of(iterable: collections.abc.Iterable[Nat], start: Nat = zero) -> Nat:
+    """
+    Return the sum of `start` and the numbers of `iterable`.
+
+    The numbers are added as built-in `int`s, so this is O(1) per
+    number whatever their size.
+    """
+
+    return _packed(sum(map(to_builtin_int, iterable), to_builtin_int(start)))
+
+
+def min_of(iterable: collections.abc.Iterable[Nat]) -> option.Option[Nat]:
+    """
+    Return the smallest number of `iterable` in one pass, or
+    `Nothing` if it is empty.
+    """
+
+    match _extremum(iterable, is_better=int.__lt__):
+        case option.Nothing():
+            return option.Nothing()
+        case option.Some((_, element)):
+            return option.Some(element)
+
+
+def max_of(iterable: collections.abc.Iterable[Nat]) -> option.Option[Nat]:
+    """
+    Return the greatest number of `iterable` in one pass, or
+    `Nothing` if it is empty.
+    """
+
+    match _extremum(iterable, is_better=int.__gt__):
+        case option.Nothing():
+            return option.Nothing()
+        case option.Some((_, element)):
+            return option.Some(element)
+
+
+def argmin(iterable: collections.abc.Iterable[Nat]) -> option.Option[Nat]:
+    """
+    Return the index of the first smallest number of `iterable`,
+    or `Nothing` if it is empty.
+    """
+
+    match _extremum(iterable, is_better=int.__lt__):
+        case option.Nothing():
+            return option.Nothing()
+        case option.Some((index, _)):
+            return option.Some(_packed(index))
+
+
+def argmax(iterable: collections.abc.Iterable[Nat]) -> option.Option[Nat]:
+    """
+    Return the index of the first greatest number of `iterable`,
+    or `Nothing` if it is empty.
+    """
+
+    match _extremum(iterable, is_better=int.__gt__):
+        case option.Nothing():
+            return option.Nothing()
+        case option.Some((index, _)):
+            return option.Some(_packed(index))
+
+
+# *- Iteration -* #
+
+
+def _step(n: Nat, step: int) -> Nat:
+    # `step` Succ over `n`, in O(1)
+    if step == 1:
+        return Succ(n)
+
+    return _run(step, n)
+
+
+@attrs.frozen
+class Range:
+    """
+    An immutable sequence of natural numbers, like the built-in
+    `range`.
+
+    Each step of the iteration wraps the previous number in a
+    `Succ`, or in a `Run` of `step` layers, so every step is O(1)
+    and iterating never rebuilds a number from scratch. Length and
+    membership are computed without iterating.
+    """
+
+    start: Nat
+    stop: Nat
+    step: Nat = one
+    _start: int = attrs.field(init=False, repr=False, eq=False)
+    _stop: int = attrs.field(init=False, repr=False, eq=False)
+    _step: int = attrs.field(init=False, repr=False, eq=False)
+
+    def __attrs_post_init__(self) -> None:
+        if self.step == zero:
+            message = "step must not be zero"
+            raise ValueError(message)
+
+        object.__setattr__(self, "_start", to_builtin_int(self.start))
+        object.__setattr__(self, "_stop", to_builtin_int(self.stop))
+        object.__setattr__(self, "_step", to_builtin_int(self.step))
+
+    def __len__(self) -> int:
+        return max(0, -(-(self._stop - self._start) // self._step))
+
+    def __contains__(self, value: object) -> bool:
+        if not isinstance(value, Zero | Succ):
+            return False
+
+        depth = to_builtin_int(value)  # pyright: ignore[reportUnknownArgumentType]
+
+        return (
+            self._start <= depth < self._stop
+            and (depth - self._start) % self._step == 0
+        )
+
+    def __iter__(self) -> collections.abc.Iterator[Nat]:
+        remaining = len(self)
+
+        if remaining == 0:
+            return
+
+        current = self.start
+
+        yield current
+
+        for _ in builtins.range(remaining - 1):
+            current = _step(current, self._step)
+
+            yield current
+
+    def length(self) -> Nat:
+        """
+        Return the number of elements of the range.
+        """
+
+        return _packed(len(self))
+
+
+@attrs.frozen
+class Count:
+    """
+    An infinite sequence of natural numbers, like
+    `itertools.count`.
+
+    Each step of the iteration wraps the previous number in a
+    `Succ`, or in a `Run` of `step` layers, so every step is O(1).
+    Membership is computed without iterating.
+    """
+
+    start: Nat = zero
+    step: Nat = one
+
+    def __contains__(self, value: object) -> bool:
+        if not isinstance(value, Zero | Succ):
+            return False
+
+        depth = to_builtin_int(value)  # pyright: ignore[reportUnknownArgumentType]
+        start, step = to_builtin_int(self.start), to_builtin_int(self.step)
+
+        if step == 0:
+            return depth == start
+
+        return depth >= start and (depth - start) % step == 0
+
+    def __iter__(self) -> collections.abc.Iterator[Nat]:
+        step = to_builtin_int(self.step)
+        current = self.start
+
+        while True:
+            yield current
+
+            current = _step(current, step)
+
+
+@attrs.frozen
+class Enumerate[T]:
+    """
+    Pairs of a `Nat` index and an element of `iterable`, like the
+    built-in `enumerate`.
+
+    Each index is the successor of the previous one, so every
+    step is O(1). Its length is the one of `iterable`, if it has
+    one.
+    """
+
+    iterable: collections.abc.Iterable[T]
+    start: Nat = zero
+
+    def __len__(self) -> int:
+        return len(self.iterable)  # pyright: ignore[reportArgumentType]
+
+    def __iter__(self) -> collections.abc.Iterator[tuple[Nat, T]]:
+        current = self.start
+
+        for element in self.iterable:
+            yield current, element
+            current = Succ(current)
+
+    def length(self) -> Nat:
+        """
+        Return the number of elements of the enumeration.
+
+        Raises
+        ------
+        TypeError
+            If `iterable` has no length.
+        """
+
+        return _packed(len(self))
+
+
+@typing.overload
+def range(stop: Nat, /) -> Range: ...  # noqa: A001
+@typing.overload
+def range(start: Nat, stop: Nat, step: Nat = ..., /) -> Range: ...  # noqa: A001
+
+
+def range(  # noqa: A001
+    first: Nat,
+    second: Nat | None = None,
+    step: Nat = one,
+    /,
+) -> Range:
+    """
+    Return the natural numbers from `start` (0 by default) up to
+    `stop` excluded, every `step`.
+
+    Raises
+    ------
+    ValueError
+        If `step` is zero.
+    """
+
+    if second is None:
+        return Range(Zero(), first, step)
+
+    return Range(first, second, step)
+
+
+def count(start: Nat = zero, step: Nat = one) -> Count:
+    """
+    Return the natural numbers from `start` to infinity, every
+    `step`.
+    """
+
+    return Count(start, step)
+
+
+def enumerate[T](  # noqa: A001
+    iterable: collections.abc.Iterable[T],
+    start: Nat = zero,
+) -> Enumerate[T]:
+    """
+    Return pairs of a `Nat` index, counting from `start`, and an
+    element of `iterable`. It is exactly like the built-in
+    function `enumerate`, except that indices are `Nat`s.
+    """
+
+    return Enumerate(iterable, start)
+
+
+# *- Recursion principles -* #
+
+
+def fold[A](n: Nat, base: A, step: collections.abc.Callable[[A], A]) -> A:
+    """
+    Apply `step` `n` times to `base`.
+
+    This is the non-dependent recursion principle of `Nat`:
+
+    >>> fold(Zero(), base, step)
+    base
+    >>> fold(Succ(m), base, step)
+    step(fold(m, base, step))
+
+    It runs as a loop, so it does not depend on the recursion
+    limit.
+    """
+
+    result = base
+
+    for _ in builtins.range(to_builtin_int(n)):
+        result = step(result)
+
+    return result
+
+
+def rec[A](n: Nat, base: A, step: collections.abc.Callable[[Nat, A], A]) -> A:
+    """
+    Like `fold`, but `step` also receives the predecessor of the
+    number being computed.
+
+    This is the recursion principle of `Nat`:
+
+    >>> rec(Zero(), base, step)
+    base
+    >>> rec(Succ(m), base, step)
+    step(m, rec(m, base, step))
+
+    It runs as a loop, so it does not depend on the recursion
+    limit.
+    """
+
+    spine: list[Nat] = []
+
+    while isinstance(n, Succ):
+        n = n.predecessor
+        spine.append(n)
+
+    result = base
+
+    for predecessor in reversed(spine):
+        result = step(predecessor, result)
+
+    return result
+
+
+def fold_many(
+    n: Nat,
+    *folds: tuple[typing.Any, collections.abc.Callable[[typing.Any], typing.Any]],
+) -> tuple[typing.Any, ...]:
+    """
+    Compute several folds over `n` in a single pass.
+
+    Each fold is a `(base, step)` pair, and the result is the
+    tuple of `fold(n, base, step)` for each of them, in order.
+    """
+
+    results = [base for base, _ in folds]
+    steps = [step for _, step in folds]
+
+    for _ in builtins.range(to_builtin_int(n)):
+        results = [step(result) for step, result in zip(steps, results, strict=True)]
+
+    return tuple(results)
+
+
+# *- Collections -* #
+
+
+class NatSet(collections.abc.MutableSet[Nat]):
+    """
+    A mutable set of natural numbers, stored as a bitset over their
+    values.
+
+    Membership, `add` and `discard` are O(1) amortized whatever the
+    size of the numbers, and set operations between `NatSet`s work
+    on whole bytes. Numbers that are far above the others are kept
+    aside, as in `NatMap`, so a few large numbers do not allocate a
+    huge bitset. Iteration is in ascending order, and yields packed
+    numbers.
+    """
+
+    __slots__ = ("_bits", "_length", "_sparse")
+
+    def __init__(self, iterable: collections.abc.Iterable[Nat] = ()) -> None:
+        # bit k of the little-endian `_bits` is set if k is in the set,
+        # and `_sparse` holds the elements past the end of `_bits`
+        self._bits = bytearray()
+        self._sparse: set[int] = set()
+        self._length = 0
+
+        for n in iterable:
+            self.add(n)
+
+    # XXX: the base accepts any element, but a `NatSet` only holds `Nat`
+    @classmethod
+    def _from_iterable(cls, iterable: collections.abc.Iterable[Nat]) -> NatSet:  # pyright: ignore[reportIncompatibleMethodOverride]
+        return cls(iterable)
+
+    @classmethod
+    def _from_int(cls, bits: int) -> NatSet:
+        result = cls()
+        result._bits = bytearray(bits.to_bytes((bits.bit_length() + 7) // 8, "little"))
+        result._length = bits.bit_count()
+
+        return result
+
+    def _int(self) -> int:
+        return int.from_bytes(self._bits, "little")
+
+    def _has(self, value: int) -> bool:
+        index, bit = divmod(value, 8)
+
+        if index < len(self._bits):
+            return self._bits[index] >> bit & 1 == 1
+
+        return value in self._sparse
+
+    def _add(self, value: int) -> None:
+        index, bit = divmod(value, 8)
+        start = len(self._bits)
+
+        # the bitset grows at most geometrically, farther elements
+        # are kept in `_sparse` until the bitset reaches them
+        if start <= index < 2 * start + _NAT_SET_SLACK:
+            self._bits.extend(bytes(index + 1 - start))
+
+            for position in builtins.range(start * 8, (index + 1) * 8):
+                if position in self._sparse:
+                    self._sparse.remove(position)
+                    self._bits[position // 8] |= 1 << position % 8
+
+        if index < len(self._bits):
+            if not self._bits[index] >> bit & 1:
+                self._bits[index] |= 1 << bit
+                self._length += 1
+        elif value not in self._sparse:
+            self._sparse.add(value)
+            self._length += 1
+
+    def _discard(self, value: int) -> None:
+        index, bit = divmod(value, 8)
+
+        if index < len(self._bits):
+            if self._bits[index] >> bit & 1:
+                self._bits[index] &= ~(1 << bit) & 0xFF
+                self._length -= 1
+        elif value in self._sparse:
+            self._sparse.remove(value)
+            self._length -= 1
+
+    def _combine(
+        self,
+        other: NatSet,
+        operation: collections.abc.Callable[[int, int], int],
+    ) -> NatSet:
+        # `operation` on the bitsets, then on each element kept aside
+        # by either set, whose bits may be wrong in the result
+        result = NatSet._from_int(operation(self._int(), other._int()))
+
+        for value in self._sparse | other._sparse:
+            if operation(int(self._has(value)), int(other._has(value))) & 1:
+                result._add(value)
+            else:
+                result._discard(value)
+
+        return result
+
+    def __contains__(self, value: object) -> bool:
+        if not isinstance(value, Zero | Succ):
+            return False
+
+        return self._has(value._size)  # noqa: SLF001
+
+    def __iter__(self) -> collections.abc.Iterator[Nat]:
+        for index, byte in builtins.enumerate(self._bits):
+            if byte:
+                for bit in builtins.range(8):
+                    if byte >> bit & 1:
+                        yield _packed(index * 8 + bit)
+
+        for value in sorted(self._sparse):
+            yield _packed(value)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __repr__(self) -> str:
+        return f"NatSet({{{', '.join(builtins.map(str, self))}}})"
+
+    def add(self, value: Nat) -> None:
+        """
+        Add `value` to the set.
+        """
+
+        self._add(to_builtin_int(value))
+
+    def discard(self, value: Nat) -> None:
+        """
+        Remove `value` from the set if it is present.
+        """
+
+        self._discard(to_builtin_int(value))
+
+    def clear(self) -> None:
+        """
+        Remove every element from the set.
+        """
+
+        self._bits.clear()
+        self._sparse.clear()
+        self._length = 0
+
+    def rank(self, value: Nat) -> Nat:
+        """
+        Return the number of elements of the set less than `value`.
+        """
+
+        limit = to_builtin_int(value)
+        index, bit = divmod(limit, 8)
+        below = int.from_bytes(self._bits[:index], "little").bit_count()
+
+        if index < len(self._bits):
+            below += (self._bits[index] & ((1 << bit) - 1)).bit_count()
+
+        below += sum(1 for element in self._sparse if element < limit)
+
+        return _packed(below)
+
+    # *- Set operations -* #
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, NatSet):
+            return self._length == other._length and not self ^ other
+
+        return super().__eq__(other)
+
+    __hash__ = None  # pyright: ignore[reportAssignmentType]
+
+    def __or__(self, other: collections.abc.Set[object]) -> NatSet:
+        if isinstance(other, NatSet):
+            return self._combine(other, operator.or_)
+
+        return typing.cast("NatSet", super().__or__(other))
+
+    def __and__(self, other: collections.abc.Set[object]) -> NatSet:
+        if isinstance(other, NatSet):
+            return self._combine(other, operator.and_)
+
+        return typing.cast("NatSet", super().__and__(other))
+
+    def __sub__(self, other: collections.abc.Set[object]) -> NatSet:
+        if isinstance(other, NatSet):
+            return self._combine(other, lambda left, right: left & ~right)
+
+        return typing.cast("NatSet", super().__sub__(other))
+
+    def __xor__(self, other: collections.abc.Set[object]) -> NatSet:
+        if isinstance(other, NatSet):
+            return self._combine(other, operator.xor)
+
+        return typing.cast("NatSet", super().__xor__(other))
+
+    def __ior__(self, other: collections.abc.Set[Nat]) -> typing.Self:  # pyright: ignore[reportIncompatibleMethodOverride]
+        if isinstance(other, NatSet):
+            self._replace(self | other)
+            return self
+
+        return super().__ior__(other)
+
+    def __iand__(self, other: collections.abc.Set[object]) -> typing.Self:
+        if isinstance(other, NatSet):
+            self._replace(self & other)
+            return self
+
+        return super().__iand__(other)
+
+    def __isub__(self, other: collections.abc.Set[object]) -> typing.Self:
+        if isinstance(other, NatSet):
+            self._replace(self - other)
+            return self
+
+        return super().__isub__(other)
+
+    def __ixor__(self, other: collections.abc.Set[Nat]) -> typing.Self:  # pyright: ignore[reportIncompatibleMethodOverride]
+        if isinstance(other, NatSet):
+            self._replace(self ^ other)
+            return self
+
+        return super().__ixor__(other)
+
+    def isdisjoint(self, other: collections.abc.Iterable[object]) -> bool:
+        """
+        Return whether the set has no element in common with
+        `other`.
+        """
+
+        if isinstance(other, NatSet):
+            return not self & other
+
+        return super().isdisjoint(other)
+
+    def _replace(self, other: NatSet) -> None:
+        self._bits, self._sparse = other._bits, other._sparse
+        self._length = other._length
+
+
+class NatMap[V](collections.abc.MutableMapping[Nat, V]):
+    """
+    A mutable mapping whose keys are natural numbers, stored in an
+    array indexed by their values.
+
+    Lookups, insertions and deletions are O(1) amortized whatever
+    the size of the keys. Keys that are far above the others are
+    kept aside, so a few large keys do not allocate a huge array.
+    Iteration is in ascending order of keys, which are yielded as
+    packed numbers.
+    """
+
+    __slots__ = ("_dense", "_length", "_sparse")
+
+    def __init__(
+        self,
+        items: collections.abc.Mapping[Nat, V]
+        | collections.abc.Iterable[tuple[Nat, V]] = (),
+    ) -> None:
+        self._dense: list[V | _Missing] = []
+        self._sparse: dict[int, V] = {}
+        self._length = 0
+
+        self.update(items)
+
+    def _index(self, key: object) -> int:
+        if not isinstance(key, Zero | Succ):
+            raise KeyError(key)
+
+        return key._size  # noqa: SLF001
+
+    def __getitem__(self, key: Nat) -> V:
+        index = self._index(key)
+
+        if index < len(self._dense):
+            value = self._dense[index]
+
+            if not isinstance(value, _Missing):
+                return value
+        elif index in self._sparse:
+            return self._sparse[index]
+
+        raise KeyError(key)
+
+    def __setitem__(self, key: Nat, value: V) -> None:
+        index = self._index(key)
+
+        # the array grows at most geometrically, farther keys are
+        # kept in `_sparse` until the array reaches them
+        if len(self._dense) <= index < 2 * len(self._dense) + _NAT_MAP_SLACK:
+            start = len(self._dense)
+            self._dense.extend(
+                self._sparse.pop(position, _MISSING)
+                for position in builtins.range(start, index + 1)
+            )
+
+        if index < len(self._dense):
+            if isinstance(self._dense[index], _Missing):
+                self._length += 1
+
+            self._dense[index] = value
+        else:
+            if index not in self._sparse:
+                self._length += 1
+
+            self._sparse[index] = value
+
+    def __delitem__(self, key: Nat) -> None:
+        index = self._index(key)
+
+        if index < len(self._dense) and not isinstance(self._dense[index], _Missing):
+            self._dense[index] = _MISSING
+        elif index in self._sparse:
+            del self._sparse[index]
+        else:
+            raise KeyError(key)
+
+        self._length -= 1
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, Zero | Succ):
+            return False
+
+        index = key._size  # noqa: SLF001
+
+        if index < len(self._dense):
+            return not isinstance(self._dense[index], _Missing)
+
+        return index in self._sparse
+
+    def __iter__(self) -> collections.abc.Iterator[Nat]:
+        for index, value in builtins.enumerate(self._dense):
+            if not isinstance(value, _Missing):
+                yield _packed(index)
+
+        for index in sorted(self._sparse):
+            yield _packed(index)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __repr__(self) -> str:
+        items = ", ".join(f"{key}: {value!r}" for key, value in self.items())
+
+        return f"NatMap({{{items}}})"
+
+    def clear(self) -> None:
+        """
+        Remove every item from the mapping.
+        """
+
+        self._dense.clear()
+        self._sparse.clear()
+        self._length = 0
+
+
+@typing.final
+class _Missing:
+    __slots__ = ()
+
+
+_MISSING: typing.Final = _Missing()
+
+# keys up to this far past the end of the array extend it
+_NAT_MAP_SLACK: typing.Final = 64
+
+# elements up to this many bytes past the end of the bitset extend it
+_NAT_SET_SLACK: typing.Final = 64
+
+
+# *- Parsing -* #
+
+_DEFAULT_CHUNK_SIZE: typing.Final = 1 << 16
+
+# below the smallest value allowed for `sys.set_int_max_str_digits`
+_MAX_INT_DIGITS: typing.Final = 512
+
+
+def _parse_digits(digits: str | bytes, powers: dict[int, int]) -> int:
+    # the value of `digits`, by splitting it in halves so that `int`
+    # never exceeds the limit on the length of strings it converts
+    if len(digits) <= _MAX_INT_DIGITS:
+        return int(digits)
+
+    low_length = len(digits) // 2
+
+    if low_length not in powers:
+        powers[low_length] = 10**low_length
+
+    high = _parse_digits(digits[:-low_length], powers)
+    low = _parse_digits(digits[-low_length:], powers)
+
+    return high * powers[low_length] + low
+
+
+def parse(text: str | bytes) -> option.Option[Nat]:
+    """
+    Parse the decimal representation of a natural number.
+    If `text` is not only made of ASCII digits - including if it
+    has a sign, underscores or surrounding whitespace - return
+    `Nothing`.
+
+    The result is a `Zero` or a `Packed`, so parsing is as fast
+    as `int`. Unlike `int`, it is not limited by
+    `sys.get_int_max_str_digits`: long inputs are converted in
+    pieces, like `decimal_chunks` writes them.
+    """
+
+    if not text.isascii() or not text.isdigit():
+        return option.Nothing()
+
+    return option.Some(_packed(_parse_digits(text, {})))
+
+
+def parse_exn(text: str | bytes) -> Nat:
+    """
+    Parse the decimal representation of a natural number.
+
+    Raises
+    ------
+    ValueError
+        If `text` is not only made of ASCII digits.
+    """
+
+    match parse(text):
+        case option.Nothing():
+            message = f"invalid natural number: {text!r}"
+            raise ValueError(message)
+        case option.Some(result):
+            return result
+
+
+def _tokens[S: (str, bytes)](
+    source: S | typing.IO[S],
+    sep: S | None,
+    chunk_size: int,
+) -> collections.abc.Iterator[S]:
+    if isinstance(source, str | bytes):
+        chunks: collections.abc.Iterable[S] = [source]
+    else:
+        chunks = iter(lambda: source.read(chunk_size), source.read(0))
+
+    rest: S | None = None
+
+    for chunk in chunks:
+        data = chunk if rest is None else rest + chunk
+        # `split` is typed per constraint, not as `list[S]`
+        tokens = typing.cast("list[S]", data.split(sep))
+
+        if sep is None and data[-1:].isspace():
+            rest = data[:0]
+        else:
+            rest = tokens.pop() if tokens else data[:0]
+
+        yield from tokens
+
+    # a trailing separator does not start an empty token
+    if rest is not None and rest.strip():
+        yield rest
+
+
+def parse_many[S: (str, bytes)](
+    source: S | typing.IO[S],
+    sep: S | None = None,
+    *,
+    chunk_size: int = _DEFAULT_CHUNK_SIZE,
+) -> collections.abc.Iterator[option.Option[Nat]]:
+    """
+    Parse the natural numbers of `source`, separated by `sep`, or
+    by whitespace if it is `None`.
+
+    `source` is a string or a file, which is read `chunk_size`
+    characters or bytes at a time, so memory usage does not
+    depend on its size. Surrounding whitespace is stripped from
+    each number, and a trailing separator is ignored.
+
+    Each number gives an `Option`, like `parse`.
+    """
+
+    for token in _tokens(source, sep, chunk_size):
+        yield parse(token.strip())
+
+
+def parse_many_exn[S: (str, bytes)](
+    source: S | typing.IO[S],
+    sep: S | None = None,
+    *,
+    chunk_size: int = _DEFAULT_CHUNK_SIZE,
+) -> collections.abc.Iterator[Nat]:
+    """
+    Parse the natural numbers of `source`, like `parse_many`.
+
+    Raises
+    ------
+    ValueError
+        When an invalid number is reached.
+    """
+
+    for token in _tokens(source, sep, chunk_size):
+        yield parse_exn(token.strip())
+
+
+# *- Decimal output -* #
+
+_DEFAULT_DIGITS_CHUNK_SIZE: typing.Final = 1024
+
+
+def _padded_digits(value: int, length: int, powers: dict[int, int]) -> str:
+    # the `length` last digits of `value`, by splitting it in halves
+    # like `_parse_digits`
+    if length <= _MAX_INT_DIGITS:
+        return str(value).zfill(length)
+
+    low_length = length // 2
+
+    if low_length not in powers:
+        powers[low_length] = 10**low_length
+
+    high, low = divmod(value, powers[low_length])
+
+    high_digits = _padded_digits(high, length - low_length, powers)
+
+    return high_digits + _padded_digits(low, low_length, powers)
+
+
+def _padded_chunks(
+    value: int,
+    count: int,
+    size: int,
+    powers: dict[int, int],
+) -> collections.abc.Iterator[str]:
+    # the `count * size` last digits of `value`, in `count` chunks,
+    # by splitting it in halves from the most significant digits
+    if count == 1:
+        yield _padded_digits(value, size, powers)
+        return
+
+    low_count = count // 2
+    low_length = size * low_count
+
+    if low_length not in powers:
+        powers[low_length] = 10**low_length
+
+    high, low = divmod(value, powers[low_length])
+
+    yield from _padded_chunks(high, count - low_count, size, powers)
+    yield from _padded_chunks(low, low_count, size, powers)
+
+
+def decimal_chunks(
+    n: Nat,
+    chunk_size: int = _DEFAULT_DIGITS_CHUNK_SIZE,
+) -> collections.abc.Iterator[str]:
+    """
+    Generate the decimal digits of `n`, most significant first,
+    in strings of `chunk_size` digits - except the first one,
+    which can be shorter.
+
+    The whole decimal string is never built: apart from the
+    current chunk, the memory used is proportional to the binary
+    size of `n`. Unlike `str`, this works on numbers of any size.
+
+    Raises
+    ------
+    ValueError
+        If `chunk_size` is not positive.
+    """
+
+    if chunk_size <= 0:
+        message = "chunk size must be positive"
+        raise ValueError(message)
+
+    value = to_builtin_int(n)
+
+    # an upper bound of the number of digits, from the number of
+    # bits: log10(2) < 0.30103
+    digits = value.bit_length() * 30103 // 100000 + 1
+    count = -(-digits // chunk_size)
+    leading = True
+
+    for chunk in _padded_chunks(value, count, chunk_size, {}):
+        if leading:
+            chunk = chunk.lstrip("0")  # noqa: PLW2901
+
+            if not chunk:
+                continue
+
+            leading = False
+
+        yield chunk
+
+    if leading:
+        yield "0"
+
+
+def write_decimal(
+    n: Nat,
+    file: typing.IO[str],
+    chunk_size: int = _DEFAULT_DIGITS_CHUNK_SIZE,
+) -> None:
+    """
+    Write the decimal representation of `n` to `file`, by chunks
+    of `chunk_size` digits, as `decimal_chunks` produces them.
+
+    Raises
+    ------
+    ValueError
+        If `chunk_size` is not positive.
+    """
+
+    for chunk in decimal_chunks(n, chunk_size):
+        file.write(chunk)
+
+
+# *- Submodules -* #
+
+_SUBMODULES: typing.Final = frozenset({"compiler", "primes", "unsafe"})
+
+_REEXPORTS: typing.Final = {"compile": "compiler"}
+
+
+def __getattr__(name: str) -> object:
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+
+    if name in _REEXPORTS:
+        module = importlib.import_module(f".{_REEXPORTS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+
+        return value
+
+    message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(message)
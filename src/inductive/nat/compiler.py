@@ -0,0 +1,264 @@
+"""
+# nat.compiler
+
+Compilation of structurally recursive functions on natural
+numbers into loops.
+
+A function written in the style of Rocq,
+
+    def is_odd(n: Nat) -> bool:
+        match n:
+            case Zero():
+                return False
+            case Succ(m):
+                return not is_odd(m)
+
+runs at unary speed and is bounded by the recursion limit. `compile`
+recognizes this shape and rewrites it to compute the result from
+the base case up, in a loop over the value of the number.
+"""
+
+from __future__ import annotations
+
+import ast
+import builtins
+import functools
+import inspect
+import textwrap
+import typing
+
+from inductive.nat import Succ
+from inductive.nat import Zero
+from inductive.nat import _packed  # noqa: PLC2701
+from inductive.nat import to_builtin_int
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import collections.abc
+
+# prefix of the names introduced in compiled functions
+_PREFIX: typing.Final = "_inductive_compiled_"
+
+
+def _resolve(node: ast.expr, namespace: dict[str, object]) -> object:
+    # the object named by a dotted name, if any
+    match node:
+        case ast.Name(name):
+            return namespace.get(name, getattr(builtins, name, None))
+        case ast.Attribute(value, attribute):
+            return getattr(_resolve(value, namespace), attribute, None)
+        case _:
+            return None
+
+
+def _returned(body: list[ast.stmt]) -> ast.expr | None:
+    match body:
+        case [ast.Return(ast.expr() as value)]:
+            return value
+        case _:
+            return None
+
+
+class _RecursiveCalls(ast.NodeTransformer):
+    # replaces the recursive calls `name(*arguments)` by `result`, and
+    # counts every other reference to `name`
+    def __init__(self, name: str, arguments: list[str], result: str) -> None:
+        self.name = name
+        self.arguments = arguments
+        self.result = result
+        self.replaced = 0
+        self.escaped = 0
+
+    def visit_Call(self, node: ast.Call) -> ast.AST:  # noqa: N802
+        match node:
+            case ast.Call(ast.Name(name), arguments, []) if (
+                name == self.name
+                and [ast.unparse(argument) for argument in arguments] == self.arguments
+            ):
+                self.replaced += 1
+                return ast.Name(self.result, ast.Load())
+            case _:
+                return self.generic_visit(node)
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:  # noqa: N802
+        if node.id == self.name:
+            self.escaped += 1
+
+        return node
+
+
+def _compile_function(
+    function: ast.FunctionDef,
+    namespace: dict[str, object],
+) -> ast.FunctionDef | None:
+    body = function.body
+
+    # skip the docstring
+    match body:
+        case [ast.Expr(ast.Constant(str())), *rest]:
+            body = rest
+        case _:
+            pass
+
+    parameters = [parameter.arg for parameter in function.args.args]
+
+    match body:
+        case [ast.Match(ast.Name(subject), [first, second])] if subject in parameters:
+            pass
+        case _:
+            return None
+
+    base = step = predecessor = None
+
+    for case in (first, second):
+        match case:
+            case ast.match_case(ast.MatchClass(cls, [], [], []), None, statements) if (
+                _resolve(cls, namespace) is Zero
+            ):
+                base = _returned(statements)
+            case ast.match_case(
+                ast.MatchClass(cls, [ast.MatchAs(None, str(name))], [], [])
+                | ast.MatchClass(
+                    cls, [], ["predecessor"], [ast.MatchAs(None, str(name))]
+                ),
+                None,
+                statements,
+            ) if _resolve(cls, namespace) is Succ:
+                step, predecessor = _returned(statements), name
+            case _:
+                return None
+
+    if base is None or step is None or predecessor is None:
+        return None
+
+    result = f"{_PREFIX}result"
+    arguments = [
+        predecessor if parameter == subject else parameter for parameter in parameters
+    ]
+
+    # the base case must not recurse, and the step must recurse once,
+    # on the predecessor and with the same other arguments
+    calls = _RecursiveCalls(function.name, arguments, result)
+    step = calls.visit(step)
+
+    if calls.replaced != 1 or calls.escaped != 0:
+        return None
+
+    calls = _RecursiveCalls(function.name, arguments, result)
+    calls.visit(base)
+
+    if calls.replaced != 0 or calls.escaped != 0:
+        return None
+
+    # the numbers are only built if the step uses them
+    used = {node.id for node in ast.walk(step) if isinstance(node, ast.Name)}
+    bindings = "".join(
+        f"    {name} = {_PREFIX}packed({_PREFIX}index{offset})\n"
+        for name, offset in ((predecessor, " - 1"), (subject, ""))
+        if name in used
+    )
+
+    source = f"""
+if not isinstance({subject}, {_PREFIX}Zero | {_PREFIX}Succ):
+    return {_PREFIX}original({", ".join(parameters)})
+
+{_PREFIX}size = {_PREFIX}to_builtin_int({subject})
+{subject} = {_PREFIX}Zero()
+{result} = {ast.unparse(base)}
+
+for {_PREFIX}index in {_PREFIX}range(1, {_PREFIX}size + 1):
+{bindings}    {result} = {ast.unparse(step)}
+
+return {result}
+"""
+
+    # annotations are copied from the original function afterwards
+    for parameter in function.args.args:
+        parameter.annotation = None
+
+    compiled = ast.FunctionDef(
+        function.name,
+        function.args,
+        ast.parse(source).body,
+        [],
+        None,
+        None,
+        [],
+    )
+
+    return ast.fix_missing_locations(compiled)
+
+
+def compile[F: collections.abc.Callable[..., object]](function: F) -> F:  # noqa: A001
+    """
+    Compile `function`, if it is structurally recursive on one of
+    its arguments, into a loop over the value of that argument.
+
+    The function must be defined at the top level of a module, and
+    have positional parameters only. Its body must be a `match` on
+    one of them with two cases: `Zero()`, that returns without
+    recursing, and `Succ(m)`, that returns an expression with exactly
+    one recursive call, on `m` and with the other arguments
+    unchanged. The function is returned as is in any other case,
+    including if it is not a plain Python function.
+
+    The compiled function evaluates the cases from `Zero` up, with
+    packed numbers, instead of from the argument down: it must not
+    have side effects for the result to be the same.
+    """
+
+    # checked on a cast so that `function` keeps its type `F`
+    if not inspect.isfunction(typing.cast("object", function)):
+        return function
+
+    try:
+        source = textwrap.dedent(inspect.getsource(function))
+    except (OSError, TypeError):
+        return function
+
+    match ast.parse(source).body:
+        case [ast.FunctionDef() as definition] if (
+            not function.__code__.co_freevars  # pyright: ignore[reportFunctionMemberAccess]
+            and not definition.args.posonlyargs
+            and not definition.args.kwonlyargs
+            and definition.args.vararg is None
+            and definition.args.kwarg is None
+        ):
+            namespace = function.__globals__  # pyright: ignore[reportFunctionMemberAccess]
+            compiled = _compile_function(definition, namespace)
+        case _:
+            return function
+
+    if compiled is None:
+        return function
+
+    helpers = {
+        f"{_PREFIX}Zero": Zero,
+        f"{_PREFIX}Succ": Succ,
+        f"{_PREFIX}range": builtins.range,
+        f"{_PREFIX}to_builtin_int": to_builtin_int,
+        f"{_PREFIX}packed": _packed,
+        f"{_PREFIX}original": function,
+    }
+
+    # the helpers are the parameters of a factory, so that the
+    # compiled function shares the globals of the original one
+    # without adding names to them
+    factory = ast.FunctionDef(
+        f"{_PREFIX}factory",
+        ast.arguments([], [ast.arg(name) for name in helpers], None, [], [], None, []),
+        [compiled, ast.Return(ast.Name(compiled.name, ast.Load()))],
+        [],
+        None,
+        None,
+        [],
+    )
+    module = ast.fix_missing_locations(ast.Module([factory], []))
+    filename = inspect.getsourcefile(function) or "<inductive>"
+    scope: dict[str, typing.Any] = {}
+
+    exec(builtins.compile(module, filename, "exec"), namespace, scope)  # noqa: S102
+
+    result = scope[factory.name](*helpers.values())
+    functools.update_wrapper(result, function)
+
+    return result
@@ -0,0 +1,271 @@
+"""
+# nat.primes
+
+Primality and factorization of natural numbers.
+
+Small numbers are looked up in a sieve of Eratosthenes, which is
+extended one segment at a time as larger numbers are queried, up
+to a configurable bound. Numbers above that bound are tested with
+Miller-Rabin and factorized with Pollard's rho.
+
+Every function takes and returns `Nat`s, but computes on built-in
+`int`s, so none of them runs at unary speed.
+"""
+
+from __future__ import annotations
+
+import itertools
+import math
+import threading
+import typing
+
+import option
+
+from inductive.nat import Nat
+from inductive.nat import _packed  # noqa: PLC2701
+from inductive.nat import to_builtin_int
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import collections.abc
+
+DEFAULT_CACHE_LIMIT: typing.Final = 1 << 22
+"""Default bound of the sieve, that is one byte per number."""
+
+_SEGMENT_SIZE: typing.Final = 1 << 16
+
+# the first 13 primes are enough witnesses for Miller-Rabin to be
+# deterministic below 3.3 * 10**24
+_WITNESSES: typing.Final = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+
+# *- Sieve -* #
+
+
+class _Sieve:
+    def __init__(self, limit: int) -> None:
+        # `flags[k]` is 1 if and only if k is prime, for k < `len(flags)`;
+        # it only grows, so it is read without locking
+        self.flags = bytearray(b"\x00\x00\x01\x01")
+        self.limit = limit
+        self.lock = threading.Lock()
+
+    def extend(self, stop: int) -> None:
+        # ensure that every number below `stop` is sieved
+        if stop <= len(self.flags):
+            return
+
+        with self.lock:
+            self._extend(stop)
+
+    def _extend(self, stop: int) -> None:
+        # another thread may have extended it in the meantime
+        if stop <= len(self.flags):
+            return
+
+        # grow geometrically so that queries on increasing numbers
+        # do not sieve one segment each
+        stop = min(max(stop, 2 * len(self.flags)), self.limit)
+
+        # the primes up to the square root of `stop` come first
+        self._extend(math.isqrt(stop - 1) + 1)
+        start = len(self.flags)
+
+        for low in range(start, stop, _SEGMENT_SIZE):
+            high = min(low + _SEGMENT_SIZE, stop)
+            segment = bytearray(b"\x01") * (high - low)
+
+            for prime in self.primes(math.isqrt(high - 1) + 1):
+                first = max(prime * prime, -(-low // prime) * prime)
+                segment[first - low :: prime] = bytes(
+                    len(range(first - low, high - low, prime)),
+                )
+
+            self.flags += segment
+
+    def primes(self, stop: int) -> collections.abc.Iterator[int]:
+        # primes below `stop`, which must already be sieved
+        return itertools.compress(range(stop), self.flags[:stop])
+
+
+_sieve = _Sieve(DEFAULT_CACHE_LIMIT)
+
+
+def set_cache_limit(limit: Nat) -> None:
+    """
+    Set the bound below which numbers are looked up in the sieve.
+
+    Lowering it discards the part of the sieve above the new bound.
+    """
+
+    value = max(to_builtin_int(limit), 4)
+
+    with _sieve.lock:
+        # replaced rather than truncated, for the readers
+        _sieve.flags = _sieve.flags[:value]
+        _sieve.limit = value
+
+
+# *- Primality -* #
+
+
+def _is_probable_prime(value: int) -> bool:
+    if value < 2:  # noqa: PLR2004
+        return False
+
+    for witness in _WITNESSES:
+        if value % witness == 0:
+            return value == witness
+
+    exponent, twos = value - 1, 0
+
+    while exponent % 2 == 0:
+        exponent, twos = exponent // 2, twos + 1
+
+    for witness in _WITNESSES:
+        x = pow(witness, exponent, value)
+
+        if x in {1, value - 1}:
+            continue
+
+        for _ in range(twos - 1):
+            x = x * x % value
+
+            if x == value - 1:
+                break
+        else:
+            return False
+
+    return True
+
+
+def _is_prime(value: int) -> bool:
+    if value < _sieve.limit:
+        _sieve.extend(value + 1)
+
+    # a snapshot, in case the cache limit is lowered concurrently
+    flags = _sieve.flags
+
+    if value < len(flags):
+        return flags[value] == 1
+
+    return _is_probable_prime(value)
+
+
+def is_prime(n: Nat) -> bool:
+    """
+    Return whether `n` is a prime number.
+
+    Above 3.3 * 10**24, and above the bound of the sieve, this is
+    a strong probable prime test, which no known composite number
+    passes.
+    """
+
+    return _is_prime(to_builtin_int(n))
+
+
+# *- Factorization -* #
+
+
+def _rho(value: int) -> int:
+    # a non-trivial factor of the odd composite `value`, with
+    # Floyd's cycle detection
+    for increment in itertools.count(1):
+        x = y = 2
+        factor = 1
+
+        while factor == 1:
+            x = (x * x + increment) % value
+            y = (y * y + increment) % value
+            y = (y * y + increment) % value
+            factor = math.gcd(abs(x - y), value)
+
+        if factor != value:
+            return factor
+
+    raise AssertionError  # pragma: no cover
+
+
+def _factorize(value: int) -> dict[int, int]:
+    factors: dict[int, int] = {}
+
+    bound = min(math.isqrt(value) + 1, _sieve.limit)
+    _sieve.extend(bound)
+
+    for prime in _sieve.primes(bound):
+        if prime * prime > value:
+            break
+
+        while value % prime == 0:
+            value //= prime
+            factors[prime] = factors.get(prime, 0) + 1
+
+    # what is left has no factor below the bound of the sieve
+    pending = [value] if value > 1 else []
+
+    while pending:
+        current = pending.pop()
+
+        if _is_prime(current):
+            factors[current] = factors.get(current, 0) + 1
+        else:
+            factor = _rho(current)
+            pending.extend((factor, current // factor))
+
+    return dict(sorted(factors.items()))
+
+
+def factorize(n: Nat) -> option.Option[list[tuple[Nat, Nat]]]:
+    """
+    Return the prime factors of `n` in increasing order, with
+    their multiplicities, or `Nothing` if `n` is zero.
+    """
+
+    value = to_builtin_int(n)
+
+    if value == 0:
+        return option.Nothing()
+
+    return option.Some(
+        [
+            (_packed(prime), _packed(multiplicity))
+            for prime, multiplicity in _factorize(value).items()
+        ]
+    )
+
+
+def divisors(n: Nat) -> option.Option[list[Nat]]:
+    """
+    Return the divisors of `n` in increasing order, or `Nothing`
+    if `n` is zero.
+    """
+
+    value = to_builtin_int(n)
+
+    if value == 0:
+        return option.Nothing()
+
+    result = [1]
+
+    for prime, multiplicity in _factorize(value).items():
+        powers = [prime**exponent for exponent in range(1, multiplicity + 1)]
+        result += [divisor * power for divisor in result for power in powers]
+
+    return option.Some([_packed(divisor) for divisor in sorted(result)])
+
+
+def totient(n: Nat) -> Nat:
+    """
+    Return Euler's totient of `n`, the number of integers from 1
+    to `n` that are coprime with `n`.
+
+    By convention, the totient of zero is zero.
+    """
+
+    value = to_builtin_int(n)
+    result = value
+
+    if value > 0:
+        for prime in _factorize(value):
+            result = result // prime * (prime - 1)
+
+    return _packed(result)
@@ -0,0 +1,89 @@
+"""
+# nat.unsafe
+
+Variants of `nat` functions that return their result directly
+instead of wrapping it in an `Option`, for hot paths whose inputs
+are already known to be valid.
+
+⚠️ These functions do NOT check their preconditions. Breaking
+them gives meaningless results instead of an error.
+"""
+
+from __future__ import annotations
+
+from inductive.nat import Nat
+from inductive.nat import Packed
+from inductive.nat import Succ
+from inductive.nat import Zero
+from inductive.nat import _divmod_nonzero  # noqa: PLC2701
+from inductive.nat import to_builtin_int
+
+
+def from_int_unchecked(value: int) -> Nat:
+    """
+    Construct a `Nat` from a built-in `int`, as a chain of `Succ`.
+
+    `value` must not be negative.
+    """
+
+    result: Nat = Zero()
+
+    for _ in range(value):
+        result = Succ(result)
+
+    return result
+
+
+def from_int_packed_unchecked(value: int) -> Nat:
+    """
+    Construct a `Nat` from a built-in `int`, as a `Packed`.
+
+    `value` must not be negative.
+    """
+
+    if value == 0:
+        return Zero()
+
+    return Packed(value)
+
+
+def divmod_nonzero(n: Nat, m: Nat) -> tuple[Nat, Nat]:
+    """
+    Return the quotient and the remainder of `n` divided by `m`.
+
+    `m` must not be zero.
+    """
+
+    if type(n) is not Succ or type(m) is not Succ:
+        quotient, remainder = divmod(to_builtin_int(n), to_builtin_int(m))
+
+        return (
+            from_int_packed_unchecked(quotient),
+            from_int_packed_unchecked(remainder),
+        )
+
+    return _divmod_nonzero(n, m)  # pyright: ignore[reportArgumentType]
+
+
+def div_nonzero(n: Nat, m: Nat) -> Nat:
+    """
+    Return the quotient of `n` divided by `m`.
+
+    `m` must not be zero.
+    """
+
+    quotient, _ = divmod_nonzero(n, m)
+
+    return quotient
+
+
+def mod_nonzero(n: Nat, m: Nat) -> Nat:
+    """
+    Return the remainder of `n` divided by `m`.
+
+    `m` must not be zero.
+    """
+
+    _, remainder = divmod_nonzero(n, m)
+
+    return remainder
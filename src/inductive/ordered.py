@@ -0,0 +1,650 @@
+"""
+# ordered
+
+Persistent ordered containers whose elements are only ever
+ordered through a `Comparator` - by default, their own `.compare()`
+method.
+
+`OrderedMap` and `OrderedSet` are weight-balanced binary search
+trees, and `PairingHeap` is a persistent pairing heap. Every
+"mutating" operation returns a new container and leaves the
+original untouched, sharing as much structure as possible.
+"""
+
+from __future__ import annotations
+
+import typing
+
+import attrs
+import option
+
+from inductive import compare
+from inductive import nat
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import collections.abc
+
+# Parameters of the weight-balanced tree, as proven correct by
+# Hirai & Yamamoto in "Balancing weight-balanced trees" (2011).
+_DELTA: typing.Final = 3
+_RATIO: typing.Final = 2
+
+
+def _compare_with_method[T: compare.SelfComparable](
+    left: T,
+    right: T,
+) -> compare.Compare:
+    return left.compare(right)
+
+
+# typed loosely so that it is a valid default for any element type,
+# which is then expected to be `SelfComparable`
+_DEFAULT_COMPARATOR = typing.cast(
+    "compare.Comparator[typing.Any, typing.Any]",
+    _compare_with_method,
+)
+
+
+# *- Weight-balanced tree -* #
+
+
+@attrs.frozen
+class _Node[K, V]:
+    key: K
+    value: V
+    left: _Node[K, V] | None
+    right: _Node[K, V] | None
+    size: int
+
+
+def _size[K, V](node: _Node[K, V] | None) -> int:
+    return 0 if node is None else node.size
+
+
+def _weight[K, V](node: _Node[K, V] | None) -> int:
+    return _size(node) + 1
+
+
+def _node[K, V](
+    key: K,
+    value: V,
+    left: _Node[K, V] | None,
+    right: _Node[K, V] | None,
+) -> _Node[K, V]:
+    return _Node(key, value, left, right, _size(left) + _size(right) + 1)
+
+
+def _rotate_left[K, V](
+    key: K,
+    value: V,
+    left: _Node[K, V] | None,
+    right: _Node[K, V],
+) -> _Node[K, V]:
+    inner, outer = right.left, right.right
+
+    if inner is None or _weight(inner) < _RATIO * _weight(outer):
+        return _node(right.key, right.value, _node(key, value, left, inner), outer)
+
+    return _node(
+        inner.key,
+        inner.value,
+        _node(key, value, left, inner.left),
+        _node(right.key, right.value, inner.right, outer),
+    )
+
+
+def _rotate_right[K, V](
+    key: K,
+    value: V,
+    left: _Node[K, V],
+    right: _Node[K, V] | None,
+) -> _Node[K, V]:
+    outer, inner = left.left, left.right
+
+    if inner is None or _weight(inner) < _RATIO * _weight(outer):
+        return _node(left.key, left.value, outer, _node(key, value, inner, right))
+
+    return _node(
+        inner.key,
+        inner.value,
+        _node(left.key, left.value, outer, inner.left),
+        _node(key, value, inner.right, right),
+    )
+
+
+def _balance[K, V](
+    key: K,
+    value: V,
+    left: _Node[K, V] | None,
+    right: _Node[K, V] | None,
+) -> _Node[K, V]:
+    if right is not None and _weight(right) > _DELTA * _weight(left):
+        return _rotate_left(key, value, left, right)
+
+    if left is not None and _weight(left) > _DELTA * _weight(right):
+        return _rotate_right(key, value, left, right)
+
+    return _node(key, value, left, right)
+
+
+def _insert[K, V](
+    node: _Node[K, V] | None,
+    key: K,
+    value: V,
+    comparator: compare.Comparator[K, K],
+) -> _Node[K, V]:
+    if node is None:
+        return _Node(key, value, None, None, 1)
+
+    match comparator(key, node.key):
+        case compare.LESS:
+            left = _insert(node.left, key, value, comparator)
+            return _balance(node.key, node.value, left, node.right)
+        case compare.GREATER:
+            right = _insert(node.right, key, value, comparator)
+            return _balance(node.key, node.value, node.left, right)
+        case compare.EQUAL:
+            return _Node(key, value, node.left, node.right, node.size)
+
+
+def _pop_minimum[K, V](
+    node: _Node[K, V],
+) -> tuple[K, V, _Node[K, V] | None]:
+    if node.left is None:
+        return node.key, node.value, node.right
+
+    key, value, left = _pop_minimum(node.left)
+
+    return key, value, _balance(node.key, node.value, left, node.right)
+
+
+def _glue[K, V](
+    left: _Node[K, V] | None,
+    right: _Node[K, V] | None,
+) -> _Node[K, V] | None:
+    if left is None:
+        return right
+
+    if right is None:
+        return left
+
+    key, value, rest = _pop_minimum(right)
+
+    return _balance(key, value, left, rest)
+
+
+def _remove[K, V](
+    node: _Node[K, V] | None,
+    key: K,
+    comparator: compare.Comparator[K, K],
+) -> _Node[K, V] | None:
+    if node is None:
+        return None
+
+    match comparator(key, node.key):
+        case compare.LESS:
+            left = _remove(node.left, key, comparator)
+            if left is node.left:
+                return node
+            return _balance(node.key, node.value, left, node.right)
+        case compare.GREATER:
+            right = _remove(node.right, key, comparator)
+            if right is node.right:
+                return node
+            return _balance(node.key, node.value, node.left, right)
+        case compare.EQUAL:
+            return _glue(node.left, node.right)
+
+
+def _lookup[K, V](
+    node: _Node[K, V] | None,
+    key: K,
+    comparator: compare.Comparator[K, K],
+) -> _Node[K, V] | None:
+    while node is not None:
+        match comparator(key, node.key):
+            case compare.LESS:
+                node = node.left
+            case compare.GREATER:
+                node = node.right
+            case compare.EQUAL:
+                return node
+
+    return None
+
+
+def _traverse[K, V](
+    node: _Node[K, V] | None,
+    start: option.Option[K],
+    stop: option.Option[K],
+    comparator: compare.Comparator[K, K],
+) -> collections.abc.Iterator[_Node[K, V]]:
+    def is_below_start(key: K) -> bool:
+        match start:
+            case option.Nothing():
+                return False
+            case option.Some(low):
+                return comparator(key, low) is compare.LESS
+
+    def is_below_stop(key: K) -> bool:
+        match stop:
+            case option.Nothing():
+                return True
+            case option.Some(high):
+                return comparator(key, high) is compare.LESS
+
+    stack: list[_Node[K, V]] = []
+
+    while stack or node is not None:
+        while node is not None:
+            if is_below_start(node.key):
+                node = node.right
+            else:
+                stack.append(node)
+                node = node.left
+
+        if not stack:
+            return
+
+        current = stack.pop()
+
+        if not is_below_stop(current.key):
+            return
+
+        yield current
+
+        node = current.right
+
+
+@attrs.frozen(eq=False)
+class OrderedMap[K, V]:
+    """
+    A persistent map whose keys are kept sorted according to
+    `comparator`.
+
+    Lookups, insertions and removals are O(log n). Two maps are
+    equal if they have the same entries, whatever the shape of
+    their trees.
+    """
+
+    comparator: compare.Comparator[K, K] = _DEFAULT_COMPARATOR
+    _root: _Node[K, V] | None = attrs.field(default=None, repr=False)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, OrderedMap):
+            return NotImplemented
+
+        return len(self) == len(other) and all(
+            self.comparator(key, other_key) == compare.EQUAL and value == other_value
+            for (key, value), (other_key, other_value) in zip(
+                self.items(),
+                typing.cast("OrderedMap[K, V]", other).items(),
+                strict=True,
+            )
+        )
+
+    __hash__ = None  # pyright: ignore[reportAssignmentType]
+
+    def __len__(self) -> int:
+        return _size(self._root)
+
+    def __contains__(self, key: K) -> bool:
+        return _lookup(self._root, key, self.comparator) is not None
+
+    def __iter__(self) -> collections.abc.Iterator[K]:
+        for node in _traverse(
+            self._root,
+            option.Nothing(),
+            option.Nothing(),
+            self.comparator,
+        ):
+            yield node.key
+
+    def length(self) -> nat.Nat:
+        """
+        Return the number of entries of the map.
+        """
+
+        return nat.from_builtin_int_packed_exn(_size(self._root))
+
+    def get(self, key: K) -> option.Option[V]:
+        """
+        Return the value associated to `key`, or `Nothing` if
+        there is none.
+        """
+
+        node = _lookup(self._root, key, self.comparator)
+
+        if node is None:
+            return option.Nothing()
+
+        return option.Some(node.value)
+
+    def insert(self, key: K, value: V) -> OrderedMap[K, V]:
+        """
+        Return a new map where `key` is associated to `value`.
+        """
+
+        return attrs.evolve(
+            self,
+            root=_insert(self._root, key, value, self.comparator),
+        )
+
+    def remove(self, key: K) -> OrderedMap[K, V]:
+        """
+        Return a new map without `key`.
+
+        If the key is not in the map, the map itself is returned.
+        """
+
+        root = _remove(self._root, key, self.comparator)
+
+        if root is self._root:
+            return self
+
+        return attrs.evolve(self, root=root)
+
+    def minimum(self) -> option.Option[tuple[K, V]]:
+        """
+        Return the entry with the smallest key, or `Nothing` if
+        the map is empty.
+        """
+
+        node = self._root
+
+        if node is None:
+            return option.Nothing()
+
+        while node.left is not None:
+            node = node.left
+
+        return option.Some((node.key, node.value))
+
+    def maximum(self) -> option.Option[tuple[K, V]]:
+        """
+        Return the entry with the greatest key, or `Nothing` if
+        the map is empty.
+        """
+
+        node = self._root
+
+        if node is None:
+            return option.Nothing()
+
+        while node.right is not None:
+            node = node.right
+
+        return option.Some((node.key, node.value))
+
+    def items(self) -> collections.abc.Iterator[tuple[K, V]]:
+        """
+        Iterate over the entries of the map in ascending key order.
+        """
+
+        return self.range()
+
+    def values(self) -> collections.abc.Iterator[V]:
+        """
+        Iterate over the values of the map in ascending key order.
+        """
+
+        for _, value in self.items():
+            yield value
+
+    def range(
+        self,
+        start: option.Option[K] = option.Nothing(),  # noqa: B008
+        stop: option.Option[K] = option.Nothing(),  # noqa: B008
+    ) -> collections.abc.Iterator[tuple[K, V]]:
+        """
+        Iterate in ascending order over the entries whose key is
+        greater than or equal to `start` and strictly less than
+        `stop`. A missing bound is unbounded.
+        """
+
+        for node in _traverse(self._root, start, stop, self.comparator):
+            yield node.key, node.value
+
+
+@attrs.frozen(eq=False)
+class OrderedSet[T]:
+    """
+    A persistent set whose elements are kept sorted according to
+    `comparator`.
+
+    Membership tests, insertions and removals are O(log n). Two
+    sets are equal if they have the same elements, whatever the
+    shape of their trees.
+    """
+
+    comparator: compare.Comparator[T, T] = _DEFAULT_COMPARATOR
+    _map: OrderedMap[T, None] = attrs.field(
+        default=attrs.Factory(
+            lambda self: OrderedMap(self.comparator),
+            takes_self=True,
+        ),
+        repr=False,
+    )
+
+    def __len__(self) -> int:
+        return len(self._map)
+
+    def __contains__(self, element: T) -> bool:
+        return element in self._map
+
+    def __iter__(self) -> collections.abc.Iterator[T]:
+        return iter(self._map)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, OrderedSet):
+            return NotImplemented
+
+        return self._map == other._map  # noqa: SLF001  # pyright: ignore[reportUnknownMemberType]
+
+    __hash__ = None  # pyright: ignore[reportAssignmentType]
+
+    def length(self) -> nat.Nat:
+        """
+        Return the number of elements of the set.
+        """
+
+        return self._map.length()
+
+    def add(self, element: T) -> OrderedSet[T]:
+        """
+        Return a new set that also contains `element`.
+        """
+
+        return attrs.evolve(self, map=self._map.insert(element, None))
+
+    def remove(self, element: T) -> OrderedSet[T]:
+        """
+        Return a new set without `element`.
+
+        If the element is not in the set, the set itself is
+        returned.
+        """
+
+        new_map = self._map.remove(element)
+
+        if new_map is self._map:
+            return self
+
+        return attrs.evolve(self, map=new_map)
+
+    def minimum(self) -> option.Option[T]:
+        """
+        Return the smallest element, or `Nothing` if the set is
+        empty.
+        """
+
+        match self._map.minimum():
+            case option.Nothing():
+                return option.Nothing()
+            case option.Some((element, _)):
+                return option.Some(element)
+
+    def maximum(self) -> option.Option[T]:
+        """
+        Return the greatest element, or `Nothing` if the set is
+        empty.
+        """
+
+        match self._map.maximum():
+            case option.Nothing():
+                return option.Nothing()
+            case option.Some((element, _)):
+                return option.Some(element)
+
+    def range(
+        self,
+        start: option.Option[T] = option.Nothing(),  # noqa: B008
+        stop: option.Option[T] = option.Nothing(),  # noqa: B008
+    ) -> collections.abc.Iterator[T]:
+        """
+        Iterate in ascending order over the elements that are
+        greater than or equal to `start` and strictly less than
+        `stop`. A missing bound is unbounded.
+        """
+
+        for element, _ in self._map.range(start, stop):
+            yield element
+
+
+# *- Pairing heap -* #
+
+
+@attrs.frozen
+class _Tree[T]:
+    element: T
+    # cons list of subtrees, so that linking is O(1)
+    children: tuple[_Tree[T], typing.Any] | None
+
+
+def _link[T](
+    first: _Tree[T],
+    second: _Tree[T],
+    comparator: compare.Comparator[T, T],
+) -> _Tree[T]:
+    if comparator(second.element, first.element) is compare.LESS:
+        first, second = second, first
+
+    return _Tree(first.element, (second, first.children))
+
+
+def _merge_pairs[T](
+    children: tuple[_Tree[T], typing.Any] | None,
+    comparator: compare.Comparator[T, T],
+) -> _Tree[T] | None:
+    pairs: list[_Tree[T]] = []
+
+    while children is not None:
+        first, children = children
+
+        if children is None:
+            pairs.append(first)
+            break
+
+        second, children = children
+        pairs.append(_link(first, second, comparator))
+
+    if not pairs:
+        return None
+
+    result = pairs.pop()
+
+    while pairs:
+        result = _link(pairs.pop(), result, comparator)
+
+    return result
+
+
+@attrs.frozen(eq=False)
+class PairingHeap[T]:
+    """
+    A persistent min-heap ordered according to `comparator`.
+
+    Insertion, merging and peeking are O(1), and popping is
+    O(log n) amortized. Heaps are compared by identity, as the
+    same elements can be arranged in many ways.
+    """
+
+    comparator: compare.Comparator[T, T] = _DEFAULT_COMPARATOR
+    _root: _Tree[T] | None = attrs.field(default=None, repr=False)
+    _size: int = attrs.field(default=0, repr=False)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def length(self) -> nat.Nat:
+        """
+        Return the number of elements of the heap.
+        """
+
+        return nat.from_builtin_int_packed_exn(self._size)
+
+    def push(self, element: T) -> PairingHeap[T]:
+        """
+        Return a new heap that also contains `element`.
+        """
+
+        return self._merge_tree(_Tree(element, None), 1)
+
+    def merge(self, other: PairingHeap[T]) -> PairingHeap[T]:
+        """
+        Return a new heap containing the elements of both heaps.
+
+        The comparator of `self` is used.
+        """
+
+        if other._root is None:  # noqa: SLF001
+            return self
+
+        return self._merge_tree(other._root, other._size)  # noqa: SLF001
+
+    def peek(self) -> option.Option[T]:
+        """
+        Return the smallest element, or `Nothing` if the heap is
+        empty.
+        """
+
+        if self._root is None:
+            return option.Nothing()
+
+        return option.Some(self._root.element)
+
+    def pop(self) -> option.Option[tuple[T, PairingHeap[T]]]:
+        """
+        Return the smallest element along with the heap of the
+        remaining ones, or `Nothing` if the heap is empty.
+        """
+
+        if self._root is None:
+            return option.Nothing()
+
+        rest = attrs.evolve(
+            self,
+            root=_merge_pairs(self._root.children, self.comparator),
+            size=self._size - 1,
+        )
+
+        return option.Some((self._root.element, rest))
+
+    def drain(self) -> collections.abc.Iterator[T]:
+        """
+        Iterate over the elements of the heap in ascending order.
+        """
+
+        heap = self
+
+        while True:
+            match heap.pop():
+                case option.Nothing():
+                    return
+                case option.Some((element, heap)):
+                    yield element
+
+    def _merge_tree(self, tree: _Tree[T], size: int) -> PairingHeap[T]:
+        root = tree if self._root is None else _link(self._root, tree, self.comparator)
+
+        return attrs.evolve(self, root=root, size=self._size + size)
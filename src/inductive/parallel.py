@@ -0,0 +1,196 @@
+"""
+# parallel
+
+Process-parallel `map` and `starmap` over natural numbers.
+
+Sending `Succ` chains to worker processes would pickle them node
+by node. Instead, arguments and results travel through
+`multiprocessing.shared_memory` as fixed-width little-endian
+integers, and are rebuilt on the other side as `Packed` numbers.
+
+Functions must be picklable, that is, defined at the top level of
+a module.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import typing
+from multiprocessing import shared_memory
+
+from inductive import nat
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import collections.abc
+
+_DEFAULT_CHUNKSIZE: typing.Final = 1024
+
+
+def _buffer(block: shared_memory.SharedMemory) -> memoryview:
+    # `buf` is only `None` once the block is closed
+    return typing.cast("memoryview", block.buf)
+
+
+def _encode(values: list[int]) -> tuple[shared_memory.SharedMemory, int]:
+    width = max(1, (max(values, default=0).bit_length() + 7) // 8)
+    data = b"".join(value.to_bytes(width, "little") for value in values)
+    block = shared_memory.SharedMemory(create=True, size=max(1, len(data)))
+    _buffer(block)[: len(data)] = data
+
+    return block, width
+
+
+def _decode(
+    block: shared_memory.SharedMemory,
+    width: int,
+    start: int,
+    count: int,
+) -> list[int]:
+    buffer = _buffer(block)
+
+    return [
+        int.from_bytes(buffer[offset : offset + width], "little")
+        for offset in range(start * width, (start + count) * width, width)
+    ]
+
+
+def _run_chunk(
+    function: collections.abc.Callable[..., nat.Nat],
+    name: str,
+    width: int,
+    arity: int,
+    start: int,
+    count: int,
+) -> tuple[str, int, int]:
+    block = shared_memory.SharedMemory(name=name)
+
+    try:
+        values = _decode(block, width, start * arity, count * arity)
+    finally:
+        block.close()
+
+    arguments = [nat.from_builtin_int_packed_exn(value) for value in values]
+    results = [
+        nat.to_builtin_int(function(*arguments[index : index + arity]))
+        for index in range(0, len(arguments), arity)
+    ]
+
+    result_block, result_width = _encode(results)
+    result_block.close()
+
+    return result_block.name, result_width, len(results)
+
+
+def _collect(name: str, width: int, count: int) -> list[nat.Nat]:
+    block = shared_memory.SharedMemory(name=name)
+
+    try:
+        return [
+            nat.from_builtin_int_packed_exn(value)
+            for value in _decode(block, width, 0, count)
+        ]
+    finally:
+        block.close()
+        block.unlink()
+
+
+def _discard(
+    futures: collections.abc.Sequence[concurrent.futures.Future[tuple[str, int, int]]],
+) -> None:
+    # unlink the result blocks of chunks that will not be collected
+    for future in futures:
+        future.cancel()
+
+    concurrent.futures.wait(futures)
+
+    for future in futures:
+        if not future.cancelled() and future.exception() is None:
+            name, _, _ = future.result()
+            block = shared_memory.SharedMemory(name=name)
+            block.close()
+            block.unlink()
+
+
+def starmap(
+    function: collections.abc.Callable[..., nat.Nat],
+    iterable: collections.abc.Iterable[tuple[nat.Nat, ...]],
+    *,
+    max_workers: int | None = None,
+    chunksize: int = _DEFAULT_CHUNKSIZE,
+) -> list[nat.Nat]:
+    """
+    Return `[function(*arguments) for arguments in iterable]`,
+    computed by a pool of worker processes.
+
+    Every tuple of `iterable` must have the same length. Results
+    are `Packed` numbers.
+    """
+
+    rows = list(iterable)
+
+    if not rows:
+        return []
+
+    arity = len(rows[0])
+
+    if any(len(row) != arity for row in rows):
+        message = "all argument tuples must have the same length"
+        raise ValueError(message)
+
+    block, width = _encode(
+        [nat.to_builtin_int(argument) for row in rows for argument in row]
+    )
+
+    try:
+        with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+            futures = [
+                executor.submit(
+                    _run_chunk,
+                    function,
+                    block.name,
+                    width,
+                    arity,
+                    start,
+                    min(chunksize, len(rows) - start),
+                )
+                for start in range(0, len(rows), chunksize)
+            ]
+
+            results: list[nat.Nat] = []
+            collected = 0
+
+            try:
+                for future in futures:
+                    chunk = future.result()
+                    collected += 1
+                    results.extend(_collect(*chunk))
+            finally:
+                _discard(futures[collected:])
+    finally:
+        block.close()
+        block.unlink()
+
+    return results
+
+
+def map(  # noqa: A001
+    function: collections.abc.Callable[..., nat.Nat],
+    *iterables: collections.abc.Iterable[nat.Nat],
+    max_workers: int | None = None,
+    chunksize: int = _DEFAULT_CHUNKSIZE,
+) -> list[nat.Nat]:
+    """
+    Return `function` applied to the elements of `iterables`,
+    computed by a pool of worker processes. It is like the
+    built-in `map`, except that it stops at the shortest iterable
+    and returns a list.
+
+    Results are `Packed` numbers.
+    """
+
+    return starmap(
+        function,
+        zip(*iterables),
+        max_workers=max_workers,
+        chunksize=chunksize,
+    )
@@ -0,0 +1,110 @@
+"""
+# recursion
+
+Deep recursion without the call stack.
+
+Functions decorated with `trampoline` are written as generators
+that `yield` their recursive calls instead of making them:
+
+    @trampoline
+    def length(n: Nat) -> Generator[object, int, int]:
+        match n:
+            case Zero():
+                return 0
+            case Succ(m):
+                return 1 + (yield length(m))
+
+The calls are then run one after the other on a list, so the depth
+of the recursion is only bounded by memory, whatever the recursion
+limit and the size of the C stack. Trampolined functions can call
+each other, which makes mutual recursion possible.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import types
+import typing
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import collections.abc
+
+# whether a trampoline is running on the current thread
+_state = threading.local()
+
+
+def _run[R](call: collections.abc.Generator[object, object, R]) -> R:
+    stack: list[collections.abc.Generator[object, object, object]] = [call]
+    value: object = None
+    error: BaseException | None = None
+
+    while True:
+        top = stack[-1]
+
+        try:
+            if error is None:
+                pending = top.send(value)
+            else:
+                pending, error = top.throw(error), None
+        except StopIteration as stop:
+            stack.pop()
+
+            if not stack:
+                return typing.cast("R", stop.value)
+
+            value = stop.value
+            continue
+        except BaseException as exception:
+            stack.pop()
+
+            if not stack:
+                raise
+
+            # raised in the caller, where it can be caught
+            error = exception
+            continue
+
+        if not isinstance(pending, types.GeneratorType):
+            message = f"trampolined functions must yield calls, not {pending!r}"
+            error = TypeError(message)
+            continue
+
+        stack.append(
+            typing.cast("collections.abc.Generator[object, object, object]", pending)
+        )
+        value = None
+
+
+def trampoline[**P, R](
+    function: collections.abc.Callable[
+        P, collections.abc.Generator[object, typing.Any, R]
+    ],
+) -> collections.abc.Callable[P, R]:
+    """
+    Run `function`, a generator that yields its recursive calls, on
+    a stack allocated on the heap.
+
+    Called from outside of any trampolined function, it returns the
+    result. Called from inside one, it returns the pending call,
+    which must be yielded to get its result: `(yield f(m))`.
+
+    Exceptions propagate from callee to caller as with ordinary
+    calls.
+    """
+
+    @functools.wraps(function)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        call = function(*args, **kwargs)
+
+        if getattr(_state, "active", False):
+            return typing.cast("R", call)
+
+        _state.active = True
+
+        try:
+            return _run(call)
+        finally:
+            _state.active = False
+
+    return wrapper
@@ -0,0 +1,124 @@
+"""
+# testing
+
+Hypothesis strategies that generate natural numbers.
+
+Numbers are drawn as built-in `int`s and then constructed in one
+go, so generation is fast, shrinks towards zero, and covers sizes
+evenly instead of relying on `strategies.recursive`.
+
+This module requires `hypothesis`, which is available through the
+`testing` extra.
+"""
+
+from __future__ import annotations
+
+import typing
+
+from hypothesis import strategies
+
+from inductive import nat
+
+DEFAULT_MAX_VALUE: typing.Final = 256
+"""
+Upper bound of the generated numbers when none is given.
+"""
+
+DEFAULT_BUCKETS: typing.Final = (16, 256, 4096)
+"""
+Upper bounds of the size buckets of `sized_nats` when none are
+given.
+"""
+
+
+def zeros() -> strategies.SearchStrategy[nat.Zero]:
+    """
+    Generate `Zero`.
+    """
+
+    return strategies.just(nat.Zero())
+
+
+def succs[N: nat.Nat](
+    strategy: strategies.SearchStrategy[N],
+) -> strategies.SearchStrategy[nat.Succ[N]]:
+    """
+    Generate the successors of the numbers generated by
+    `strategy`.
+    """
+
+    return strategy.map(nat.Succ)
+
+
+def nats(
+    min_value: int = 0,
+    max_value: int = DEFAULT_MAX_VALUE,
+    *,
+    packed: bool = False,
+) -> strategies.SearchStrategy[nat.Nat]:
+    """
+    Generate natural numbers between `min_value` and `max_value`
+    included.
+
+    If `packed` is true, numbers are `Packed` instead of chains
+    of `Succ`, so `max_value` can be arbitrarily large.
+    """
+
+    if min_value < 0:
+        message = "min_value must not be negative"
+        raise ValueError(message)
+
+    constructor = (
+        nat.from_builtin_int_packed_exn if packed else nat.from_builtin_int_exn
+    )
+
+    return strategies.integers(min_value, max_value).map(constructor)
+
+
+def nonzero_nats(
+    max_value: int = DEFAULT_MAX_VALUE,
+    *,
+    packed: bool = False,
+) -> strategies.SearchStrategy[nat.Nat]:
+    """
+    Generate natural numbers between 1 and `max_value` included.
+    """
+
+    return nats(1, max_value, packed=packed)
+
+
+def sized_nats(
+    buckets: tuple[int, ...] = DEFAULT_BUCKETS,
+    *,
+    min_value: int = 0,
+    packed: bool = False,
+) -> strategies.SearchStrategy[nat.Nat]:
+    """
+    Generate natural numbers from `min_value` up to the last
+    bucket bound, picking a size bucket first so that large
+    numbers are as likely as small ones.
+
+    With the default buckets, numbers are as often in [0, 16] as
+    in ]16, 256] and in ]256, 4096]. Buckets below `min_value` are
+    skipped.
+
+    Raises
+    ------
+    ValueError
+        If `min_value` is above the last bucket bound.
+    """
+
+    lower_bounds = (min_value, *(max(min_value, bound + 1) for bound in buckets))
+    bounds = [
+        (lower, upper)
+        for lower, upper in zip(lower_bounds, buckets, strict=False)
+        if lower <= upper
+    ]
+
+    if not bounds:
+        message = "min_value must not be above the last bucket bound"
+        raise ValueError(message)
+
+    return strategies.one_of(
+        [nats(lower, upper, packed=packed) for lower, upper in bounds]
+    )
@@ -0,0 +1,130 @@
+"""
+# vector
+
+Length-indexed sequences.
+
+`Vector[N, T]` is a sequence of exactly `N` elements of type `T`.
+Unlike a cons list, it is backed by a tuple, so its length and
+its elements are available in O(1).
+"""
+
+from __future__ import annotations
+
+import typing
+
+import attrs
+import option
+
+from inductive import nat
+
+if typing.TYPE_CHECKING:  # pragma: no cover
+    import collections.abc
+
+    from inductive.fin import Fin
+
+
+@attrs.frozen
+class Vector[N: nat.Nat, T]:
+    """
+    A sequence of exactly `N` elements of type `T`.
+
+    Use `Vector.empty` or `Vector.from_iterable` to construct one.
+    """
+
+    _elements: tuple[T, ...]
+    _length: N = attrs.field(init=False, eq=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        length = nat.from_builtin_int_packed_exn(len(self._elements))
+        object.__setattr__(self, "_length", length)
+
+    @classmethod
+    def empty(cls) -> Vector[nat.Zero, T]:
+        """
+        Return the vector of length 0.
+        """
+
+        return Vector(())
+
+    @classmethod
+    def from_iterable(
+        cls,
+        iterable: collections.abc.Iterable[T],
+    ) -> Vector[nat.Nat, T]:
+        """
+        Return a vector of the elements of `iterable`.
+        """
+
+        return Vector(tuple(iterable))
+
+    def __len__(self) -> int:
+        return len(self._elements)
+
+    def __iter__(self) -> collections.abc.Iterator[T]:
+        return iter(self._elements)
+
+    def __getitem__(self, index: Fin[N]) -> T:
+        if index.bound() != self._length:
+            message = "index must be bounded by the length of the vector"
+            raise IndexError(message)
+
+        return self._elements[index]
+
+    def length(self) -> N:
+        """
+        Return the length of the vector.
+
+        It is computed once, when the vector is constructed.
+        """
+
+        return self._length
+
+    def index(self, index: nat.Nat) -> option.Option[T]:
+        """
+        Return the element at `index`, or `Nothing` if it is out
+        of bounds.
+        """
+
+        position = nat.to_builtin_int(index)
+
+        if position >= len(self._elements):
+            return option.Nothing()
+
+        return option.Some(self._elements[position])
+
+    def append(self, element: T) -> Vector[nat.Succ[N], T]:
+        """
+        Return a new vector with `element` added at the end.
+        """
+
+        return Vector((*self._elements, element))
+
+    def concat[M: nat.Nat](self, other: Vector[M, T]) -> Vector[nat.Nat, T]:
+        """
+        Return a new vector with the elements of `self` followed
+        by the ones of `other`.
+        """
+
+        return Vector(self._elements + other._elements)  # noqa: SLF001
+
+    def zip[U](self, other: Vector[N, U]) -> Vector[N, tuple[T, U]]:
+        """
+        Return a vector of the pairs of elements of `self` and
+        `other` at the same index.
+
+        Raises
+        ------
+        ValueError
+            If the vectors have different lengths.
+        """
+
+        pairs = zip(self._elements, other._elements, strict=True)  # noqa: SLF001
+
+        return Vector(tuple(pairs))
+
+    def map[U](self, function: collections.abc.Callable[[T], U]) -> Vector[N, U]:
+        """
+        Return a vector of `function` applied to each element.
+        """
+
+        return Vector(tuple(map(function, self._elements)))
@@ -0,0 +1,76 @@
+# ruff: noqa: PGH004
+# ruff: noqa
+
+from __future__ import annotations
+
+from hypothesis import given
+from hypothesis import strategies
+import option
+from .strategies import nats
+
+from inductive import builtins
+from inductive import nat
+
+
+# ∀l : list, length(l) == len(l)
+@given(strategies.lists(strategies.integers()))
+def test_length(values: list[int]) -> None:
+    assert int(builtins.length(values)) == len(values)
+
+
+# ∀l : list, ∀x, count(l, x) == l.count(x)
+@given(strategies.lists(strategies.integers(0, 5)), strategies.integers(0, 5))
+def test_count(values: list[int], value: int) -> None:
+    assert int(builtins.count(values, value)) == values.count(value)
+    assert int(builtins.count(tuple(values), value)) == values.count(value)
+
+
+# count and index work on substrings of str and bytes
+def test_str_bytes() -> None:
+    assert builtins.count("abcabcab", "ab") == nat.three
+    assert builtins.count(b"aaaa", b"aa") == nat.two
+    assert builtins.index("abcabc", "ca") == option.Some(nat.two)
+    assert builtins.index(b"abc", b"d") == option.Nothing()
+
+
+# ∀l : list, ∀x, index(l, x) == Some(l.index(x)) if x ∈ l else Nothing
+@given(strategies.lists(strategies.integers(0, 5)), strategies.integers(0, 5))
+def test_index(values: list[int], value: int) -> None:
+    expected = (
+        option.Some(nat.from_builtin_int_exn(values.index(value)))
+        if value in values
+        else option.Nothing()
+    )
+
+    assert builtins.index(values, value) == expected
+
+
+# ∀l : list Nat, sum(l) == Σ l
+@given(strategies.lists(nats), nats)
+def test_sum(values: list[nat.Nat], start: nat.Nat) -> None:
+    assert int(builtins.sum(values)) == sum(int(n) for n in values)
+    assert int(builtins.sum(values, start)) == sum((int(n) for n in values), int(start))
+
+
+# ∀k : int, abs(k) == |k|
+@given(strategies.integers())
+def test_abs(k: int) -> None:
+    assert int(builtins.abs(k)) == abs(k)
+
+
+# range and enumerate are the ones of nat
+def test_range_enumerate() -> None:
+    assert list(builtins.range(nat.three)) == [nat.zero, nat.one, nat.two]
+    assert list(builtins.enumerate("ab")) == [(nat.zero, "a"), (nat.one, "b")]
+
+
+# the lengths and indices they return are packed, whatever their size
+def test_packed_results() -> None:
+    big = nat.from_builtin_int_packed_exn(10**12)
+
+    assert isinstance(builtins.range(big).length(), nat.Packed)
+    assert int(builtins.range(big).length()) == 10**12
+    assert isinstance(builtins.enumerate("abc").length(), nat.Packed)
+    assert isinstance(builtins.length("abc"), nat.Packed)
+    assert nat.argmax([nat.zero, nat.two, nat.one]) == option.Some(nat.one)
+    assert isinstance(nat.argmax([nat.zero, nat.two]).unwrap(), nat.Packed)
@@ -0,0 +1,44 @@
+# ruff: noqa: PGH004
+# ruff: noqa
+
+from __future__ import annotations
+
+import sys
+import threading
+
+from inductive import config
+
+
+# nested setups are undone by the last teardown only
+def test_nested_setup() -> None:
+    limit = sys.getrecursionlimit()
+
+    config.setup()
+    config.setup()
+    config.teardown()
+    assert sys.getrecursionlimit() > limit
+
+    config.teardown()
+    assert sys.getrecursionlimit() == limit
+
+
+# concurrent contexts keep the configuration until the last one exits
+def test_concurrent_contexts() -> None:
+    limit = sys.getrecursionlimit()
+    barrier = threading.Barrier(8)
+    limits: list[int] = []
+
+    def work() -> None:
+        with config.context():
+            barrier.wait()
+            limits.append(sys.getrecursionlimit())
+            barrier.wait()
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(value > limit for value in limits)
+    assert sys.getrecursionlimit() == limit
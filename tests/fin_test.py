@@ -0,0 +1,87 @@
+# ruff: noqa: PGH004
+# ruff: noqa
+
+from __future__ import annotations
+
+from hypothesis import given
+from hypothesis import strategies
+import option
+from .strategies import nats, nonzero_nats
+
+from inductive import compare
+from inductive import nat
+from inductive.fin import Fin
+
+
+bounds = strategies.integers(1, 100).map(nat.from_builtin_int_packed_exn)
+values = strategies.integers(0, 1_000).map(nat.from_builtin_int_packed_exn)
+
+
+def wrap(value: nat.Nat, bound: nat.Nat) -> Fin[nat.Nat]:
+    match Fin.wrap(value, bound):
+        case option.Nothing():
+            raise AssertionError
+        case option.Some(result):
+            return result
+
+
+# ∀n m : Nat, Fin.of(n, m) is Some <-> n < m
+@given(nats, nats)
+def test_of(n: nat.Nat, m: nat.Nat) -> None:
+    match Fin.of(n, m):
+        case option.Nothing():
+            assert n >= m
+        case option.Some(fin):
+            assert n < m
+            assert fin.to_nat() == n
+            assert fin.bound() == m
+
+
+# ∀n : Nat, Fin.wrap(n, 0) == Nothing()
+@given(nats)
+def test_wrap_zero(n: nat.Nat) -> None:
+    assert Fin.wrap(n, nat.zero) == option.Nothing()
+
+
+# ∀n m : Nat, m != 0 -> Fin.wrap(n, m).to_nat() == n % m
+@given(nats, nonzero_nats)
+def test_wrap_mod(n: nat.Nat, m: nat.Nat) -> None:
+    assert wrap(n, m).to_nat() == n % m
+
+
+# modular arithmetic agrees with int arithmetic
+@given(values, values, bounds)
+def test_arithmetic(n: nat.Nat, m: nat.Nat, bound: nat.Nat) -> None:
+    left, right = wrap(n, bound), wrap(m, bound)
+    modulus = int(bound)
+
+    assert int(left + right) == (int(n) + int(m)) % modulus
+    assert int(left - right) == (int(n) - int(m)) % modulus
+    assert int(left * right) == (int(n) * int(m)) % modulus
+    assert int(-left) == -int(n) % modulus
+
+
+# ∀f : Fin, range(bound)[f] == int(f)
+@given(values, bounds)
+def test_index(n: nat.Nat, bound: nat.Nat) -> None:
+    fin = wrap(n, bound)
+
+    assert list(range(int(bound)))[fin] == int(fin)
+
+
+# numbers of different bounds cannot be mixed
+def test_different_bounds() -> None:
+    try:
+        wrap(nat.one, nat.two) + wrap(nat.one, nat.three)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError
+
+
+# compare agrees with the order of the values
+@given(values, values, bounds)
+def test_compare(n: nat.Nat, m: nat.Nat, bound: nat.Nat) -> None:
+    left, right = wrap(n, bound), wrap(m, bound)
+
+    assert left.compare(right) == left.to_nat().compare(right.to_nat())
@@ -0,0 +1,81 @@
+# ruff: noqa: PGH004
+# ruff: noqa
+
+from __future__ import annotations
+
+import pathlib
+import tempfile
+
+from hypothesis import given
+from hypothesis import strategies
+
+from inductive import io
+from inductive import nat
+
+
+numbers = strategies.lists(
+    strategies.integers(0, 2**80).map(nat.from_builtin_int_packed_exn),
+)
+
+
+# ∀l : list Nat, open_column(write_column(l)) == l
+@given(numbers)
+def test_write_open_column(values: list[nat.Nat]) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = pathlib.Path(directory) / "column.inat"
+        io.write_column(path, values)
+
+        with io.open_column(path) as column:
+            assert len(column) == len(values)
+            assert column.length() == nat.length_of(values)
+            assert list(column) == values
+            assert column[1:3] == values[1:3]
+
+            if values:
+                assert column[-1] == values[-1]
+
+            view = column.ints()
+            assert list(view) == [int(value) for value in values]
+            del view
+
+
+# unary numbers are written as their value
+def test_write_unary() -> None:
+    values = [nat.zero, nat.one, nat.ten]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = pathlib.Path(directory) / "column.inat"
+        io.write_column(path, values)
+
+        with io.open_column(path) as column:
+            assert list(column) == values
+            assert bytes(column.ints()) == b"\x00\x01\x0a"
+
+
+# out-of-range indices raise IndexError
+def test_index_error() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = pathlib.Path(directory) / "column.inat"
+        io.write_column(path, [nat.one])
+
+        with io.open_column(path) as column:
+            try:
+                column[1]
+            except IndexError:
+                pass
+            else:
+                raise AssertionError
+
+
+# files that are not columns raise ValueError
+def test_invalid_file() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = pathlib.Path(directory) / "column.inat"
+        path.write_bytes(b"not a column file at all")
+
+        try:
+            io.open_column(path)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError
@@ -0,0 +1,127 @@
+# ruff: noqa: PGH004
+# ruff: noqa
+
+from __future__ import annotations
+
+import gc
+import sys
+import threading
+import weakref
+
+from hypothesis import given
+from .strategies import nats
+
+from inductive import memory
+from inductive import nat
+
+
+# ∀n : Nat, footprint(n) counts int(n) Succ nodes, their sizes and one Zero
+@given(nats)
+def test_footprint_chain(n: nat.Nat) -> None:
+    result = memory.footprint(n)
+    sizes = range(1, int(n) + 1)
+
+    assert result.nodes == 2 * int(n) + 1
+    assert result.shared == 0
+    assert result.size == sys.getsizeof(nat.zero) + sum(
+        sys.getsizeof(nat.one) + sys.getsizeof(size) for size in sizes
+    )
+
+
+# ∀n : Nat, (n, Succ(n)) shares all the nodes of n
+@given(nats)
+def test_footprint_shared(n: nat.Nat) -> None:
+    result = memory.footprint((n, nat.Succ(n)))
+
+    assert result.nodes == 2 * int(n) + 4
+    assert result.shared == 1
+
+
+# deep numbers do not hit the recursion limit
+def test_footprint_deep() -> None:
+    n = nat.from_builtin_int_exn(100_000)
+
+    assert memory.footprint(n).nodes == 200_001
+
+
+# packed numbers are not unfolded
+def test_footprint_packed() -> None:
+    n = nat.from_builtin_int_packed_exn(10**30)
+
+    assert memory.footprint(n).nodes == 2
+
+
+# census sees newly created numbers
+def test_census() -> None:
+    before = memory.census()
+    n = nat.from_builtin_int_exn(1_000)
+    packed = nat.from_builtin_int_packed_exn(1_000)
+    after = memory.census()
+
+    assert after.succs - before.succs >= 1_000
+    assert after.packed - before.packed >= 1
+    assert after.size > before.size
+
+    del n, packed
+
+
+# census counts runs apart from plain nodes
+def test_census_runs() -> None:
+    before = memory.census()
+    run = nat.lift(nat.zero, nat.from_builtin_int_packed_exn(10**9))
+    after = memory.census()
+
+    assert after.runs - before.runs == 1
+    assert after.succs - before.succs < 1_000
+
+    del run
+
+
+# reclaimed numbers are eventually freed, whole
+def test_reclaim() -> None:
+    n = nat.from_builtin_int_exn(50_000)
+    middle = n
+    for _ in range(25_000):
+        middle = middle.predecessor
+    top, middle = weakref.ref(n), weakref.ref(middle)
+
+    memory.reclaim(n, batch_size=1_000)
+    del n
+    memory.wait_reclaimed()
+
+    assert top() is None
+    assert middle() is None
+
+
+# runs are not unfolded by the reclaimer
+def test_reclaim_run() -> None:
+    memory.reclaim(nat.lift(nat.zero, nat.from_builtin_int_packed_exn(10**9)))
+
+    thread = threading.Thread(target=memory.wait_reclaimed, daemon=True)
+    thread.start()
+    thread.join(timeout=10)
+
+    assert not thread.is_alive()
+
+
+# numbers still referenced elsewhere are not freed
+def test_reclaim_shared() -> None:
+    n = nat.from_builtin_int_exn(1_000)
+
+    memory.reclaim(nat.Succ(n), batch_size=10)
+    memory.wait_reclaimed()
+
+    assert nat.to_builtin_int(n) == 1_000
+
+
+# frozen numbers are not scanned by the garbage collector
+def test_freeze() -> None:
+    n = nat.from_builtin_int_exn(1_000)
+
+    memory.freeze()
+    try:
+        assert gc.get_freeze_count() >= 1_000
+    finally:
+        memory.unfreeze()
+
+    del n
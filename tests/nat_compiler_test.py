@@ -0,0 +1,109 @@
+# ruff: noqa: PGH004
+# ruff: noqa
+
+from __future__ import annotations
+
+import functools
+import math
+
+from hypothesis import given
+from .strategies import nats
+
+from inductive import config
+from inductive import nat
+from inductive.nat import Succ
+from inductive.nat import Zero
+
+
+def setup_module():
+    config.setup()
+
+
+def teardown_module():
+    config.teardown()
+
+
+@nat.compile
+def is_odd(n: nat.Nat) -> bool:
+    """
+    Rocq-style parity.
+    """
+
+    match n:
+        case Zero():
+            return False
+        case Succ(m):
+            return not is_odd(m)
+
+
+@nat.compile
+def add(n: nat.Nat, k: nat.Nat) -> nat.Nat:
+    match n:
+        case nat.Zero():
+            return k
+        case nat.Succ(predecessor=m):
+            return Succ(add(m, k))
+
+
+@nat.compile
+def factorial(n: nat.Nat) -> int:
+    match n:
+        case Zero():
+            return 1
+        case Succ(m):
+            return int(n) * factorial(m)
+
+
+@nat.compile
+def fibonacci_like(n: nat.Nat) -> int:
+    match n:
+        case Zero():
+            return 0
+        case Succ(m):
+            return fibonacci_like(m) + fibonacci_like(m)
+
+
+# ∀n k : Nat, compiled functions compute the same as their definitions
+@given(nats, nats)
+def test_compile_same_results(n: nat.Nat, k: nat.Nat) -> None:
+    assert is_odd(n) == n.is_odd()
+    assert add(n, k) == n + k
+    assert factorial(n) == math.factorial(int(n))
+
+
+# compiled functions keep the metadata of the original ones
+def test_compile_metadata() -> None:
+    assert is_odd.__name__ == "is_odd"
+    assert "parity" in is_odd.__doc__
+    assert is_odd.__annotations__ == {"n": "nat.Nat", "return": "bool"}
+
+
+# compiled functions do not depend on the recursion limit
+def test_compile_deep() -> None:
+    assert is_odd(nat.from_builtin_int_packed_exn(1_000_001))
+    assert int(add(nat.from_builtin_int_packed_exn(100_000), nat.one)) == 100_001
+
+
+# functions that are not structurally recursive are left as is
+def test_compile_fallback() -> None:
+    assert not hasattr(fibonacci_like, "__wrapped__")
+    assert nat.compile(len) is len
+
+    cached = functools.cache(is_odd.__wrapped__)
+    assert nat.compile(cached) is cached
+
+    @nat.compile
+    def local(n: nat.Nat) -> bool:
+        match n:
+            case Zero():
+                return True
+            case Succ(m):
+                return local(m)
+
+    assert not hasattr(local, "__wrapped__")
+    assert local(nat.three)
+
+
+# values that are not numbers are handled by the original function
+def test_compile_not_nat() -> None:
+    assert is_odd("three") is None
@@ -0,0 +1,134 @@
+# ruff: noqa: PGH004
+# ruff: noqa
+
+from __future__ import annotations
+
+import math
+import threading
+
+from hypothesis import given
+from hypothesis import strategies
+import option
+
+from inductive import nat
+from inductive.nat import primes
+
+
+def naive_is_prime(k: int) -> bool:
+    return k >= 2 and all(k % d != 0 for d in range(2, math.isqrt(k) + 1))
+
+
+# ∀k : int, is_prime(k) == naive_is_prime(k)
+@given(strategies.integers(0, 100_000))
+def test_is_prime(k: int) -> None:
+    assert primes.is_prime(nat.from_builtin_int_packed_exn(k)) == naive_is_prime(k)
+
+
+# is_prime works on unary numbers too
+def test_is_prime_unary() -> None:
+    expected = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+
+    assert [k for k in range(30) if primes.is_prime(nat.by_ramp(k))] == expected
+
+
+# is_prime works beyond the bound of the sieve
+def test_is_prime_large() -> None:
+    mersenne = 2**89 - 1
+
+    assert primes.is_prime(nat.from_builtin_int_packed_exn(mersenne))
+    assert not primes.is_prime(nat.from_builtin_int_packed_exn(mersenne * 3))
+    # the smallest strong pseudoprime to the bases 2, 3, 5 and 7
+    assert not primes.is_prime(nat.from_builtin_int_packed_exn(3_215_031_751))
+
+
+# ∀k : int, k > 0 -> product(factorize(k)) == k
+@given(strategies.integers(1, 10**12))
+def test_factorize_product(k: int) -> None:
+    factors = primes.factorize(nat.from_builtin_int_packed_exn(k)).unwrap()
+
+    assert math.prod(int(p) ** int(e) for p, e in factors) == k
+    assert all(primes.is_prime(p) for p, _ in factors)
+    assert [int(p) for p, _ in factors] == sorted({int(p) for p, _ in factors})
+
+
+# factorize splits products of primes above the bound of the sieve
+def test_factorize_large() -> None:
+    p, q = 1_000_000_007, 998_244_353
+    factors = primes.factorize(nat.from_builtin_int_packed_exn(p * p * q)).unwrap()
+
+    assert [(int(f), int(e)) for f, e in factors] == [(q, 1), (p, 2)]
+
+
+# 0 has no factorization nor finite divisors
+def test_zero() -> None:
+    assert primes.factorize(nat.zero) == option.Nothing()
+    assert primes.divisors(nat.zero) == option.Nothing()
+    assert primes.totient(nat.zero) == nat.zero
+    assert primes.factorize(nat.one) == option.Some([])
+
+
+# ∀k : int, k > 0 -> divisors(k) == [d | d divides k]
+@given(strategies.integers(1, 2_000))
+def test_divisors(k: int) -> None:
+    expected = [d for d in range(1, k + 1) if k % d == 0]
+
+    assert [
+        int(d) for d in primes.divisors(nat.from_builtin_int_packed_exn(k)).unwrap()
+    ] == expected
+
+
+# ∀k : int, k > 0 -> totient(k) == #{d ≤ k | gcd(d, k) = 1}
+@given(strategies.integers(1, 2_000))
+def test_totient(k: int) -> None:
+    expected = sum(1 for d in range(1, k + 1) if math.gcd(d, k) == 1)
+
+    assert int(primes.totient(nat.from_builtin_int_packed_exn(k))) == expected
+
+
+# a smaller sieve gives the same answers
+def test_set_cache_limit() -> None:
+    primes.set_cache_limit(nat.from_builtin_int_packed_exn(100))
+
+    try:
+        assert [
+            k
+            for k in range(1_000)
+            if primes.is_prime(nat.from_builtin_int_packed_exn(k))
+        ] == [k for k in range(1_000) if naive_is_prime(k)]
+        assert (
+            int(primes.totient(nat.from_builtin_int_packed_exn(1_009 * 1_013)))
+            == 1_008 * 1_012
+        )
+    finally:
+        primes.set_cache_limit(
+            nat.from_builtin_int_packed_exn(primes.DEFAULT_CACHE_LIMIT)
+        )
+
+
+# the sieve can be extended by several threads at once
+def test_is_prime_threads() -> None:
+    # start from an empty sieve
+    primes.set_cache_limit(nat.from_builtin_int_packed_exn(4))
+    primes.set_cache_limit(nat.from_builtin_int_packed_exn(primes.DEFAULT_CACHE_LIMIT))
+    steps = (1, 3, 1, 7)
+    results: dict[int, list[int]] = {}
+
+    def work(index: int) -> None:
+        results[index] = [
+            k
+            for k in range(0, 50_000, steps[index])
+            if primes.is_prime(nat.from_builtin_int_packed_exn(k))
+        ]
+
+    threads = [
+        threading.Thread(target=work, args=(index,)) for index in range(len(steps))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for index, step in enumerate(steps):
+        assert results[index] == [
+            k for k in range(0, 50_000, step) if naive_is_prime(k)
+        ]
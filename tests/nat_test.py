@@ -6,11 +6,24 @@
 
 from __future__ import annotations
 
+import fractions
+import io
+import math
+import numbers
+import operator
+import pickle
+import sys
+import threading
+
 from hypothesis import given
+from hypothesis.strategies import integers
+from hypothesis.strategies import lists
 import option
-from .strategies import nats, nonzero_nats
+from .strategies import nats, nonzero_nats, small_nats
 
+from inductive import compare
 from inductive import config
+from inductive import memory
 from inductive import nat
 
 
@@ -212,19 +225,19 @@ def test_mul_identity_right(n: nat.Nat) -> None:
 
 
 # ∀n m : Nat, n * m == m * n
-@given(nats, nats)
+@given(small_nats, small_nats)
 def test_mul_commutativity(n: nat.Nat, m: nat.Nat) -> None:
     assert n * m == m * n
 
 
 # ∀n m p : Nat, (n * m) * p == n * (m * p)
-@given(nats, nats, nats)
+@given(small_nats, small_nats, small_nats)
 def test_mul_associativity(n: nat.Nat, m: nat.Nat, p: nat.Nat) -> None:
     assert (n * m) * p == n * (m * p)
 
 
 # ∀n m p : Nat, n * (m + p) == n * m + n * p
-@given(nats, nats, nats)
+@given(small_nats, small_nats, small_nats)
 def test_mul_add_distributivity_left(
     n: nat.Nat,
     m: nat.Nat,
@@ -234,7 +247,7 @@ def test_mul_add_distributivity_left(
 
 
 # ∀n m p : Nat, (n + m) * p == n * p + m * p
-@given(nats, nats, nats)
+@given(small_nats, small_nats, small_nats)
 def test_mul_add_distributivity_right(
     n: nat.Nat,
     m: nat.Nat,
@@ -244,7 +257,7 @@ def test_mul_add_distributivity_right(
 
 
 # ∀n m p : Nat, n * (m - p) == n * m - n * p
-@given(nats, nats, nats)
+@given(small_nats, small_nats, small_nats)
 def test_mul_sub_distributivity_left(
     n: nat.Nat,
     m: nat.Nat,
@@ -254,7 +267,7 @@ def test_mul_sub_distributivity_left(
 
 
 # ∀n m p : Nat, (n - m) * p == n * p - m * p
-@given(nats, nats, nats)
+@given(small_nats, small_nats, small_nats)
 def test_mul_sub_distributivity_right(
     n: nat.Nat,
     m: nat.Nat,
@@ -435,6 +448,14 @@ def test_float_order_preservation(n: nat.Nat, m: nat.Nat) -> None:
     assert (n < m) == (float(n) < float(m))
 
 
+# float and complex do not recurse
+def test_float_deep() -> None:
+    n = nat.from_builtin_int_exn(100_000)
+
+    assert float(n) == 100_000.0
+    assert complex(n) == 100_000 + 0j
+
+
 # int(0) == 0
 def test_int_zero() -> None:
     assert int(nat.zero) == 0
@@ -557,7 +578,7 @@ def test_square_one() -> None:
 
 
 # ∀n : Nat, n > 1 -> n.square() > n
-@given(nats.filter(lambda n: n > nat.one))
+@given(small_nats.filter(lambda n: n > nat.one))
 def test_square_nonzero(n: nat.Nat) -> None:
     assert n.square() > n
 
@@ -593,3 +614,750 @@ def test_as_integer_ratio_zero() -> None:
 @given(nonzero_nats)
 def test_as_integer_ratio_nonzero(n: nat.Nat) -> None:
     assert n.as_integer_ratio() == (int(n), 1)
+
+
+# *- Conversion to built-in types -* #
+
+
+# ∀n : Nat, to_builtin_int(n) == int(n)
+@given(nats)
+def test_to_builtin_int_int(n: nat.Nat) -> None:
+    assert nat.to_builtin_int(n) == int(n)
+
+
+# *- Bulk operations -* #
+
+
+# ∀l : list Nat, sort(l) == sorted(l)
+@given(lists(nats))
+def test_sort_sorted(elements: list[nat.Nat]) -> None:
+    assert nat.sort(elements) == sorted(elements, key=int)
+
+
+# ∀l : list Nat, sort(l, reverse=True) == sorted(l, reverse=True)
+@given(lists(nats))
+def test_sort_reverse_sorted(elements: list[nat.Nat]) -> None:
+    assert nat.sort(elements, reverse=True) == sorted(
+        elements,
+        key=int,
+        reverse=True,
+    )
+
+
+# ∀l : list (Nat * int), sort(l, key=fst) is stable
+@given(lists(nats))
+def test_sort_key_stable(elements: list[nat.Nat]) -> None:
+    pairs = list(zip(elements, range(len(elements))))
+
+    assert nat.sort(pairs, key=lambda pair: pair[0]) == sorted(
+        pairs,
+        key=lambda pair: int(pair[0]),
+    )
+
+
+# ∀l : list int, sort(map(P, l)) == sorted(map(P, l)), however large the values
+@given(lists(integers(0, 10**15)))
+def test_sort_large_packed(values: list[int]) -> None:
+    elements = [nat.from_builtin_int_packed_exn(value) for value in values]
+    pairs = list(zip(elements, range(len(elements))))
+
+    assert nat.sort(elements) == sorted(elements, key=int)
+    assert nat.sort(elements, reverse=True) == sorted(elements, key=int, reverse=True)
+    assert nat.sort(pairs, key=lambda pair: pair[0]) == sorted(
+        pairs,
+        key=lambda pair: int(pair[0]),
+    )
+
+
+# min_of([]) == max_of([]) == Nothing()
+def test_extrema_empty() -> None:
+    assert nat.min_of([]) == option.Nothing()
+    assert nat.max_of([]) == option.Nothing()
+    assert nat.argmin([]) == option.Nothing()
+    assert nat.argmax([]) == option.Nothing()
+
+
+# ∀l : list Nat, l != [] -> min_of(l) == Some(l[argmin(l)]) == Some(min(l))
+@given(lists(nats, min_size=1))
+def test_min_of_argmin(elements: list[nat.Nat]) -> None:
+    minimum = min(elements, key=int)
+
+    assert nat.min_of(elements) == option.Some(minimum)
+    assert nat.argmin(elements) == nat.from_builtin_int(elements.index(minimum))
+
+
+# ∀l : list Nat, l != [] -> max_of(l) == Some(l[argmax(l)]) == Some(max(l))
+@given(lists(nats, min_size=1))
+def test_max_of_argmax(elements: list[nat.Nat]) -> None:
+    maximum = max(elements, key=int)
+
+    assert nat.max_of(elements) == option.Some(maximum)
+    assert nat.argmax(elements) == nat.from_builtin_int(elements.index(maximum))
+
+
+# *- Iteration -* #
+
+
+# ∀n m p : Nat, p != 0 -> list(range(n, m, p)) == range(int(n), int(m), int(p))
+@given(nats, nats, nonzero_nats)
+def test_range_builtin_range(n: nat.Nat, m: nat.Nat, p: nat.Nat) -> None:
+    expected = range(int(n), int(m), int(p))
+    nat_range = nat.range(n, m, p)
+
+    assert [int(element) for element in nat_range] == list(expected)
+    assert len(nat_range) == len(expected)
+    assert nat_range.length() == nat.from_builtin_int_exn(len(expected))
+
+
+# ∀n : Nat, list(range(n)) == [0, ..., n - 1]
+@given(nats)
+def test_range_stop(n: nat.Nat) -> None:
+    assert [int(element) for element in nat.range(n)] == list(range(int(n)))
+
+
+# ∀n m p q : Nat, p != 0 -> q ∈ range(n, m, p) <-> int(q) ∈ range(...)
+@given(nats, nats, nonzero_nats, nats)
+def test_range_contains(n: nat.Nat, m: nat.Nat, p: nat.Nat, q: nat.Nat) -> None:
+    expected = int(q) in range(int(n), int(m), int(p))
+
+    assert (q in nat.range(n, m, p)) == expected
+
+
+# range(n, m, 0) raises ValueError
+def test_range_zero_step() -> None:
+    try:
+        nat.range(nat.zero, nat.one, nat.zero)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError
+
+
+# ∀n m : Nat, take(count(n, m), 5) == [n, n + m, ..., n + 4m]
+@given(nats, nats)
+def test_count_iter(n: nat.Nat, m: nat.Nat) -> None:
+    iterator = iter(nat.count(n, m))
+    elements = [next(iterator) for _ in range(5)]
+
+    assert [int(element) for element in elements] == [
+        int(n) + index * int(m) for index in range(5)
+    ]
+
+
+# large steps do not build their Succ nodes one by one
+def test_range_count_large_step() -> None:
+    step = nat.from_builtin_int_packed_exn(10**6)
+    elements = list(nat.range(nat.zero, nat.from_builtin_int_packed_exn(10**7), step))
+    iterator = iter(nat.count(nat.one, step))
+
+    assert [int(element) for element in elements] == list(range(0, 10**7, 10**6))
+    assert [int(next(iterator)) for _ in range(3)] == [1, 10**6 + 1, 2 * 10**6 + 1]
+    assert int(elements[-1].predecessor) == 10**7 - 10**6 - 1
+
+
+# ∀n m p : Nat, p ∈ count(n, m) <-> ∃k, p == n + k * m
+@given(nats, nats, nats)
+def test_count_contains(n: nat.Nat, m: nat.Nat, p: nat.Nat) -> None:
+    start, step, value = int(n), int(m), int(p)
+    expected = (
+        value == start
+        if step == 0
+        else (value >= start and (value - start) % step == 0)
+    )
+
+    assert (p in nat.count(n, m)) == expected
+
+
+# ∀l : list, ∀n : Nat, enumerate(l, n) == builtin enumerate(l, int(n))
+@given(lists(nats), nats)
+def test_enumerate_builtin_enumerate(elements: list[nat.Nat], n: nat.Nat) -> None:
+    enumeration = nat.enumerate(elements, n)
+
+    assert [(int(index), element) for index, element in enumeration] == list(
+        enumerate(elements, int(n))
+    )
+    assert enumeration.length() == nat.length_of(elements)
+
+
+# *- Recursion principles -* #
+
+
+# ∀n m : Nat, fold(n, m, succ) == m + n
+@given(nats, nats)
+def test_fold_succ_add(n: nat.Nat, m: nat.Nat) -> None:
+    assert nat.fold(n, m, nat.succ) == m + n
+
+
+# ∀n : Nat, rec(n, [], λp l. l + [p]) == list(range(n))
+@given(nats)
+def test_rec_predecessors(n: nat.Nat) -> None:
+    result = nat.rec(n, [], lambda predecessor, acc: [*acc, predecessor])
+
+    assert result == list(nat.range(n))
+
+
+# ∀n : Nat, fold_many(n, f, g) == (fold(n, *f), fold(n, *g))
+@given(nats)
+def test_fold_many_fold(n: nat.Nat) -> None:
+    doubling = (nat.zero, lambda m: nat.succ(nat.succ(m)))
+    parity = (True, lambda even: not even)
+
+    assert nat.fold_many(n, doubling, parity) == (
+        nat.fold(n, *doubling),
+        nat.fold(n, *parity),
+    )
+
+
+# fold does not depend on the recursion limit
+def test_fold_deep() -> None:
+    n = nat.from_builtin_int_exn(100_000)
+
+    assert n.is_even()
+    assert nat.rec(n, 0, lambda _, acc: acc + 1) == 100_000
+
+
+# *- Compact representation -* #
+
+
+# ∀n : Nat, pack(n) == n
+@given(nats)
+def test_pack_equal(n: nat.Nat) -> None:
+    assert nat.pack(n) == n
+    assert n == nat.pack(n)
+    assert hash(nat.pack(n)) == hash(n)
+
+
+# ∀n : Nat, str(pack(n)) == str(n)
+@given(nats)
+def test_pack_repr(n: nat.Nat) -> None:
+    assert repr(nat.pack(n)) == (f"Packed({int(n)})" if n else "Zero")
+    assert str(nat.pack(n)) == str(n)
+    assert bytes(nat.pack(n)) == bytes(n)
+
+
+def test_pack_repr_large() -> None:
+    n = nat.from_builtin_int_packed(10**30).unwrap()
+
+    assert repr(n) == f"Packed({10**30})"
+    assert repr(nat.parse("1" + "0" * 30).unwrap()) == f"Packed({10**30})"
+
+
+# ∀n : Nat, n != 0 -> pack(n) matches Succ(pred(n))
+@given(nonzero_nats)
+def test_pack_match_succ(n: nat.Nat) -> None:
+    match nat.pack(n):
+        case nat.Zero():
+            raise AssertionError
+        case nat.Succ(m):
+            assert m == nat.pred(n)
+
+
+# pack(0) matches Zero()
+def test_pack_match_zero() -> None:
+    match nat.pack(nat.zero):
+        case nat.Zero():
+            pass
+        case nat.Succ():
+            raise AssertionError
+
+
+# ∀n m : Nat, packed arithmetic agrees with unary arithmetic
+@given(small_nats, small_nats)
+def test_pack_arithmetic(n: nat.Nat, m: nat.Nat) -> None:
+    for left, right in [
+        (nat.pack(n), nat.pack(m)),
+        (nat.pack(n), m),
+        (n, nat.pack(m)),
+    ]:
+        assert left + right == n + m
+        assert left - right == n - m
+        assert left * right == n * m
+        assert divmod(left, right) == divmod(n, m)
+        assert left / right == n / m
+        assert left // right == n // m
+        assert left % right == n % m
+
+
+# ∀n m : Nat, packed comparisons agree with unary comparisons
+@given(nats, nats)
+def test_pack_comparison(n: nat.Nat, m: nat.Nat) -> None:
+    for left, right in [
+        (nat.pack(n), nat.pack(m)),
+        (nat.pack(n), m),
+        (n, nat.pack(m)),
+    ]:
+        assert (left < right) == (n < m)
+        assert (left <= right) == (n <= m)
+        assert (left > right) == (n > m)
+        assert (left >= right) == (n >= m)
+        assert (left == right) == (n == m)
+        assert left.compare(right) == n.compare(m)
+
+
+# ∀n : Nat, packed methods agree with unary methods
+@given(small_nats)
+def test_pack_methods(n: nat.Nat) -> None:
+    packed = nat.pack(n)
+
+    assert int(packed) == int(n)
+    assert packed.double() == n.double()
+    assert packed.square() == n.square()
+    assert packed.is_odd() == n.is_odd()
+    assert packed.is_even() == n.is_even()
+    assert packed.as_integer_ratio() == n.as_integer_ratio()
+
+
+# ∀n : Nat, unpack(pack(n)) == n
+@given(nats)
+def test_unpack_pack(n: nat.Nat) -> None:
+    assert nat.unpack(nat.pack(n)) == n
+
+
+# from_builtin_int_packed(-1) == Nothing()
+def test_from_builtin_int_packed_negative() -> None:
+    assert nat.from_builtin_int_packed(-1) == option.Nothing()
+
+
+# *- Parsing -* #
+
+
+# ∀n : Nat, parse(str(n)) == Some(n)
+@given(nats)
+def test_parse_str(n: nat.Nat) -> None:
+    assert nat.parse(str(n)) == option.Some(n)
+    assert nat.parse(str(n).encode()) == option.Some(n)
+
+
+# ∀k : int, k < 0 -> parse(str(k)) == Nothing()
+@given(integers(max_value=-1))
+def test_parse_negative(k: int) -> None:
+    assert nat.parse(str(k)) == option.Nothing()
+
+
+# ∀k : int, parse(digits(k)) == Some(k), beyond the digit limit of int
+@given(integers(0, 20_000), integers(0, 9))
+def test_parse_long(length: int, digit: int) -> None:
+    text = str(digit) * length + "1"
+
+    match nat.parse(text):
+        case option.Some(n):
+            assert "".join(nat.decimal_chunks(n)) == text.lstrip("0")
+        case option.Nothing():
+            assert False
+
+    assert list(nat.parse_many(text + " " + text)) == [nat.parse(text)] * 2
+
+
+# parse rejects anything but ASCII digits
+def test_parse_invalid() -> None:
+    for text in ["", "+1", " 1", "1_000", "1.0", "²", "١"]:
+        assert nat.parse(text) == option.Nothing()
+
+
+# ∀l : list Nat, parse_many(join(l)) == l, whatever the chunk size
+@given(lists(nats), integers(1, 8))
+def test_parse_many(elements: list[nat.Nat], chunk_size: int) -> None:
+    text = ",".join(str(n) for n in elements) + "\n"
+    expected = [option.Some(n) for n in elements]
+
+    assert list(nat.parse_many(text, ",")) == expected
+    stream = io.StringIO(text)
+    data = io.BytesIO(text.replace(",", " ").encode())
+
+    assert list(nat.parse_many(stream, ",", chunk_size=chunk_size)) == expected
+    assert list(nat.parse_many(data, chunk_size=chunk_size)) == expected
+
+
+# parse_many_exn raises on invalid numbers
+def test_parse_many_exn_invalid() -> None:
+    try:
+        list(nat.parse_many_exn("1 2 -3"))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError
+
+
+# *- Operator cache -* #
+
+
+# the cache is disabled by default
+def test_operator_cache_disabled() -> None:
+    assert nat.operator_cache_info() == option.Nothing()
+
+
+# the cache adds no frame to the recursion when disabled
+def test_operator_cache_disabled_depth() -> None:
+    n = nat.zero
+
+    for _ in range(30_000):
+        n = nat.Succ(n)
+
+    assert n.compare(n) == compare.EQUAL
+    assert int(n + nat.by_ramp(3)) == 30_003
+
+
+# ∀n m : Nat, cached results are the uncached ones
+@given(small_nats, small_nats)
+def test_operator_cache_results(n: nat.Nat, m: nat.Nat) -> None:
+    expected = (n + m, n * m, divmod(n, m), n // m, n % m, n.compare(m))
+
+    with nat.operator_cache():
+        for _ in range(2):
+            assert (n + m, n * m, divmod(n, m), n // m, n % m, n.compare(m)) == expected
+
+
+# repeated operations on the same operands are hits
+def test_operator_cache_hits() -> None:
+    n, m = nat.by_ramp(5), nat.by_ramp(3)
+
+    with nat.operator_cache(16):
+        first = n * m
+        assert n * m is first
+        assert (n // m, n % m) == (nat.one, nat.by_ramp(2))
+        info = nat.operator_cache_info().unwrap()
+
+    # `n // m` and `n % m` share the `divmod` entry
+    assert (info.hits, info.misses, info.size) == (2, 2, 2)
+    assert nat.operator_cache_info() == option.Nothing()
+
+
+# the least recently used entry is evicted first
+def test_operator_cache_lru() -> None:
+    a, b, c = nat.by_ramp(1), nat.by_ramp(2), nat.by_ramp(3)
+
+    with nat.operator_cache(2):
+        a + b
+        a + c
+        a + b
+        b + c
+        a + b
+        a + c
+        info = nat.operator_cache_info().unwrap()
+
+    assert (info.hits, info.misses, info.size, info.capacity) == (2, 4, 2, 2)
+
+
+# the capacity must be positive
+def test_operator_cache_capacity() -> None:
+    try:
+        nat.enable_operator_cache(0)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError
+
+
+# *- Zero -* #
+
+
+# Zero is a singleton
+def test_zero_singleton() -> None:
+    assert nat.Zero() is nat.zero
+    assert nat.one.predecessor is nat.zero
+
+
+# *- Integral protocol -* #
+
+
+# ∀n : Nat, operator.index(n) == int(n)
+@given(nats)
+def test_index(n: nat.Nat) -> None:
+    assert operator.index(n) == int(n)
+    assert len(list(range(n))) == int(n)
+    assert ([None] * (int(n) + 1))[n] is None
+
+
+# ∀n : Nat, round(n) == trunc(n) == floor(n) == ceil(n) == n
+@given(nats)
+def test_rounding(n: nat.Nat) -> None:
+    assert round(n) == math.trunc(n) == math.floor(n) == math.ceil(n) == n
+
+
+# ∀n : Nat, ∀k : int, round(n, k) == round(int(n), k)
+@given(nats, integers(-3, 3))
+def test_round_ndigits(n: nat.Nat, ndigits: int) -> None:
+    assert int(round(n, ndigits)) == round(int(n), ndigits)
+
+
+def test_round_ndigits_half() -> None:
+    assert round(nat.by_ramp(15), -1) == nat.by_ramp(20)
+    assert round(nat.by_ramp(5), -1) == nat.zero
+
+
+# Nat is registered as an integral number
+def test_integral() -> None:
+    assert isinstance(nat.zero, numbers.Integral)
+    assert isinstance(nat.one, numbers.Integral)
+    assert isinstance(nat.from_builtin_int_packed_exn(3), numbers.Integral)
+
+
+# ∀n : Nat, Fraction(n) == int(n)
+@given(nats)
+def test_fraction(n: nat.Nat) -> None:
+    assert fractions.Fraction(n) == int(n)
+    assert (n.numerator, n.denominator, n.real, n.imag) == (int(n), 1, int(n), 0)
+    assert n.conjugate() is n
+
+
+# conversion does not depend on the recursion limit
+def test_int_deep() -> None:
+    n = nat.from_builtin_int_exn(100_000)
+
+    assert int(n) == 100_000
+    assert n == nat.from_builtin_int_packed_exn(100_000)
+    assert hash(n) == hash(100_000)
+
+
+# the operator cache can be shared by several threads
+def test_operator_cache_threads() -> None:
+    operands = [(nat.by_ramp(k), nat.by_ramp(k % 7 + 1)) for k in range(1, 21)]
+    expected = [(n * m, n // m) for n, m in operands]
+    results: list[bool] = []
+
+    def work() -> None:
+        for _ in range(20):
+            results.append([(n * m, n // m) for n, m in operands] == expected)
+
+    with nat.operator_cache(8):
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        info = nat.operator_cache_info().unwrap()
+
+    assert all(results)
+    assert info.hits + info.misses == 4 * 20 * 2 * len(operands)
+    assert info.size <= 8
+
+
+# *- Decimal output -* #
+
+
+# ∀n : Nat, join(decimal_chunks(n)) == str(n), whatever the chunk size
+@given(nats, integers(1, 5))
+def test_decimal_chunks(n: nat.Nat, chunk_size: int) -> None:
+    chunks = list(nat.decimal_chunks(n, chunk_size))
+
+    assert "".join(chunks) == str(n)
+    assert all(len(chunk) == chunk_size for chunk in chunks[1:])
+
+
+# chunks can be longer than the limit of `str` on `int`
+def test_decimal_chunks_large_size() -> None:
+    n = nat.from_builtin_int_packed_exn(10**5000 + 7)
+    chunks = list(nat.decimal_chunks(n, chunk_size=10_000))
+
+    assert chunks == ["1" + "0" * 4999 + "7"]
+    assert "".join(nat.decimal_chunks(n, chunk_size=3_000)) == chunks[0]
+
+
+# ∀k : int, k >= 0 -> write_decimal(k) writes str(k), even beyond the str limit
+@given(integers(0, 10**40))
+def test_write_decimal(k: int) -> None:
+    for value in (k, k * 10**5000 + k):
+        file = io.StringIO()
+        nat.write_decimal(nat.from_builtin_int_packed_exn(value), file, chunk_size=7)
+
+        with_limit = sys.get_int_max_str_digits()
+        sys.set_int_max_str_digits(0)
+        try:
+            assert file.getvalue() == str(value)
+        finally:
+            sys.set_int_max_str_digits(with_limit)
+
+
+# *- Collections -* #
+
+
+# ∀l : list Nat, NatSet(l) behaves like set(l)
+@given(lists(nats), lists(nats))
+def test_nat_set(first: list[nat.Nat], second: list[nat.Nat]) -> None:
+    expected_first = {int(n) for n in first}
+    expected_second = {int(n) for n in second}
+    left, right = nat.NatSet(first), nat.NatSet(second)
+
+    assert [int(n) for n in left] == sorted(expected_first)
+    assert len(left) == len(expected_first)
+    assert all(n in left for n in first)
+    assert {int(n) for n in left | right} == expected_first | expected_second
+    assert {int(n) for n in left & right} == expected_first & expected_second
+    assert {int(n) for n in left - right} == expected_first - expected_second
+    assert {int(n) for n in left ^ right} == expected_first ^ expected_second
+    assert left.isdisjoint(right) == expected_first.isdisjoint(expected_second)
+    assert (left == right) == (expected_first == expected_second)
+
+
+# ∀l : list int, NatSet(map(P, l)) behaves like set(l), however far apart the values
+@given(
+    lists(integers(0, 2_000) | integers(0, 10**15)),
+    lists(integers(0, 2_000) | integers(0, 10**15)),
+    lists(integers(0, 2_000)),
+)
+def test_nat_set_sparse(
+    first: list[int], second: list[int], removed: list[int]
+) -> None:
+    left = nat.NatSet(map(nat.from_builtin_int_packed_exn, first))
+    right = nat.NatSet(map(nat.from_builtin_int_packed_exn, second))
+    expected_first, expected_second = set(first), set(second)
+
+    for value in removed + second[:1]:
+        left.discard(nat.from_builtin_int_packed_exn(value))
+        expected_first.discard(value)
+
+    assert [int(n) for n in left] == sorted(expected_first)
+    assert len(left) == len(expected_first)
+    assert {int(n) for n in left | right} == expected_first | expected_second
+    assert {int(n) for n in left & right} == expected_first & expected_second
+    assert {int(n) for n in left - right} == expected_first - expected_second
+    assert {int(n) for n in left ^ right} == expected_first ^ expected_second
+    assert len(left ^ right) == len(expected_first ^ expected_second)
+    assert left.isdisjoint(right) == expected_first.isdisjoint(expected_second)
+    assert (left == right) == (expected_first == expected_second)
+    assert left == nat.NatSet(
+        map(nat.from_builtin_int_packed_exn, sorted(expected_first, reverse=True))
+    )
+    assert int(left.rank(nat.from_builtin_int_packed_exn(10**9))) == sum(
+        1 for value in expected_first if value < 10**9
+    )
+
+
+# ∀s : NatSet, ∀n : Nat, rank(s, n) == #{m ∈ s | m < n}
+@given(lists(nats), nats)
+def test_nat_set_rank(elements: list[nat.Nat], n: nat.Nat) -> None:
+    s = nat.NatSet(elements)
+
+    assert s.rank(n) == nat.from_builtin_int_packed_exn(sum(1 for m in s if m < n))
+
+
+# NatSet supports the in-place operations of mutable sets
+def test_nat_set_mutable() -> None:
+    s = nat.NatSet([nat.one, nat.three])
+    s.add(nat.two)
+    s.discard(nat.one)
+    s.discard(nat.ten)
+    assert list(s) == [nat.two, nat.three]
+
+    s |= nat.NatSet([nat.zero])
+    s -= {nat.three}
+    assert list(s) == [nat.zero, nat.two]
+    assert s.pop() == nat.zero
+    assert "x" not in s
+    assert repr(s) == "NatSet({2})"
+
+
+# ∀l : list (Nat × int), NatMap(l) behaves like dict(l)
+@given(lists(integers(0, 1_000)), lists(integers(0, 1_000)))
+def test_nat_map(keys: list[int], removed: list[int]) -> None:
+    expected = {key: str(key) for key in keys}
+    mapping = nat.NatMap(
+        (nat.from_builtin_int_packed_exn(key), str(key)) for key in keys
+    )
+
+    for key in removed:
+        if key in expected:
+            del expected[key]
+            del mapping[
+                nat.by_ramp(key) if key < 20 else nat.from_builtin_int_packed_exn(key)
+            ]
+
+    assert [(int(key), value) for key, value in mapping.items()] == sorted(
+        expected.items()
+    )
+    assert len(mapping) == len(expected)
+    assert all(
+        mapping[nat.from_builtin_int_packed_exn(key)] == value
+        for key, value in expected.items()
+    )
+
+
+# missing keys raise KeyError, far keys do not grow the array
+def test_nat_map_missing() -> None:
+    mapping: nat.NatMap[str] = nat.NatMap({nat.one: "one"})
+    far = nat.from_builtin_int_packed_exn(10**12)
+    mapping[far] = "far"
+
+    assert mapping.get(nat.two) is None
+    assert mapping[far] == "far"
+    assert list(mapping) == [nat.one, far]
+    assert "x" not in mapping
+    try:
+        del mapping[nat.zero]
+    except KeyError:
+        pass
+    else:
+        raise AssertionError
+
+
+# *- Run-length representation -* #
+
+
+# ∀n : Nat, compress(n) is observably n
+@given(nats)
+def test_compress_equal(n: nat.Nat) -> None:
+    compressed = nat.compress(n)
+
+    assert compressed == n
+    assert str(compressed) == str(n)
+    assert bytes(compressed) == bytes(n)
+    assert hash(compressed) == hash(n)
+    assert pickle.loads(pickle.dumps(compressed)) == n
+
+
+def test_run_repr() -> None:
+    layers = nat.from_builtin_int_packed_exn(10**30)
+
+    assert repr(nat.lift(nat.zero, layers)) == f"Run({10**30}, Zero)"
+    assert repr(nat.lift(nat.by_ramp(2), nat.by_ramp(3))) == "Run(3, Succ(Succ(Zero)))"
+
+
+# ∀n : Nat, n != 0 -> match compress(n) with Succ(m) -> m == pred(n)
+@given(nonzero_nats)
+def test_compress_match_succ(n: nat.Nat) -> None:
+    match nat.compress(n):
+        case nat.Succ(m):
+            assert m == nat.pred(n)
+        case _:
+            raise AssertionError
+
+
+# ∀n m : Nat, arithmetic on runs is arithmetic on n and m
+@given(small_nats, small_nats)
+def test_compress_arithmetic(n: nat.Nat, m: nat.Nat) -> None:
+    for left, right in [
+        (nat.compress(n), m),
+        (n, nat.compress(m)),
+        (nat.compress(n), nat.compress(m)),
+        (nat.compress(n), nat.pack(m)),
+    ]:
+        assert left + right == n + m
+        assert left - right == n - m
+        assert left * right == n * m
+        assert divmod(left, right) == divmod(n, m)
+        assert left / right == n / m
+        assert left // right == n // m
+        assert left % right == n % m
+        assert (left < right, left <= right, left > right, left >= right) == (
+            n < m,
+            n <= m,
+            n > m,
+            n >= m,
+        )
+        assert left.compare(right) == n.compare(m)
+
+
+# ∀n m : Nat, lift(n, m) == n + m
+@given(nats, nats)
+def test_lift(n: nat.Nat, m: nat.Nat) -> None:
+    assert nat.lift(n, m) == n + m
+
+
+# runs are combined instead of unfolded
+def test_run_large() -> None:
+    billion = nat.lift(nat.zero, nat.from_builtin_int_packed_exn(10**9))
+    total = billion + billion + nat.three
+
+    assert int(total) == 2 * 10**9 + 3
+    assert int(total - billion) == 10**9 + 3
+    assert memory.footprint(total).nodes < 20
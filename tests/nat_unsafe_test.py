@@ -0,0 +1,47 @@
+# ruff: noqa: PGH004
+# ruff: noqa
+
+from __future__ import annotations
+
+from hypothesis import given
+from hypothesis import strategies
+import option
+from .strategies import nats, nonzero_nats
+
+from inductive import config
+from inductive import nat
+from inductive.nat import unsafe
+
+
+def setup_module():
+    config.setup()
+
+
+def teardown_module():
+    config.teardown()
+
+
+# ∀k : int, k >= 0 -> Some(from_int_unchecked(k)) == from_builtin_int(k)
+@given(strategies.integers(0, 100))
+def test_from_int_unchecked(k: int) -> None:
+    assert option.Some(unsafe.from_int_unchecked(k)) == nat.from_builtin_int(k)
+    assert option.Some(unsafe.from_int_packed_unchecked(k)) == nat.from_builtin_int(k)
+
+
+# ∀n m : Nat, m != 0 -> Some(divmod_nonzero(n, m)) == divmod(n, m)
+@given(nats, nonzero_nats)
+def test_divmod_nonzero(n: nat.Nat, m: nat.Nat) -> None:
+    expected = divmod(n, m)
+
+    assert option.Some(unsafe.divmod_nonzero(n, m)) == expected
+    assert option.Some(unsafe.divmod_nonzero(nat.pack(n), m)) == expected
+    assert option.Some(unsafe.divmod_nonzero(n, nat.pack(m))) == expected
+    assert option.Some(unsafe.divmod_nonzero(nat.compress(n), m)) == expected
+    assert option.Some(unsafe.divmod_nonzero(n, nat.compress(m))) == expected
+
+
+# ∀n m : Nat, m != 0 -> div_nonzero(n, m) == n // m, mod_nonzero(n, m) == n % m
+@given(nats, nonzero_nats)
+def test_div_mod_nonzero(n: nat.Nat, m: nat.Nat) -> None:
+    assert unsafe.div_nonzero(n, m) == n // m
+    assert unsafe.mod_nonzero(n, m) == n % m
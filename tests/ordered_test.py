@@ -0,0 +1,192 @@
+# ruff: noqa: PGH004
+# ruff: noqa
+
+from __future__ import annotations
+
+from hypothesis import given
+from hypothesis import strategies
+import option
+
+from inductive import compare
+from inductive import nat
+from inductive import ordered
+
+
+small_nats = strategies.integers(0, 50).map(nat.from_builtin_int_exn)
+
+
+def reverse(left: nat.Nat, right: nat.Nat) -> compare.Compare:
+    return right.compare(left)
+
+
+# *- OrderedMap -* #
+
+
+# ∀l : list Nat, list(map(l)) == sorted(set(l))
+@given(strategies.lists(small_nats))
+def test_ordered_map_iterates_sorted(elements: list[nat.Nat]) -> None:
+    mapping = ordered.OrderedMap()
+
+    for element in elements:
+        mapping = mapping.insert(element, int(element))
+
+    expected = sorted(set(elements), key=int)
+
+    assert list(mapping) == expected
+    assert list(mapping.values()) == [int(element) for element in expected]
+    assert len(mapping) == len(expected)
+    assert mapping.length() == nat.length_of(expected)
+
+
+# ∀l : list Nat, ∀n ∈ l, get(n) == Some(n)
+@given(strategies.lists(small_nats))
+def test_ordered_map_get(elements: list[nat.Nat]) -> None:
+    mapping = ordered.OrderedMap()
+
+    for element in elements:
+        mapping = mapping.insert(element, element)
+
+    for element in elements:
+        assert mapping.get(element) == option.Some(element)
+
+
+# ∀l : list Nat, ∀n ∈ l, n ∉ remove(n)
+@given(strategies.lists(small_nats), strategies.lists(small_nats))
+def test_ordered_map_remove(
+    elements: list[nat.Nat],
+    removed: list[nat.Nat],
+) -> None:
+    mapping = ordered.OrderedMap()
+
+    for element in elements:
+        mapping = mapping.insert(element, None)
+
+    original = mapping
+
+    for element in removed:
+        mapping = mapping.remove(element)
+
+    assert list(mapping) == sorted(set(elements) - set(removed), key=int)
+    assert list(original) == sorted(set(elements), key=int)
+
+
+# remove(empty, n) is empty
+def test_ordered_map_remove_missing() -> None:
+    mapping = ordered.OrderedMap().insert(nat.one, None)
+
+    assert mapping.remove(nat.two) is mapping
+
+
+# ∀l : list Nat, range(start, stop) == [n ∈ l | start <= n < stop]
+@given(strategies.lists(small_nats), small_nats, small_nats)
+def test_ordered_map_range(
+    elements: list[nat.Nat],
+    start: nat.Nat,
+    stop: nat.Nat,
+) -> None:
+    mapping = ordered.OrderedMap()
+
+    for element in elements:
+        mapping = mapping.insert(element, None)
+
+    keys = [key for key, _ in mapping.range(option.Some(start), option.Some(stop))]
+
+    assert keys == sorted(
+        {element for element in elements if start <= element < stop},
+        key=int,
+    )
+
+
+# minimum/maximum of an empty map are Nothing
+def test_ordered_map_extrema_empty() -> None:
+    assert ordered.OrderedMap().minimum() == option.Nothing()
+    assert ordered.OrderedMap().maximum() == option.Nothing()
+
+
+# the comparator decides the order
+@given(strategies.lists(small_nats, min_size=1))
+def test_ordered_map_comparator(elements: list[nat.Nat]) -> None:
+    mapping = ordered.OrderedMap(reverse)
+
+    for element in elements:
+        mapping = mapping.insert(element, None)
+
+    assert list(mapping) == sorted(set(elements), key=int, reverse=True)
+    assert mapping.minimum() == option.Some((max(elements, key=int), None))
+
+
+# *- OrderedSet -* #
+
+
+# ∀l : list Nat, list(set(l)) == sorted(set(l))
+@given(strategies.lists(small_nats))
+def test_ordered_set(elements: list[nat.Nat]) -> None:
+    elements_set = ordered.OrderedSet()
+
+    for element in elements:
+        elements_set = elements_set.add(element)
+
+    assert list(elements_set) == sorted(set(elements), key=int)
+    assert all(element in elements_set for element in elements)
+
+    for element in elements:
+        elements_set = elements_set.remove(element)
+
+    assert len(elements_set) == 0
+    assert elements_set.length() == nat.zero
+
+
+# ∀l : list Nat, set(l) == set(reversed(l)), whatever the shape of the trees
+@given(strategies.lists(small_nats))
+def test_ordered_equality(elements: list[nat.Nat]) -> None:
+    forward = ordered.OrderedSet()
+    backward = ordered.OrderedSet()
+
+    for element in elements:
+        forward = forward.add(nat.pack(element))
+
+    for element in reversed(elements):
+        backward = backward.add(element)
+
+    assert forward == backward
+    assert forward._map == backward._map
+    assert (forward.add(nat.succ(max(elements, default=nat.zero))) == backward) is False
+
+
+# *- PairingHeap -* #
+
+
+# ∀l : list Nat, drain(heap(l)) == sorted(l)
+@given(strategies.lists(small_nats))
+def test_pairing_heap_drain(elements: list[nat.Nat]) -> None:
+    heap = ordered.PairingHeap()
+
+    for element in elements:
+        heap = heap.push(element)
+
+    assert heap.length() == nat.length_of(elements)
+    assert list(heap.drain()) == sorted(elements, key=int)
+
+
+# ∀l m : list Nat, drain(merge(heap(l), heap(m))) == sorted(l + m)
+@given(strategies.lists(small_nats), strategies.lists(small_nats))
+def test_pairing_heap_merge(left: list[nat.Nat], right: list[nat.Nat]) -> None:
+    left_heap = ordered.PairingHeap()
+    right_heap = ordered.PairingHeap()
+
+    for element in left:
+        left_heap = left_heap.push(element)
+
+    for element in right:
+        right_heap = right_heap.push(element)
+
+    merged = left_heap.merge(right_heap)
+
+    assert len(merged) == len(left) + len(right)
+    assert list(merged.drain()) == sorted(left + right, key=int)
+
+
+# pop(empty) == Nothing
+def test_pairing_heap_pop_empty() -> None:
+    assert ordered.PairingHeap().pop() == option.Nothing()
+    assert ordered.PairingHeap().peek() == option.Nothing()
@@ -0,0 +1,31 @@
+# ruff: noqa: PGH004
+# ruff: noqa
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+
+def run(code: str) -> None:
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+# importing inductive does not import its submodules
+def test_import_is_lazy() -> None:
+    run(
+        "import sys, inductive\n"
+        "assert 'inductive.nat' not in sys.modules\n"
+        "assert 'inductive.config' not in sys.modules\n"
+    )
+
+
+# submodules and re-exports are loaded on first access
+def test_lazy_attributes() -> None:
+    run(
+        "import inductive\n"
+        "assert inductive.nat.zero == inductive.nat.Zero()\n"
+        "assert inductive.setup is inductive.config.setup\n"
+        "assert 'ordered' in dir(inductive)\n"
+        "from inductive import *\n"
+    )
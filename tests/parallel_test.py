@@ -0,0 +1,71 @@
+# ruff: noqa: PGH004
+# ruff: noqa
+
+from __future__ import annotations
+
+import pathlib
+
+import pytest
+
+from inductive import nat
+from inductive import parallel
+
+
+def square(n: nat.Nat) -> nat.Nat:
+    return n.square()
+
+
+def add(n: nat.Nat, m: nat.Nat) -> nat.Nat:
+    return n + m
+
+
+def fail_on_zero(n: nat.Nat) -> nat.Nat:
+    if n == nat.zero:
+        raise ValueError
+
+    return n
+
+
+# map(f, l) == [f(n) for n in l]
+def test_map() -> None:
+    numbers = [nat.from_builtin_int_exn(value) for value in range(50)]
+
+    results = parallel.map(square, numbers, max_workers=2, chunksize=7)
+
+    assert [int(n) for n in results] == [value**2 for value in range(50)]
+
+
+# map(f, l, m) == [f(n, m) for n, m in zip(l, m)]
+def test_map_many() -> None:
+    left = [nat.from_builtin_int_exn(value) for value in range(20)]
+    right = [nat.from_builtin_int_packed_exn(value**3) for value in range(30)]
+
+    assert parallel.map(add, left, right, max_workers=2) == [
+        n + m for n, m in zip(left, right)
+    ]
+
+
+# starmap(f, []) == []
+def test_starmap_empty() -> None:
+    assert parallel.starmap(add, []) == []
+
+
+# big numbers do not go through the recursion limit
+def test_map_big() -> None:
+    n = nat.from_builtin_int_exn(100_000)
+
+    assert parallel.map(square, [n], max_workers=1) == [
+        nat.from_builtin_int_packed_exn(100_000**2)
+    ]
+
+
+# a failing chunk leaves no shared memory behind
+@pytest.mark.skipif(not pathlib.Path("/dev/shm").is_dir(), reason="no /dev/shm")
+def test_map_failure() -> None:
+    numbers = [nat.from_builtin_int_exn(value) for value in range(20)]
+    before = set(pathlib.Path("/dev/shm").iterdir())
+
+    with pytest.raises(ValueError):
+        parallel.map(fail_on_zero, numbers, max_workers=2, chunksize=2)
+
+    assert set(pathlib.Path("/dev/shm").iterdir()) <= before
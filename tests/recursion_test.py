@@ -0,0 +1,121 @@
+# ruff: noqa: PGH004
+# ruff: noqa
+
+from __future__ import annotations
+
+import threading
+
+from hypothesis import given
+from .strategies import nats
+
+from inductive import nat
+from inductive import recursion
+
+
+@recursion.trampoline
+def length(n: nat.Nat):
+    match n:
+        case nat.Zero():
+            return 0
+        case nat.Succ(m):
+            return 1 + (yield length(m))
+
+
+@recursion.trampoline
+def is_even(n: nat.Nat):
+    match n:
+        case nat.Zero():
+            return True
+        case nat.Succ(m):
+            return (yield is_odd(m))
+
+
+@recursion.trampoline
+def is_odd(n: nat.Nat):
+    match n:
+        case nat.Zero():
+            return False
+        case nat.Succ(m):
+            return (yield is_even(m))
+
+
+@recursion.trampoline
+def checked_pred(n: nat.Nat):
+    match n:
+        case nat.Zero():
+            raise ValueError("zero")
+        case nat.Succ(m):
+            return m
+    yield
+
+
+@recursion.trampoline
+def safe_pred(n: nat.Nat):
+    try:
+        return (yield checked_pred(n))
+    except ValueError:
+        return nat.zero
+
+
+# ∀n : Nat, length(n) == int(n)
+@given(nats)
+def test_length(n: nat.Nat) -> None:
+    assert length(n) == int(n)
+
+
+# ∀n : Nat, is_even(n) == n.is_even() and is_odd(n) == n.is_odd()
+@given(nats)
+def test_mutual_recursion(n: nat.Nat) -> None:
+    assert is_even(n) == n.is_even()
+    assert is_odd(n) == n.is_odd()
+
+
+# deep recursion does not depend on the recursion limit
+def test_deep() -> None:
+    n = nat.from_builtin_int_exn(200_000)
+
+    assert length(n) == 200_000
+    assert is_even(n)
+
+
+# exceptions propagate to the caller, which can catch them
+def test_exceptions() -> None:
+    assert safe_pred(nat.zero) == nat.zero
+    assert safe_pred(nat.two) == nat.one
+
+    try:
+        checked_pred(nat.zero)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError
+
+
+# yielding anything but a call raises a TypeError in the function
+def test_yield_not_call() -> None:
+    @recursion.trampoline
+    def wrong():
+        yield 1
+
+    try:
+        wrong()
+    except TypeError:
+        pass
+    else:
+        raise AssertionError
+
+
+# trampolines on different threads are independent
+def test_threads() -> None:
+    results: list[int] = []
+    n = nat.from_builtin_int_exn(20_000)
+
+    threads = [
+        threading.Thread(target=lambda: results.append(length(n))) for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [20_000] * 4
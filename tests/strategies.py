@@ -1,21 +1,15 @@
 # noqa: D100, I002
-from hypothesis import strategies
+from inductive import testing
 
-from inductive import nat
+zeros = testing.zeros()
+succs = testing.succs
 
-zeros = strategies.builds(nat.Zero)
+nats = testing.sized_nats((16, 256))
 
+nonzero_nats = testing.sized_nats((16, 256), min_value=1)
 
-def succs[N: nat.Nat](  # noqa: D103
-    strategy: strategies.SearchStrategy[N],
-) -> strategies.SearchStrategy[nat.Succ[N]]:
-    return strategies.builds(nat.Succ[N], strategy)
-
-
-nats: strategies.SearchStrategy[nat.Nat] = strategies.recursive(
-    zeros,
-    extend=succs,
-    max_leaves=10_000,
-)
-
-nonzero_nats = nats.filter(lambda n: n != nat.zero)
+# Products of unary numbers grow quadratically, and go through the
+# recursive unary operators, whose depth is bounded by the C stack
+# regardless of the recursion limit - hence the small buckets of the
+# properties that multiply.
+small_nats = testing.sized_nats((3, 7))
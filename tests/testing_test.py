@@ -0,0 +1,47 @@
+# ruff: noqa: PGH004
+# ruff: noqa
+
+from __future__ import annotations
+
+from hypothesis import given
+import pytest
+
+from inductive import nat
+from inductive import testing
+
+
+# nats(min, max) stays within its bounds
+@given(testing.nats(3, 40))
+def test_nats_bounds(n: nat.Nat) -> None:
+    assert 3 <= nat.to_builtin_int(n) <= 40
+
+
+# nonzero_nats never generates zero
+@given(testing.nonzero_nats(10))
+def test_nonzero_nats(n: nat.Nat) -> None:
+    assert n != nat.zero
+
+
+# sized_nats stays within its buckets, and packed ones are packed
+@given(testing.sized_nats((10, 10**6), min_value=2, packed=True))
+def test_sized_nats_packed(n: nat.Nat) -> None:
+    assert isinstance(n, nat.Packed)
+    assert 2 <= int(n) <= 10**6
+
+
+# succs generates successors
+@given(testing.succs(testing.zeros()))
+def test_succs_zeros(n: nat.Nat) -> None:
+    assert n == nat.one
+
+
+# min_value applies to every bucket
+@given(testing.sized_nats((3, 7), min_value=5))
+def test_sized_nats_min_value(n: nat.Nat) -> None:
+    assert 5 <= nat.to_builtin_int(n) <= 7
+
+
+# min_value above the last bucket is an error
+def test_sized_nats_empty() -> None:
+    with pytest.raises(ValueError):
+        testing.sized_nats((3, 7), min_value=8)
@@ -0,0 +1,91 @@
+# ruff: noqa: PGH004
+# ruff: noqa
+
+from __future__ import annotations
+
+from hypothesis import given
+from hypothesis import strategies
+import option
+
+from inductive import nat
+from inductive.fin import Fin
+from inductive.vector import Vector
+
+
+elements = strategies.lists(strategies.integers())
+
+
+# ∀l : list, length(from_iterable(l)) == length_of(l)
+@given(elements)
+def test_length(values: list[int]) -> None:
+    vector = Vector.from_iterable(values)
+
+    assert vector.length() == nat.length_of(values)
+    assert len(vector) == len(values)
+    assert list(vector) == values
+
+
+# length(empty) == 0
+def test_empty() -> None:
+    assert Vector.empty().length() == nat.zero
+
+
+# ∀l : list, ∀i : int, index(i) == Some(l[i]) if i < len(l) else Nothing
+@given(elements, strategies.integers(0, 20))
+def test_index(values: list[int], position: int) -> None:
+    vector = Vector.from_iterable(values)
+    expected = (
+        option.Some(values[position]) if position < len(values) else option.Nothing()
+    )
+
+    assert vector.index(nat.from_builtin_int_exn(position)) == expected
+
+
+# ∀l : list, ∀f : Fin(len(l)), vector[f] == l[f]
+@given(elements.filter(bool), strategies.integers(0))
+def test_getitem_fin(values: list[int], position: int) -> None:
+    vector = Vector.from_iterable(values)
+
+    match Fin.wrap(nat.from_builtin_int_packed_exn(position), vector.length()):
+        case option.Nothing():
+            raise AssertionError
+        case option.Some(index):
+            assert vector[index] == values[position % len(values)]
+
+
+# ∀l : list, ∀x, append(l, x) == l + [x]
+@given(elements, strategies.integers())
+def test_append(values: list[int], value: int) -> None:
+    vector = Vector.from_iterable(values).append(value)
+
+    assert list(vector) == [*values, value]
+    assert vector.length() == nat.Succ(nat.length_of(values))
+
+
+# ∀l m : list, concat(l, m) == l + m
+@given(elements, elements)
+def test_concat(left: list[int], right: list[int]) -> None:
+    vector = Vector.from_iterable(left).concat(Vector.from_iterable(right))
+
+    assert list(vector) == left + right
+    assert vector.length() == nat.length_of(left) + nat.length_of(right)
+
+
+# ∀l : list, zip(l, map(f, l)) == [(x, f(x)) for x in l]
+@given(elements)
+def test_zip_map(values: list[int]) -> None:
+    vector = Vector.from_iterable(values)
+
+    assert list(vector.zip(vector.map(str))) == [
+        (value, str(value)) for value in values
+    ]
+
+
+# zip of vectors of different lengths raises ValueError
+def test_zip_different_lengths() -> None:
+    try:
+        Vector.from_iterable([1]).zip(Vector.empty())
+    except ValueError:
+        pass
+    else:
+        raise AssertionError